@@ -1,15 +1,40 @@
 import os
 import json
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
 import uvicorn
-from fastapi import FastAPI, HTTPException
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from urllib.parse import urlencode
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Optional
 
+from backend.jobs import submit_job, get_job, get_job_result, JobQueueFull
+from backend.frame_cache import read_frame, cache_stats
+from backend.data_processor.fetcher_utils import partition_files, read_partitioned, read_schema
 from backend.pipeline.orchestrator import run_full_pipeline, run_comparison_pipeline
-from backend.trading_strategy.registry import STRATEGIES
+from backend.pipeline.monte_carlo import monte_carlo_returns
+from backend.trading_strategy.registry import STRATEGIES, get_strategy
 
 app = FastAPI(title="Trading Engine API", version="1.0")
 
+# Fixed seed so repeated requests report the same confidence intervals
+MC_SEED = 0
+
+# Columnar responses (see /api/v1/gold/*)
+ARROW_MEDIA_TYPE   = "application/vnd.apache.arrow.stream"
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+TRADE_COLUMNS = ["Entry_Date", "Exit_Date", "Trading_Days", "Calendar_Days", "Return"]
+
+# Stored results (see /api/v1/results/*)
+EQUITY_COLUMNS = ["Position", "Strategy_Return", "Asset_Equity", "Strategy_Equity", "Drawdown"]
+TRADES_PAGE_SIZE = 100
+TRADES_MAX_PAGE_SIZE = 1000
+
 # ==========================================
 # REQUEST MODELS (What the UI sends)
 # ==========================================
@@ -29,93 +54,404 @@ class CompareRequest(BaseModel):
 # ==========================================
 # SINGLE STRATEGY (What the API does)
 # ==========================================
-@app.post("/api/v1/backtest")
+@app.post("/api/v1/backtest", status_code=202)
 def trigger_backtest(request: BacktestRequest):
+    """
+    Queues the full pipeline for one strategy. Returns a job id right away;
+    poll /api/v1/jobs/{job_id} and fetch /api/v1/jobs/{job_id}/result.
+    """
     ticker = request.ticker.upper()
-
     try:
-        # Update the data lake and Execute backtest
-        result_df = run_full_pipeline(
-            ticker        = ticker,
-            strategy_name = request.strategy,
-            interval      = request.interval,
-            start_date    = request.start_date,
-            end_date      = request.end_date
-        )
-
-        if result_df is None or result_df.empty:
-            raise HTTPException(status_code=400, detail=f"Backtest returned no data for {ticker}.")
-        
-        # Read JSON metrics we just created
-        metrics_path = f"../../data/gold/{ticker}/{request.interval}/{request.strategy}/{request.strategy}_metrics.json"
-
-        if not os.path.exists(metrics_path):
-             raise HTTPException(status_code=500, detail="Engine succeeded, but metrics JSON was not found on disk.")
-        
-        with open(metrics_path, "r") as f:
-            summary_metrics = json.load(f)
-
-        return {
-            "status": "success",
-            "message": f"Backtest pipeline completed successfully for {ticker}.",
-            "data_files": {
-                "dataset": f"../../data/gold/{ticker}/{request.interval}/{request.strategy}/{request.strategy}_dataset.parquet",
-                "trades": f"../../data/gold/{ticker}/{request.interval}/{request.strategy}/{request.strategy}_trades.parquet",
-                "metrics_json": f"../../data/gold/{ticker}/{request.interval}/{request.strategy}/{request.strategy}_metrics.json"
-            },
-            "summary": summary_metrics  # The UI will use this to build the scorecard!
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    
+        get_strategy(request.strategy)  # Reject unknown names now, not minutes later
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    params = {"ticker": ticker, "strategy": request.strategy, "interval": request.interval,
+              "start_date": request.start_date, "end_date": request.end_date}
+    return _submit("backtest", lambda: build_backtest_payload(**params), params)
+
+
+def build_backtest_payload(ticker, strategy, interval, start_date, end_date) -> dict:
+    """Runs bronze -> silver -> gold for one strategy and builds the response payload."""
+    # Update the data lake and Execute backtest
+    result_df = run_full_pipeline(
+        ticker        = ticker,
+        strategy_name = strategy,
+        interval      = interval,
+        start_date    = start_date,
+        end_date      = end_date,
+        reader        = read_frame,   # Silver served from the in-process frame cache
+    )
+
+    if result_df is None or result_df.empty:
+        raise ValueError(f"Backtest returned no data for {ticker}.")
+
+    # Read JSON metrics we just created
+    metrics_path = f"{_gold_dir(ticker, interval, strategy)}/{strategy}_metrics.json"
+
+    if not os.path.exists(metrics_path):
+        raise RuntimeError("Engine succeeded, but metrics JSON was not found on disk.")
+
+    with open(metrics_path, "r") as f:
+        summary_metrics = json.load(f)
+
+    return {
+        "status": "success",
+        "message": f"Backtest pipeline completed successfully for {ticker}.",
+        "data_files": _gold_urls(ticker, interval, strategy),  # Arrow / parquet download URLs
+        "summary": summary_metrics,  # The UI will use this to build the scorecard!
+        "monte_carlo": monte_carlo_returns(result_df['Strategy_Return'], seed=MC_SEED),
+    }
+
 # ==========================================
 # ALL STRATEGIES  —  /api/v1/compare
 # ==========================================
- 
-@app.post("/api/v1/compare")
+
+@app.post("/api/v1/compare", status_code=202)
 def trigger_comparison(request: CompareRequest):
     """
-    Runs the full pipeline once (bronze + silver), then backtests every
-    registered strategy. Returns per-strategy metrics and file paths.
+    Queues the comparison pipeline: bronze + silver once, then every registered
+    strategy. Returns a job id right away; the job result holds per-strategy
+    metrics, Monte Carlo confidence intervals and file paths.
     """
-    ticker = request.ticker.upper()
-    try:
-        _, summaries = run_comparison_pipeline(
-            ticker     = ticker,
-            interval   = request.interval,
-            start_date = request.start_date,
-            end_date   = request.end_date,
-        )
- 
-        if not summaries:
-            raise HTTPException(status_code=400, detail=f"No strategies produced results for {ticker}.")
- 
-        # Build file path map and load each metrics JSON
-        strategies_out = {}
-        for strategy_name in summaries:
-            gold_dir = f"../../data/gold/{ticker}/{request.interval}/{strategy_name}"
-            strategies_out[strategy_name] = {
-                "summary": summaries[strategy_name],
-                "data_files": {
-                    "dataset": f"{gold_dir}/{strategy_name}_dataset.parquet",
-                    "trades":  f"{gold_dir}/{strategy_name}_trades.parquet",
-                    "metrics": f"{gold_dir}/{strategy_name}_metrics.json",
-                },
-            }
- 
-        return {
-            "status":     "success",
-            "ticker":     ticker,
-            "strategies": strategies_out,            # keyed by strategy name
-            "available":  list(STRATEGIES.keys()),   # lets the UI know what exists
+    params = {"ticker": request.ticker.upper(), "interval": request.interval,
+              "start_date": request.start_date, "end_date": request.end_date}
+    return _submit("compare", lambda: build_comparison_payload(**params), params)
+
+
+def build_comparison_payload(ticker, interval, start_date, end_date) -> dict:
+    """Runs the comparison pipeline and builds the response payload."""
+    results, summaries = run_comparison_pipeline(
+        ticker     = ticker,
+        interval   = interval,
+        start_date = start_date,
+        end_date   = end_date,
+        reader     = read_frame,
+    )
+
+    if not summaries:
+        raise ValueError(f"No strategies produced results for {ticker}.")
+
+    # Summaries, confidence intervals and download URLs per strategy
+    strategies_out = {}
+    for strategy_name in summaries:
+        strategies_out[strategy_name] = {
+            "summary": summaries[strategy_name],
+            "monte_carlo": monte_carlo_returns(results[strategy_name]['Strategy_Return'], seed=MC_SEED),
+            "data_files": _gold_urls(ticker, interval, strategy_name),
         }
- 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+
+    return {
+        "status":     "success",
+        "ticker":     ticker,
+        "strategies": strategies_out,            # keyed by strategy name
+        "available":  list(STRATEGIES.keys()),   # lets the UI know what exists
+    }
+
+# ==========================================
+# JOBS  —  /api/v1/jobs
+# ==========================================
+
+@app.get("/api/v1/jobs/{job_id}")
+def job_status(job_id: str):
+    """Status of a submitted job: queued / running / succeeded / failed (with error)."""
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job '{job_id}'.")
+    return job
+
+
+@app.get("/api/v1/jobs/{job_id}/result")
+def job_result(job_id: str):
+    """
+    Result payload of a finished job. 202 with the job status while it is still
+    queued or running; 500 with the error if it failed.
+    """
+    job, result = get_job_result(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job '{job_id}'.")
+    if job["status"] == "failed":
+        raise HTTPException(status_code=500, detail=job["error"])
+    if job["status"] != "succeeded":
+        return JSONResponse(status_code=202, content=job)
+    return result
+
+# ==========================================
+# GOLD DATA  —  /api/v1/gold (Arrow IPC / parquet)
+# ==========================================
+# Gold time series and trade ledgers go out as columnar bytes instead of JSON
+# or file paths, so clients don't need to share the server's filesystem.
+# Decode with pyarrow.ipc.open_stream(body).read_pandas() (format=arrow, the
+# default) or pandas.read_parquet(io.BytesIO(body)) (format=parquet).
+# Tickers are query parameters because some contain '/' (e.g. BTC/USD).
+
+@app.get("/api/v1/gold/dataset")
+def gold_dataset(request: Request, ticker: str, strategy: str, interval: str = "daily",
+                 columns: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None,
+                 fmt: str = Query("arrow", alias="format")):
+    """
+    Gold time series of one strategy run, with a 'Date' column.
+
+    columns: comma-separated projection ('Date' is always included; names the
+             dataset doesn't have are skipped). start / end: inclusive date range.
+    """
+    start, end = _parse_date_range(start, end)
+    paths = _gold_paths(ticker, interval, strategy)
+    validators = _validators([paths["dataset"]])
+    if _not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
+
+    df = _read_dataset(paths["dataset"], columns, start, end)
+    return _columnar_response(df, fmt, validators)
+
+
+@app.get("/api/v1/gold/trades")
+def gold_trades(request: Request, ticker: str, strategy: str, interval: str = "daily",
+                columns: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None,
+                fmt: str = Query("arrow", alias="format")):
+    """
+    Trade ledger of one strategy run (empty if it took no trades).
+    start / end select trades by Entry_Date (inclusive).
+    """
+    start, end = _parse_date_range(start, end)
+    paths = _gold_paths(ticker, interval, strategy)
+    validators = _validators([paths["dataset"], paths["trades"]])
+    if _not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
+
+    return _columnar_response(_read_trades(paths["trades"], columns, start, end), fmt, validators)
+
+# ==========================================
+# STORED RESULTS  —  /api/v1/results (read-only)
+# ==========================================
+# Serve what the last pipeline run left in gold: no fetch, no recompute. Every
+# response carries an ETag and Last-Modified derived from the gold files'
+# mtime and size; a client revalidating with If-None-Match / If-Modified-Since
+# gets an empty 304 until the next pipeline run rewrites those files.
+
+@app.get("/api/v1/results")
+def list_results(ticker: str, interval: str = "daily"):
+    """Strategies with stored gold results for a ticker."""
+    ticker_dir = _gold_dir(ticker.upper(), interval)
+    stored = sorted(
+        name for name in (os.listdir(ticker_dir) if os.path.isdir(ticker_dir) else [])
+        if os.path.exists(f"{ticker_dir}/{name}/{name}_metrics.json")
+    )
+    return {"ticker": ticker.upper(), "interval": interval, "strategies": stored}
+
+
+@app.get("/api/v1/results/metrics")
+def stored_metrics(request: Request, ticker: str, strategy: str, interval: str = "daily"):
+    """The metrics JSON of the last run (the 'summary' of a backtest result)."""
+    paths = _gold_paths(ticker, interval, strategy)
+    if not os.path.exists(paths["metrics"]):
+        raise HTTPException(status_code=404, detail=f"No stored metrics for {ticker.upper()} / {interval} / {strategy}.")
+    validators = _validators([paths["metrics"]])
+    if _not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
+
+    with open(paths["metrics"], "r") as f:
+        return JSONResponse(content=json.load(f), headers=validators)
+
+
+@app.get("/api/v1/results/equity")
+def stored_equity(request: Request, ticker: str, strategy: str, interval: str = "daily",
+                  columns: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None,
+                  fmt: str = Query("json", alias="format")):
+    """
+    Equity series of the last run, one record per date.
+
+    columns: comma-separated projection, default EQUITY_COLUMNS. start / end:
+             inclusive date range. format: json (records), arrow or parquet.
+    """
+    start, end = _parse_date_range(start, end)
+    paths = _gold_paths(ticker, interval, strategy)
+    validators = _validators([paths["dataset"]])
+    if _not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
+
+    df = _read_dataset(paths["dataset"], columns or ",".join(EQUITY_COLUMNS), start, end)
+    if fmt != "json":
+        return _columnar_response(df, fmt, validators)
+    return Response(content=df.to_json(orient="records", date_format="iso"),
+                    media_type="application/json", headers=validators)
+
+
+@app.get("/api/v1/results/trades")
+def stored_trades(request: Request, ticker: str, strategy: str, interval: str = "daily",
+                  columns: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None,
+                  offset: int = Query(0, ge=0), limit: int = Query(TRADES_PAGE_SIZE, ge=1, le=TRADES_MAX_PAGE_SIZE)):
+    """
+    One page of the last run's trade ledger, in entry order.
+    start / end select trades by Entry_Date (inclusive); total counts them all.
+    """
+    start, end = _parse_date_range(start, end)
+    paths = _gold_paths(ticker, interval, strategy)
+    validators = _validators([paths["dataset"], paths["trades"]])
+    if _not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
+
+    trades_df = _read_trades(paths["trades"], columns, start, end)
+    page = trades_df.iloc[offset:offset + limit]
+    body = {
+        "total":  len(trades_df),
+        "offset": offset,
+        "limit":  limit,
+        "trades": json.loads(page.to_json(orient="records", date_format="iso")),
+    }
+    return JSONResponse(content=body, headers=validators)
+
+# ==========================================
+# CACHE  —  /api/v1/cache/stats
+# ==========================================
+
+@app.get("/api/v1/cache/stats")
+def frame_cache_stats():
+    """Decoded-frame cache counters (hits, misses, evictions, bytes) for sizing FRAME_CACHE_MAX_BYTES."""
+    return cache_stats()
+
+# ==========================================
+# PRIVATE: Job submission, gold reads, columnar encoding, conditional requests
+# ==========================================
+
+def _submit(kind, fn, params):
+    try:
+        job_id = submit_job(kind, fn, params)
+    except JobQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return {
+        "job_id":     job_id,
+        "status":     "queued",
+        "status_url": f"/api/v1/jobs/{job_id}",
+        "result_url": f"/api/v1/jobs/{job_id}/result",
+    }
+
+def _gold_dir(ticker, interval, strategy=None):
+    """Gold directory of a run, or of a (ticker, interval) when strategy is None."""
+    values = (ticker, interval) if strategy is None else (ticker, interval, strategy)
+    if any(part in ("", ".", "..") for value in values for part in value.split("/")):
+        raise HTTPException(status_code=400, detail="Invalid ticker, interval or strategy.")
+    gold_dir = f"../../data/gold/{ticker}/{interval}"
+    return gold_dir if strategy is None else f"{gold_dir}/{strategy}"
+
+
+def _gold_paths(ticker, interval, strategy):
+    """Gold file paths of one stored run; 404 if the run was never written."""
+    gold_dir = _gold_dir(ticker.upper(), interval, strategy)
+    paths = {
+        "dataset": f"{gold_dir}/{strategy}_dataset.parquet",
+        "trades":  f"{gold_dir}/{strategy}_trades.parquet",
+        "metrics": f"{gold_dir}/{strategy}_metrics.json",
+    }
+    if not os.path.exists(paths["dataset"]):
+        raise HTTPException(status_code=404, detail=f"No gold results for {ticker.upper()} / {interval} / {strategy}.")
+    return paths
+
+
+def _read_dataset(dataset_path, columns, start, end):
+    """Gold time series slice with a 'Date' column, through the frame cache."""
+    df = read_frame(dataset_path, start_date=start, end_date=end,
+                    columns=_select_columns(columns, read_schema(dataset_path).names))
+    return df.reset_index()
+
+
+def _read_trades(trades_path, columns, start, end):
+    """Trade ledger slice by Entry_Date; an empty ledger when the run took no trades."""
+    available = read_schema(trades_path).names if os.path.exists(trades_path) else TRADE_COLUMNS
+    selected = _select_columns(columns, available, always=None)
+    selected = available if selected is None else selected
+
+    entry_filter = None
+    if start:
+        entry_filter = ds.field('Entry_Date') >= pd.to_datetime(start)
+    if end:
+        end_filter = ds.field('Entry_Date') <= pd.to_datetime(end)
+        entry_filter = end_filter if entry_filter is None else entry_filter & end_filter
+
+    trades_df = read_partitioned(trades_path, columns=selected, filter=entry_filter)
+    return pd.DataFrame(columns=selected) if trades_df.empty else trades_df
+
+
+def _parse_date_range(start, end):
+    """Request start / end dates -> Timestamps (None when absent); 400 if unparseable or reversed."""
+    parsed = []
+    for name, value in (("start", start), ("end", end)):
+        if not value:
+            parsed.append(None)
+            continue
+        try:
+            timestamp = pd.Timestamp(value)
+        except (ValueError, TypeError):
+            timestamp = pd.NaT
+        if pd.isna(timestamp):
+            raise HTTPException(status_code=400, detail=f"Invalid {name} date '{value}'. Use YYYY-MM-DD.")
+        parsed.append(timestamp)
+    if None not in parsed and parsed[0] > parsed[1]:
+        raise HTTPException(status_code=400, detail=f"start ({start}) is after end ({end}).")
+    return tuple(parsed)
+
+
+def _gold_urls(ticker, interval, strategy):
+    query = urlencode({"ticker": ticker, "interval": interval, "strategy": strategy})
+    return {
+        "dataset": f"/api/v1/gold/dataset?{query}",
+        "trades":  f"/api/v1/gold/trades?{query}",
+        "metrics": f"/api/v1/results/metrics?{query}",
+    }
+
+
+def _select_columns(columns, available, always="Date"):
+    """Comma-separated request -> columns the table has (plus `always`), or None for all."""
+    if not columns:
+        return None
+    requested = [col.strip() for col in columns.split(",") if col.strip()]
+    selected = [col for col in requested if col in available and col != always]
+    return ([always] if always else []) + selected
+
+
+def _columnar_response(df, fmt, headers=None):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    if fmt == "arrow":
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        media_type = ARROW_MEDIA_TYPE
+    elif fmt == "parquet":
+        pq.write_table(table, sink)
+        media_type = PARQUET_MEDIA_TYPE
+    else:
+        raise HTTPException(status_code=400, detail=f"Unknown format '{fmt}'. Available: ['arrow', 'parquet']")
+    return Response(content=sink.getvalue().to_pybytes(), media_type=media_type, headers=headers)
+
+
+def _validators(paths):
+    """ETag / Last-Modified headers from the mtime and size of the files behind a response."""
+    stats = [(file_path, os.stat(file_path)) for path in paths for file_path in partition_files(path)]
+    signature = ";".join(f"{file_path}:{stat.st_mtime_ns}:{stat.st_size}" for file_path, stat in stats)
+    return {
+        "ETag": f'W/"{hashlib.sha1(signature.encode()).hexdigest()}"',
+        "Last-Modified": formatdate(max(stat.st_mtime for _, stat in stats), usegmt=True),
+        "Cache-Control": "no-cache",   # Cacheable, but revalidate every time
+    }
+
+
+def _not_modified(request, validators):
+    """True if the client's cached copy is current (If-None-Match wins over If-Modified-Since)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return validators["ETag"] in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*"
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        return parsedate_to_datetime(validators["Last-Modified"]) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
 
 # ==========================================
 # EXECUTION
 # ==========================================
 if __name__ == "__main__":
     print("🚀 Starting Trading Engine API on http://0.0.0.0:8000")
-    uvicorn.run("api:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run("api:app", host="0.0.0.0", port=8000, reload=True)
@@ -14,7 +14,7 @@ def run_trading_engine(ticker, strategy_name="baseline", interval="daily", start
     
     try:
         # Run the full pipeline and get backtest results
-        result_df = run_full_pipeline(ticker, strategy_name=strategy_name, interval=interval, start_date=start_date, end_date=end_date)
+        result_df = run_full_pipeline(ticker, strategy_name=strategy_name, interval=interval, start_date=start_date, end_date=end_date, verbose=True)
         
         if result_df is not None and not result_df.empty:
             plot_montage(result_df, ticker)
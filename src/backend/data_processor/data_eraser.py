@@ -1,4 +1,5 @@
 import os
+import shutil
 
 def erase_data(ticker, interval="daily", stage="all"):
     """
@@ -44,12 +45,16 @@ def erase_data(ticker, interval="daily", stage="all"):
             else:
                 print(f"[SKIP] No gold directory found for {ticker} at: {stage_dir}")
                 
-        # bronze & silver TIERS: Delete the master data.parquet file
+        # bronze & silver TIERS: Delete the master data.parquet table
+        # (a directory of yearly partitions, or a legacy single file)
         else:
             file_path = f"{stage_dir}/data.parquet"
             if os.path.exists(file_path):
                 try:
-                    os.remove(file_path)
+                    if os.path.isdir(file_path):
+                        shutil.rmtree(file_path)
+                    else:
+                        os.remove(file_path)
                     print(f"[SUCCESS] Erased {s.upper()} data for {ticker}.")
                 except Exception as e:
                     print(f"[ERROR] Could not delete {s.upper()} data for {ticker}: {e}")
@@ -1,15 +1,143 @@
 import os
+import shutil
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from datetime import timedelta
 
 
 DEFAULT_START = "2019-01-01"
 
 
+# ==========================================
+# PARTITIONED LAKE LAYOUT
+# ==========================================
+# A lake table keeps its logical path (e.g. .../bronze/NVDA/daily/data.parquet),
+# but on disk that path is a directory of per-year partition files:
+#
+#     data.parquet/2023.parquet
+#     data.parquet/2024.parquet
+#
+# Deltas only rewrite the partitions they touch, so a one-day update costs one
+# year of rows instead of the full history. Legacy single-file tables are still
+# readable and are migrated to the partitioned layout on their next write.
+
+def partition_files(data_path: str) -> list[str]:
+    """Returns the partition files of a lake table in date order (empty if it doesn't exist)."""
+    if os.path.isdir(data_path):
+        return sorted(
+            os.path.join(data_path, name)
+            for name in os.listdir(data_path)
+            if name.endswith(".parquet")
+        )
+    if os.path.isfile(data_path):
+        return [data_path]  # Legacy single-file table
+    return []
+
+
+def read_partitioned(data_path: str, columns: list[str] | None = None, filter=None) -> pd.DataFrame:
+    """
+    Reads a lake table (partitioned or legacy single file) as one DataFrame.
+
+    Args:
+        columns: Optional column projection, pushed down to pyarrow.
+        filter:  Optional pyarrow.dataset expression, pushed down to the
+                 row-group statistics of every partition.
+    """
+    files = partition_files(data_path)
+    if not files:
+        return pd.DataFrame()
+
+    dataset = ds.dataset(files, schema=read_schema(data_path), format="parquet")
+    return dataset.to_table(columns=columns, filter=filter).to_pandas()
+
+
+def read_schema(data_path: str) -> pa.Schema | None:
+    """
+    Unified arrow schema of a lake table, read from the parquet footers only.
+    Unifying means a column added in a later partition isn't dropped.
+    """
+    files = partition_files(data_path)
+    if not files:
+        return None
+    return pa.unify_schemas([pq.read_schema(f) for f in files])
+
+
+def last_recorded_date(data_path: str, date_col: str) -> pd.Timestamp | None:
+    """
+    Returns the latest value of date_col in a lake table without loading it.
+
+    Partitions are date ordered, so only the newest partition is inspected,
+    and its max comes from the row-group statistics in the parquet footer.
+    The column is only read if the writer didn't record statistics.
+    Cost is O(1) in the size of the history.
+
+    Returns:
+        The last date, or None if the table doesn't exist or is empty.
+    """
+    for part_path in reversed(partition_files(data_path)):
+        metadata = pq.read_metadata(part_path)
+        if metadata.num_rows == 0:
+            continue
+
+        col_idx = metadata.schema.to_arrow_schema().get_field_index(date_col)
+        maxima = []
+        for rg in range(metadata.num_row_groups):
+            stats = metadata.row_group(rg).column(col_idx).statistics
+            if stats is None or not stats.has_min_max:
+                maxima = None
+                break
+            maxima.append(pd.Timestamp(stats.max))
+
+        if maxima:
+            return max(maxima)
+
+        # No footer statistics: fall back to reading just this column of this partition
+        dates = pd.read_parquet(part_path, columns=[date_col], engine='pyarrow')[date_col]
+        return pd.to_datetime(dates).max()
+
+    return None
+
+
+def count_rows(data_path: str) -> int:
+    """Total row count of a lake table, read from the parquet footers only."""
+    return sum(pq.read_metadata(f).num_rows for f in partition_files(data_path))
+
+
+def write_partitioned(df: pd.DataFrame, data_path: str, date_col: str) -> int:
+    """
+    Overwrites a lake table with df, split into per-year partitions.
+    The new table is built next to the old one and swapped in by rename.
+
+    Returns:
+        Total row count of the saved table.
+    """
+    df = df.copy()
+    df[date_col] = pd.to_datetime(df[date_col])
+
+    tmp_dir = f"{data_path}.tmp"
+    old_path = f"{data_path}.old"
+    _remove_path(tmp_dir)
+    os.makedirs(tmp_dir)
+
+    for year, part_df in df.groupby(df[date_col].dt.year):
+        part_df.reset_index(drop=True).to_parquet(_partition_path(tmp_dir, year), index=False, engine='pyarrow')
+
+    _remove_path(old_path)
+    if os.path.exists(data_path):
+        os.replace(data_path, old_path)
+    os.replace(tmp_dir, data_path)
+    _remove_path(old_path)
+
+    return len(df)
+
+
 def get_fetch_range(data_path: str, date_col: str, default_start: str = DEFAULT_START) -> tuple[str | None, bool]:
     """
     Inspects an existing parquet file and returns the date range needed to
     bring it up to date. Works for any time series data source.
+    Only the parquet footer of the newest partition is read (see last_recorded_date).
 
     Returns:
         (fetch_start, is_up_to_date)
@@ -17,12 +145,11 @@ def get_fetch_range(data_path: str, date_col: str, default_start: str = DEFAULT_
         - is_up_to_date:  True if no fetch is needed (already current).
     """
     if os.path.exists(data_path):
-        existing_df = pd.read_parquet(data_path, engine='pyarrow')
+        last_date = last_recorded_date(data_path, date_col)
 
-        if existing_df.empty:
+        if last_date is None:
             return default_start, False
 
-        last_date = pd.to_datetime(existing_df[date_col].iloc[-1])
         fetch_start = (last_date + timedelta(days=1)).strftime("%Y-%m-%d")
 
         if pd.to_datetime(fetch_start) > pd.Timestamp.today():
@@ -35,23 +162,85 @@ def get_fetch_range(data_path: str, date_col: str, default_start: str = DEFAULT_
 
 def upsert_parquet(new_df: pd.DataFrame, data_path: str, date_col: str) -> int:
     """
-    Upserts new_df into an existing parquet file, deduplicating on date_col.
-    Creates the file if it doesn't exist. Works for any time series data source.
+    Upserts new_df into a partitioned lake table, deduplicating on date_col.
+    Only the yearly partitions that new_df overlaps are read and rewritten;
+    every other partition is left untouched. Creates the table if it doesn't
+    exist. Works for any time series data source.
 
     Returns:
-        Total row count of the saved file.
+        Total row count of the saved table.
     """
-    os.makedirs(os.path.dirname(data_path), exist_ok=True)
+    if os.path.isfile(data_path):
+        # Legacy single-file table: split it into partitions once
+        write_partitioned(pd.read_parquet(data_path, engine='pyarrow'), data_path, date_col)
 
-    if os.path.exists(data_path):
-        existing_df = pd.read_parquet(data_path, engine='pyarrow')
-        combined_df = pd.concat([existing_df, new_df])
-    else:
-        combined_df = new_df.copy()
+    os.makedirs(data_path, exist_ok=True)
+
+    new_df = new_df.copy()
+    new_df[date_col] = pd.to_datetime(new_df[date_col])
+
+    for year, delta_df in new_df.groupby(new_df[date_col].dt.year):
+        part_path = _partition_path(data_path, year)
+
+        if os.path.exists(part_path):
+            existing_df = pd.read_parquet(part_path, engine='pyarrow')
+            combined_df = pd.concat([existing_df, delta_df])
+        else:
+            combined_df = delta_df
+
+        combined_df = combined_df.drop_duplicates(subset=[date_col], keep='last')
+        combined_df = combined_df.sort_values(by=date_col).reset_index(drop=True)
+        _write_partition(combined_df, part_path)
+
+    return count_rows(data_path)
+
+
+def delete_rows_from(data_path: str, date_col: str, cutoff) -> int:
+    """
+    Deletes every row with date_col >= cutoff, e.g. to roll back a partial
+    ingest so get_fetch_range() starts before the gap next time. Partitions
+    of years before the cutoff are not read.
+
+    Returns:
+        Total row count of the remaining table.
+    """
+    if os.path.isfile(data_path):
+        write_partitioned(pd.read_parquet(data_path, engine='pyarrow'), data_path, date_col)
+
+    cutoff = pd.Timestamp(cutoff)
+    for part_path in partition_files(data_path):
+        if int(os.path.splitext(os.path.basename(part_path))[0]) < cutoff.year:
+            continue
+
+        part_df = pd.read_parquet(part_path, engine='pyarrow')
+        dates = pd.to_datetime(part_df[date_col])
+        part_cutoff = cutoff.tz_localize(dates.dt.tz) if dates.dt.tz is not None and cutoff.tzinfo is None else cutoff
+        kept = part_df[(dates < part_cutoff).to_numpy()]
+        if kept.empty:
+            os.remove(part_path)
+        elif len(kept) < len(part_df):
+            _write_partition(kept.reset_index(drop=True), part_path)
+
+    return count_rows(data_path)
+
+
+# ==========================================
+# PRIVATE: Partition file helpers
+# ==========================================
+
+def _partition_path(data_path: str, year: int) -> str:
+    return os.path.join(data_path, f"{int(year)}.parquet")
+
+
+def _write_partition(df: pd.DataFrame, part_path: str) -> None:
+    """Writes one partition via a temp file so readers never see a half-written file."""
+    tmp_path = f"{part_path}.tmp"
+    df.to_parquet(tmp_path, index=False, engine='pyarrow')
+    os.replace(tmp_path, part_path)
 
-    combined_df[date_col] = pd.to_datetime(combined_df[date_col])
-    combined_df = combined_df.drop_duplicates(subset=[date_col], keep='last')
-    combined_df = combined_df.sort_values(by=date_col).reset_index(drop=True)
-    combined_df.to_parquet(data_path, index=False, engine='pyarrow')
 
-    return len(combined_df)
\ No newline at end of file
+def _remove_path(path: str) -> None:
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
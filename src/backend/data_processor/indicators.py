@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 def calculate_rsi(df, period=22):
@@ -39,11 +40,332 @@ def calculate_macd(df, fast=12, slow=26, signal=9):
     return df
 
 
-def apply_indicators(df):
-    """A master wrapper to apply all active indicators."""
-    df = calculate_rsi(df, period=22)
-    df = calculate_sma(df, period=20)
-    df = calculate_sma(df, period=50)
-    df = calculate_ema(df, period=20)
-    df = calculate_macd(df)
-    return df
\ No newline at end of file
+# ==========================================
+# INDICATOR REGISTRY
+# ==========================================
+# name -> (function, parameters). Each function adds its output column(s) to df.
+# The silver pipeline tracks which entries (with their parameters) have been
+# materialized, so adding or re-parameterizing one entry only computes that one.
+INDICATORS = {
+    "RSI":    (calculate_rsi,  {"period": 22}),
+    "SMA_20": (calculate_sma,  {"period": 20}),
+    "SMA_50": (calculate_sma,  {"period": 50}),
+    "EMA_20": (calculate_ema,  {"period": 20}),
+    "MACD":   (calculate_macd, {"fast": 12, "slow": 26, "signal": 9}),
+}
+
+
+def indicator_signature(name):
+    """Identifies an indicator's function and parameters, e.g. 'calculate_sma(period=20)'."""
+    fn, params = INDICATORS[name]
+    args = ", ".join(f"{key}={value}" for key, value in sorted(params.items()))
+    return f"{fn.__name__}({args})"
+
+
+def indicator_columns(name):
+    """The columns an indicator adds, found by running it on a two-row stub."""
+    fn, params = INDICATORS[name]
+    stub = pd.DataFrame({'Adj Close': [1.0, 1.0]})
+    return [col for col in fn(stub.copy(), **params).columns if col not in stub.columns]
+
+
+def apply_indicators(df, names=None):
+    """
+    A master wrapper to apply all active indicators (or only the given registry names).
+
+    Registry entries backed by the built-in functions are computed together by
+    compute_indicator_block() and attached in one step; anything else falls
+    back to calling its function.
+    """
+    names = list(INDICATORS if names is None else names)
+    families = {'sma_windows': [], 'ema_spans': [], 'rsi_periods': [], 'macd_params': []}
+    renames = {}
+    for name in names:
+        fn, params = INDICATORS[name]
+        if fn in _KERNEL_FAMILIES:
+            family, key, block_columns = _KERNEL_FAMILIES[fn](**params)
+            families[family].append(key)
+            renames.update(zip(block_columns, indicator_columns(name)))
+
+    if renames:
+        block = compute_indicator_block(df['Adj Close'], **families)
+        block = block[list(renames)].rename(columns=renames)
+        df = pd.concat([df.drop(columns=block.columns, errors='ignore'), block], axis=1)
+
+    for name in names:
+        fn, params = INDICATORS[name]
+        if fn not in _KERNEL_FAMILIES:
+            df = fn(df, **params)
+    return df
+
+
+# ==========================================
+# VECTORIZED MULTI-WINDOW KERNEL
+# ==========================================
+# Computes whole families of windows from one set of NumPy arrays:
+#   - SMAs from a single prefix sum of the closes
+#   - RSIs from prefix sums of gains and losses
+#   - EMAs (and the MACD legs) from one shared adjust=False recursion that
+#     advances every span together, one vectorized step per bar
+# Missing closes (NaN) are handled the way pandas does: a rolling window that
+# contains one is NaN, and the EWM carries its last value across the gap.
+# The result is one block with the input's index, meant to be attached once
+# (pd.concat) instead of inserting columns one at a time.
+
+def compute_indicator_block(close, sma_windows=(), ema_spans=(), rsi_periods=(), macd_params=()):
+    """
+    Computes a family of indicators over one close series in a single pass.
+
+    Args:
+        close:       'Adj Close' series.
+        sma_windows: e.g. range(5, 201) -> SMA_5 ... SMA_200
+        ema_spans:   e.g. (9, 20, 50)  -> EMA_9, EMA_20, EMA_50
+        rsi_periods: e.g. range(7, 31) -> RSI_7 ... RSI_30
+        macd_params: (fast, slow, signal) tuples -> MACD_{f}_{s}_{sig}, _Signal, _Hist
+
+    Returns:
+        DataFrame indexed like close, same values as the per-indicator functions.
+    """
+    values = close.to_numpy(dtype=float)
+    n = len(values)
+    columns = {}
+
+    # ── SMA: one prefix sum serves every window ────────────────────────────────
+    if len(sma_windows):
+        # Summing deviations from the first close keeps the prefix sum small (less cancellation error).
+        # NaNs add nothing to the sum; a prefix count of them blanks only the windows they fall in.
+        missing = np.isnan(values)
+        base = values[~missing][0] if (~missing).any() else 0.0
+        csum = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, values - base))))
+        missing_csum = np.concatenate(([0], np.cumsum(missing)))
+        for window in sma_windows:
+            sma = np.full(n, np.nan)
+            if window <= n:
+                sma[window - 1:] = base + (csum[window:] - csum[:-window]) / window
+                sma[window - 1:][missing_csum[window:] - missing_csum[:-window] > 0] = np.nan
+            columns[f'SMA_{window}'] = sma
+
+    # ── RSI: prefix sums of gains / losses (first bar counts as no change) ─────
+    # Like calculate_rsi's where(), a change touching a NaN close counts as 0
+    if len(rsi_periods):
+        delta = np.diff(values, prepend=values[:1]) if n else values
+        gain_csum = np.concatenate(([0.0], np.cumsum(np.where(delta > 0, delta, 0.0))))
+        loss_csum = np.concatenate(([0.0], np.cumsum(np.where(delta < 0, -delta, 0.0))))
+        for period in rsi_periods:
+            rsi = np.full(n, np.nan)
+            if period <= n:
+                gain = (gain_csum[period:] - gain_csum[:-period]) / period
+                loss = (loss_csum[period:] - loss_csum[:-period]) / period
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    rsi[period - 1:] = 100 - (100 / (1 + gain / loss))
+            columns[f'RSI_{period}'] = rsi
+
+    # ── EMA: every span (including MACD legs) in one shared recursion ──────────
+    spans = sorted(set(ema_spans) | {span for fast, slow, _ in macd_params for span in (fast, slow)})
+    emas = dict(zip(spans, _ewm_matrix(values, spans).T)) if spans else {}
+    for span in ema_spans:
+        columns[f'EMA_{span}'] = emas[span]
+
+    # ── MACD: signal lines share a second recursion over the MACD lines ────────
+    if len(macd_params):
+        macd_lines = np.column_stack([emas[fast] - emas[slow] for fast, slow, _ in macd_params])
+        signal_lines = _ewm_columns(macd_lines, [signal for _, _, signal in macd_params])
+        for i, (fast, slow, signal) in enumerate(macd_params):
+            prefix = f'MACD_{fast}_{slow}_{signal}'
+            columns[prefix] = macd_lines[:, i]
+            columns[f'{prefix}_Signal'] = signal_lines[:, i]
+            columns[f'{prefix}_Hist'] = macd_lines[:, i] - signal_lines[:, i]
+
+    return pd.DataFrame(columns, index=close.index)
+
+
+def _ewm_matrix(values, spans):
+    """adjust=False EWM of one series for several spans at once -> (n, len(spans))."""
+    return _ewm_columns(np.repeat(values[:, None], len(spans), axis=1), spans)
+
+
+def _ewm_columns(matrix, spans):
+    """adjust=False EWM of each column with its own span: y[t] = y[t-1] + a * (x[t] - y[t-1])."""
+    alpha = 2.0 / (np.asarray(spans, dtype=float) + 1.0)
+    out = np.empty_like(matrix, dtype=float)
+    if not len(matrix):
+        return out
+    if np.isnan(matrix).any():
+        return _ewm_columns_with_gaps(matrix, alpha, out)
+
+    out[0] = matrix[0]
+    for t in range(1, len(matrix)):
+        out[t] = out[t - 1] + alpha * (matrix[t] - out[t - 1])
+    return out
+
+
+def _ewm_columns_with_gaps(matrix, alpha, out):
+    """
+    The same recursion with pandas' ewm(adjust=False) NaN rules: a NaN keeps the
+    last value, the previous value's weight keeps decaying by (1 - a) per
+    skipped bar, and leading NaNs stay NaN until the first observation.
+    """
+    weighted = matrix[0].astype(float)
+    old_weight = np.ones_like(alpha)
+    out[0] = weighted
+    for t in range(1, len(matrix)):
+        observed = ~np.isnan(matrix[t])
+        started = ~np.isnan(weighted)
+        old_weight = np.where(started, old_weight * (1.0 - alpha), old_weight)
+        with np.errstate(invalid='ignore'):
+            step = (old_weight * weighted + alpha * matrix[t]) / (old_weight + alpha)
+        weighted = np.where(observed, np.where(started, step, matrix[t]), weighted)
+        old_weight = np.where(observed, 1.0, old_weight)
+        out[t] = weighted
+    return out
+
+
+# batch function -> params -> (kernel family, family key, block columns in indicator_columns() order)
+_KERNEL_FAMILIES = {
+    calculate_rsi:  lambda period=22: ('rsi_periods', period, [f'RSI_{period}']),
+    calculate_sma:  lambda period=20: ('sma_windows', period, [f'SMA_{period}']),
+    calculate_ema:  lambda period=20: ('ema_spans', period, [f'EMA_{period}']),
+    calculate_macd: lambda fast=12, slow=26, signal=9: (
+        'macd_params', (fast, slow, signal),
+        [f'MACD_{fast}_{slow}_{signal}', f'MACD_{fast}_{slow}_{signal}_Signal', f'MACD_{fast}_{slow}_{signal}_Hist'],
+    ),
+}
+
+
+# ==========================================
+# STREAMING (STATEFUL) INDICATORS
+# ==========================================
+# Each indicator can summarize a history into a small JSON-serializable state
+# and advance that state with only new bars:
+#   - SMA / RSI keep the trailing window of closes they need
+#   - EMA / MACD keep the last value of each EWM recursion
+# Advancing runs the same math as the batch functions on the same inputs, so
+# results match a full-history recompute (no re-priming drift).
+
+def init_indicator_state(history_df, names=None):
+    """Builds {name: {'signature', 'state'}} from the full 'Adj Close' history."""
+    close = history_df['Adj Close'].reset_index(drop=True)
+    state = {}
+    for name in (INDICATORS if names is None else names):
+        fn, params = INDICATORS[name]
+        state_fn, _ = _STREAMING[fn]
+        state[name] = {'signature': indicator_signature(name), 'state': state_fn(close, **params)}
+    return state
+
+
+def advance_indicators(new_df, state, names=None):
+    """
+    Adds indicator columns to new_df (new bars only) using the saved state.
+
+    Returns:
+        (df_with_indicators, advanced_state)
+    """
+    df = new_df.copy()
+    new_state = {}
+    for name in (INDICATORS if names is None else names):
+        fn, params = INDICATORS[name]
+        _, advance_fn = _STREAMING[fn]
+        df, indicator_state = advance_fn(df, state[name]['state'], **params)
+        new_state[name] = {'signature': indicator_signature(name), 'state': indicator_state}
+    return df, new_state
+
+
+def _tail(values, n):
+    return [float(v) for v in values.iloc[-n:]] if n > 0 else []
+
+
+def _last(values):
+    return float(values.iloc[-1]) if len(values) else None
+
+
+def _trailing_gap(values):
+    """Trailing NaN closes: bars the EWM weight of the last value has already decayed over."""
+    missing = pd.isna(pd.Series(values, dtype=float)).to_numpy()
+    return len(missing) - len(np.trim_zeros(~missing, 'b'))
+
+
+def _advance_window(df, state, fn, window, **params):
+    """Runs a rolling-window indicator over (saved window + new bars) and keeps the new rows."""
+    closes = state['closes'] + df['Adj Close'].astype(float).tolist()
+    out = fn(pd.DataFrame({'Adj Close': closes}), **params)
+    for col in out.columns.drop('Adj Close'):
+        df[col] = out[col].values[-len(df):]
+    return df, {'closes': closes[-window:]}
+
+
+def _continue_ewm(last, values, span, gap=0):
+    """
+    Continues an adjust=False EWM from its last value. Prepending that value
+    (and the NaN closes seen since) reproduces the recursion of a full-history
+    ewm() exactly.
+    """
+    values = pd.Series(values, dtype=float).reset_index(drop=True)
+    if last is None:
+        return values.ewm(span=span, adjust=False).mean().values
+    series = pd.concat([pd.Series([last] + [np.nan] * gap, dtype=float), values], ignore_index=True)
+    return series.ewm(span=span, adjust=False).mean().values[1 + gap:]
+
+
+def _rsi_state(close, period=22):
+    return {'closes': _tail(close, period + 1)}  # period deltas need period + 1 closes
+
+
+def _rsi_advance(df, state, period=22):
+    return _advance_window(df, state, calculate_rsi, period + 1, period=period)
+
+
+def _sma_state(close, period=20):
+    return {'closes': _tail(close, period)}
+
+
+def _sma_advance(df, state, period=20):
+    return _advance_window(df, state, calculate_sma, period, period=period)
+
+
+def _ema_state(close, period=20):
+    return {'ema': _last(close.ewm(span=period, adjust=False).mean()), 'gap': _trailing_gap(close)}
+
+
+def _ema_advance(df, state, period=20):
+    gap = state.get('gap', 0)
+    ema = _continue_ewm(state['ema'], df['Adj Close'], period, gap)
+    df[f'EMA_{period}'] = ema
+    return df, {'ema': float(ema[-1]), 'gap': _gap_after(gap, df['Adj Close'])}
+
+
+def _macd_state(close, fast=12, slow=26, signal=9):
+    ema_fast = close.ewm(span=fast, adjust=False).mean()
+    ema_slow = close.ewm(span=slow, adjust=False).mean()
+    macd_signal = (ema_fast - ema_slow).ewm(span=signal, adjust=False).mean()
+    return {'ema_fast': _last(ema_fast), 'ema_slow': _last(ema_slow), 'signal': _last(macd_signal),
+            'gap': _trailing_gap(close)}
+
+
+def _macd_advance(df, state, fast=12, slow=26, signal=9):
+    # The EWMs carry across NaN closes, so the MACD line itself has no gaps to track
+    gap = state.get('gap', 0)
+    ema_fast = _continue_ewm(state['ema_fast'], df['Adj Close'], fast, gap)
+    ema_slow = _continue_ewm(state['ema_slow'], df['Adj Close'], slow, gap)
+    macd = ema_fast - ema_slow
+    macd_signal = _continue_ewm(state['signal'], macd, signal)
+
+    df['MACD'] = macd
+    df['MACD_Signal'] = macd_signal
+    df['MACD_Hist'] = macd - macd_signal
+    return df, {'ema_fast': float(ema_fast[-1]), 'ema_slow': float(ema_slow[-1]), 'signal': float(macd_signal[-1]),
+                'gap': _gap_after(gap, df['Adj Close'])}
+
+
+def _gap_after(gap, new_closes):
+    """Trailing NaN count once new_closes are appended to a history ending in `gap` NaNs."""
+    new_gap = _trailing_gap(new_closes)
+    return gap + new_gap if new_gap == len(new_closes) else new_gap
+
+
+# batch function -> (state_fn, advance_fn)
+_STREAMING = {
+    calculate_rsi:  (_rsi_state,  _rsi_advance),
+    calculate_sma:  (_sma_state,  _sma_advance),
+    calculate_ema:  (_ema_state,  _ema_advance),
+    calculate_macd: (_macd_state, _macd_advance),
+}
@@ -0,0 +1,77 @@
+import hashlib
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# FINANCIAL HEADLINE LEXICON
+# ==========================================
+# A compact word list tuned for market headlines. Scores are on the same
+# -1.0 (Panic/Crisis) to 1.0 (Euphoria/Growth) scale as the LLM backend.
+
+POSITIVE_WORDS = {
+    "beat", "beats", "surge", "surges", "surged", "soar", "soars", "soared", "rally", "rallies",
+    "rallied", "jump", "jumps", "jumped", "gain", "gains", "gained", "rise", "rises", "rose",
+    "record", "high", "highs", "growth", "grow", "grows", "strong", "stronger", "upgrade",
+    "upgrades", "upgraded", "outperform", "outperforms", "buy", "bullish", "profit", "profits",
+    "profitable", "boost", "boosts", "boosted", "expand", "expands", "expansion", "win", "wins",
+    "approval", "approved", "breakthrough", "partnership", "raise", "raises", "raised", "exceed",
+    "exceeds", "exceeded", "optimistic", "robust", "rebound", "rebounds", "upside", "dividend",
+}
+
+NEGATIVE_WORDS = {
+    "miss", "misses", "missed", "plunge", "plunges", "plunged", "crash", "crashes", "crashed",
+    "slump", "slumps", "slumped", "drop", "drops", "dropped", "fall", "falls", "fell", "decline",
+    "declines", "declined", "loss", "losses", "lose", "weak", "weaker", "downgrade", "downgrades",
+    "downgraded", "underperform", "underperforms", "sell", "bearish", "cut", "cuts", "lawsuit",
+    "probe", "investigation", "fraud", "recall", "recalls", "warning", "warns", "warned", "risk",
+    "risks", "layoffs", "bankruptcy", "default", "tumble", "tumbles", "tumbled", "sink", "sinks",
+    "sank", "fear", "fears", "concern", "concerns", "halt", "halts", "delay", "delays", "downside",
+}
+
+NEGATORS = {"not", "no", "never", "without", "fails", "failed"}
+
+LEXICON = {**{word: 1.0 for word in POSITIVE_WORDS}, **{word: -1.0 for word in NEGATIVE_WORDS}}
+
+# Squashes a day's net polarity into (-1, 1); larger means more hits are needed to saturate
+NORMALIZATION_ALPHA = 15.0
+
+
+def score_with_lexicon(ticker: str, day_headlines: dict, **_):
+    """
+    Offline lexicon sentiment backend. Yields one {date: score} dict.
+
+    Tokenizes every headline for the ticker at once and scores all days in a
+    single vectorized pass: token polarity from LEXICON, flipped when the
+    previous token is a negator, summed per day and squashed into (-1, 1)
+    with x / sqrt(x^2 + alpha). Days with no lexicon hits score 0.0.
+    """
+    if not day_headlines:
+        return
+
+    dates = [date for date, headlines in day_headlines.items() for _ in headlines]
+    texts = pd.Series([text for headlines in day_headlines.values() for text in headlines], dtype="string")
+
+    # One row per token, keeping the owning day and headline
+    tokens = pd.DataFrame({
+        'Date': dates,
+        'Headline_Id': np.arange(len(texts)),
+        'Token': texts.str.lower().str.findall(r"[a-z']+"),
+    })
+    tokens = tokens.explode('Token').dropna(subset=['Token'])
+
+    polarity = tokens['Token'].map(LEXICON).fillna(0.0).astype(float)
+    negated = tokens.groupby('Headline_Id')['Token'].shift(1).isin(NEGATORS)
+    polarity = polarity.where(~negated, -polarity)
+
+    net = polarity.groupby(tokens['Date']).sum()
+    scores = net / np.sqrt(net ** 2 + NORMALIZATION_ALPHA)
+    scores = scores.reindex(list(day_headlines.keys()), fill_value=0.0)
+
+    yield {date: float(score) for date, score in scores.items()}
+
+
+def lexicon_version(**_) -> str:
+    """Cache version of the lexicon backend: changes whenever the word lists change."""
+    payload = "|".join(f"{word}:{LEXICON[word]}" for word in sorted(LEXICON))
+    payload += f"|neg:{','.join(sorted(NEGATORS))}|alpha:{NORMALIZATION_ALPHA}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
@@ -1,13 +1,21 @@
 import pandas as pd
 import os
+import queue
+import threading
 import backend.config as config
+from concurrent.futures import ThreadPoolExecutor
 from alpaca.data.historical.news import NewsClient
 from alpaca.data.requests import NewsRequest
-from backend.data_processor.fetcher_utils import upsert_parquet
+from backend.data_processor.fetcher_utils import upsert_parquet, delete_rows_from
 
 ALPACA_API_KEY = config.ALPACA_API_KEY
 ALPACA_SECRET_KEY = config.ALPACA_SECRET_KEY
 
+NEWS_PAGE_SIZE = 50        # Alpaca's max articles per news page
+NEWS_WINDOW_DAYS = 90      # Width of each concurrently fetched date window
+NEWS_FLUSH_ROWS = 2000     # Buffered articles before a store_news() write
+NEWS_QUEUE_POLL_SECONDS = 0.5  # How often a blocked producer checks for cancellation
+
 def fetch_news(ticker: str, start_date: str, end_date: str = None) -> pd.DataFrame:
     """Fetches news headlines from Alpaca for a given date range."""
     if end_date is None:
@@ -29,23 +37,111 @@ def fetch_news(ticker: str, start_date: str, end_date: str = None) -> pd.DataFra
         if len(news_list) == 0:
             print(f"[{ticker}] No news found for this date range.")
             return pd.DataFrame()
-        else:
-            df_news = pd.DataFrame(news_list)
 
     except Exception as e:
         print(f"[ERROR] Failed to fetch news for {ticker}: {e}")
         return pd.DataFrame()
 
+    return _format_news(news_list, ticker)
 
 
-    # Normalise to a clean daily date for deduplication and merging
-    df_clean = df_news[['id', 'headline', 'summary', 'created_at']].copy()
-    df_clean.insert(1, 'Ticker', ticker)
-    df_clean.insert(2, 'Date',
-                    pd.to_datetime(df_clean['created_at']).dt.tz_localize(None).dt.normalize()
-                    )
+class NewsIngestError(RuntimeError):
+    """Raised by ingest_news() when a window couldn't be fetched or stored."""
 
-    return df_clean
+
+def ingest_news(ticker: str, interval: str, start_date: str, end_date: str = None,
+                window_days: int = NEWS_WINDOW_DAYS, max_workers: int = 4,
+                client: NewsClient = None) -> int:
+    """
+    Paginated, concurrent news ingestion for large ranges (e.g. first-time backfills).
+
+    Splits [start_date, end_date] into date windows and fetches them through a
+    bounded thread pool sharing one NewsClient. Each window follows Alpaca's
+    page tokens to the end, so nothing is truncated. Pages are streamed through
+    a bounded queue and flushed to store_news() every NEWS_FLUSH_ROWS articles,
+    so memory stays bounded regardless of the range.
+
+    A window that fails to fetch or store must not leave a gap: the next run
+    starts after the newest stored created_at, so rows stored from later
+    windows would hide it forever. On any failure the news table is rolled
+    back to the start of the earliest failed window and NewsIngestError is
+    raised; the next run refetches from there.
+
+    Args:
+        client: Optional shared client, e.g. NewsClient(url_override=...) pointing
+                at a local fake news server for testing.
+
+    Returns:
+        Number of articles fetched.
+    """
+    if end_date is None:
+        end_date = pd.Timestamp.today().strftime("%Y-%m-%d")
+
+    client = client or NewsClient(ALPACA_API_KEY, ALPACA_SECRET_KEY, raw_data=True)
+    windows = _date_windows(start_date, end_date, window_days)
+    print(f"[{ticker}] Ingesting news from {start_date} to {end_date} across {len(windows)} windows...")
+
+    # Workers produce (window start, page), this thread is the single writer to the news table.
+    # A failed write cancels the producers, so none of them blocks on a queue nobody drains.
+    pages = queue.Queue(maxsize=max_workers * 4)
+    cancel = threading.Event()
+    failed = {}    # window start -> error
+    done = object()
+
+    def put(item):
+        while not cancel.is_set():
+            try:
+                pages.put(item, timeout=NEWS_QUEUE_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fetch_window(window_start, window_end):
+        try:
+            for news_list in _iter_news_pages(client, ticker, window_start, window_end):
+                if not put((window_start, news_list)):
+                    return
+        except Exception as e:
+            print(f"[ERROR] Failed to fetch news for {ticker} ({window_start} → {window_end}): {e}")
+            failed[window_start] = e
+        finally:
+            put((window_start, done))
+
+    fetched = 0
+    buffer, buffer_windows = [], set()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for window_start, window_end in windows:
+            pool.submit(fetch_window, window_start, window_end)
+
+        remaining = len(windows)
+        while remaining > 0 and not cancel.is_set():
+            window_start, news_list = pages.get()
+            if news_list is done:
+                remaining -= 1
+                continue
+
+            buffer.extend(news_list)
+            buffer_windows.add(window_start)
+            fetched += len(news_list)
+            if len(buffer) >= NEWS_FLUSH_ROWS:
+                _flush_news(buffer, buffer_windows, ticker, interval, failed, cancel)
+                buffer, buffer_windows = [], set()
+
+    if buffer and not cancel.is_set():
+        _flush_news(buffer, buffer_windows, ticker, interval, failed, cancel)
+
+    if failed:
+        cutoff = min(failed)
+        news_path = f"../../../data/bronze/{ticker}/{interval}/news.parquet"
+        total_rows = delete_rows_from(news_path, date_col='created_at', cutoff=cutoff)
+        print(f"[{ticker}] News rolled back to {cutoff} after {len(failed)} failed windows. Total rows in file: {total_rows}")
+        raise NewsIngestError(f"News ingestion for {ticker} failed from {cutoff}: {failed[cutoff]}")
+
+    if fetched == 0:
+        print(f"[{ticker}] No news found for this date range.")
+
+    return fetched
 
 
 def store_news(news_df: pd.DataFrame, ticker: str, interval: str, stage: str = "bronze") -> None:
@@ -57,4 +153,67 @@ def store_news(news_df: pd.DataFrame, ticker: str, interval: str, stage: str = "
     """
     news_path = f"../../../data/{stage}/{ticker}/{interval}/news.parquet"
     total_rows = upsert_parquet(news_df, news_path, date_col='created_at')
-    print(f"[{ticker}] News saved. Total rows in file: {total_rows}")
\ No newline at end of file
+    print(f"[{ticker}] News saved. Total rows in file: {total_rows}")
+
+
+# ==========================================
+# PRIVATE: Pagination + formatting helpers
+# ==========================================
+
+def _iter_news_pages(client: NewsClient, ticker: str, start_date: str, end_date: str):
+    """Yields one list of raw articles per Alpaca page, following next_page_token."""
+    page_token = None
+    while True:
+        request_params = NewsRequest(
+            symbols=ticker,
+            start=start_date,
+            end=end_date,
+            limit=NEWS_PAGE_SIZE,
+            page_token=page_token,
+        )
+        response = client.get("/news", request_params.to_request_fields())
+        news_list = response.get('news', [])
+        if news_list:
+            yield news_list
+
+        page_token = response.get('next_page_token')
+        if not page_token:
+            break
+
+
+def _flush_news(news_list: list[dict], windows: set, ticker: str, interval: str,
+                failed: dict, cancel: threading.Event) -> None:
+    """Stores buffered articles. On failure, marks their windows failed and cancels the producers."""
+    try:
+        store_news(_format_news(news_list, ticker), ticker, interval)
+    except Exception as e:
+        print(f"[ERROR] Failed to store {len(news_list)} news rows for {ticker}: {e}")
+        for window_start in windows:
+            failed[window_start] = e
+        cancel.set()
+
+
+def _date_windows(start_date: str, end_date: str, window_days: int) -> list[tuple[str, str]]:
+    """Splits [start_date, end_date] into contiguous windows of at most window_days."""
+    end_ts = pd.to_datetime(end_date)
+    if pd.to_datetime(start_date) > end_ts:
+        return []
+
+    bounds = list(pd.date_range(start_date, end_date, freq=f"{window_days}D"))
+    if len(bounds) == 1 or bounds[-1] < end_ts:
+        bounds.append(end_ts)
+    return [(a.strftime("%Y-%m-%d"), b.strftime("%Y-%m-%d")) for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def _format_news(news_list: list[dict], ticker: str) -> pd.DataFrame:
+    """Normalises raw Alpaca articles into the bronze news schema."""
+    df_news = pd.DataFrame(news_list)
+
+    # Normalise to a clean daily date for deduplication and merging
+    df_clean = df_news[['id', 'headline', 'summary', 'created_at']].copy()
+    df_clean.insert(1, 'Ticker', ticker)
+    df_clean.insert(2, 'Date',
+                    pd.to_datetime(df_clean['created_at']).dt.tz_localize(None).dt.normalize()
+                    )
+
+    return df_clean
@@ -12,17 +12,53 @@ def fetch_data(ticker: str, start_date: str, end_date: str = None) -> pd.DataFra
             return pd.DataFrame()
 
         data.columns = data.columns.get_level_values(0)
-        data.columns.name = None
-        data = data.reset_index()
-        data.insert(1, 'Ticker', ticker)
-        return data
-    
+        return _format_prices(data, ticker)
+
     except Exception as e:
         print(f"[ERROR] Failed to fetch price data for {ticker}: {e}")
         return pd.DataFrame()
 
+def fetch_data_batch(tickers: list[str], start_date: str, end_date: str = None) -> dict[str, pd.DataFrame]:
+    """
+    Fetches historical OHLCV data for several tickers in one Yahoo Finance call.
+
+    Returns:
+        dict[ticker -> DataFrame], each frame shaped exactly like fetch_data().
+        Tickers with no data in the range are left out.
+    """
+    try:
+        # threads=False: concurrency is bounded by the caller's pool, not by yfinance
+        data = yf.download(tickers, start=start_date, end=end_date, auto_adjust=False,
+                           group_by='ticker', threads=False, progress=False)
+    except Exception as e:
+        print(f"[ERROR] Failed to fetch price data for {tickers}: {e}")
+        return {}
+
+    if data is None or data.empty:
+        return {}
+
+    results = {}
+    for ticker in tickers:
+        if ticker not in data.columns.get_level_values(0):
+            continue
+
+        # Mixed calendars (e.g. crypto + equities) leave all-NaN rows for the other assets
+        ticker_df = data[ticker].dropna(how='all')
+        if not ticker_df.empty:
+            results[ticker] = _format_prices(ticker_df, ticker)
+
+    return results
+
 def store_prices(data_df: pd.DataFrame, ticker: str, interval: str, stage: str = "bronze") -> None:
     """Upserts new OHLCV rows into the master parquet file."""
     data_path = f"../../../data/{stage}/{ticker}/{interval}/data.parquet"
     total_rows = upsert_parquet(data_df, data_path, date_col='Date')
-    print(f"[{ticker}] Prices saved. Total rows in file: {total_rows}")
\ No newline at end of file
+    print(f"[{ticker}] Prices saved. Total rows in file: {total_rows}")
+
+def _format_prices(data: pd.DataFrame, ticker: str) -> pd.DataFrame:
+    """Flattens a single-ticker yfinance frame into the bronze schema (Date, Ticker, OHLCV)."""
+    data = data.copy()
+    data.columns.name = None
+    data = data.reset_index()
+    data.insert(1, 'Ticker', ticker)
+    return data
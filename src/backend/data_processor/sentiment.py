@@ -2,10 +2,19 @@ import warnings
 warnings.filterwarnings("ignore", message="Core Pydantic V1 functionality")
 
 import os
+import time
+import hashlib
+import json
+import random
+import threading
+import uuid
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import PromptTemplate
 from backend import config
+from backend.data_processor.fetcher_utils import read_partitioned, partition_files
+from backend.data_processor.lexicon_sentiment import score_with_lexicon, lexicon_version
 
 SENTIMENT_PROMPT = PromptTemplate.from_template("""
 Analyze these headlines for {ticker}.
@@ -15,28 +24,94 @@ Headlines:
 Return ONLY the numerical score. No explanation.
 """)
 
+# Batch mode: many trading days per request, answered as a JSON {date: score} object
+SENTIMENT_BATCH_PROMPT = PromptTemplate.from_template("""
+Analyze these headlines for {ticker}, grouped by trading day.
+Score the overall narrative of EACH day from -1.0 (Panic/Crisis) to 1.0 (Euphoria/Growth).
+{days}
+Return ONLY a JSON object mapping every date above (YYYY-MM-DD) to its numerical score. No explanation.
+""")
+
+SENTIMENT_MODEL = "gpt-4o-mini"
+
+# Scoring throughput settings
+LLM_MAX_WORKERS = 8            # Concurrent in-flight LLM requests
+LLM_REQUESTS_PER_SECOND = 5.0  # Token-bucket refill rate shared by all workers
+LLM_MAX_RETRIES = 3            # Retries per day on request errors (exponential backoff)
+LLM_BACKOFF_SECONDS = 1.0      # First backoff delay, doubled on every retry
+CACHE_FLUSH_EVERY = 25         # Scored days between sentiment cache writes
+CACHE_MAX_PARTS = 32           # Cache part files before a load compacts them into one
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    acquire() blocks until a token is available; tokens refill at `rate` per second
+    up to `capacity`, so short bursts are allowed but the long-run rate is capped.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        if not rate > 0:
+            raise ValueError(f"TokenBucket rate must be positive, got {rate}.")
+        if capacity is not None and not capacity >= 1:
+            raise ValueError(f"TokenBucket capacity must be at least 1, got {capacity}.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
 
-def compute_sentiment_feature(ticker: str, interval: str = "daily", since_date=None) -> pd.DataFrame:
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+def compute_sentiment_feature(ticker: str, interval: str = "daily", since_date=None,
+                              backend: str = "llm", **backend_options) -> pd.DataFrame:
     """
-    Reads bronze news, scores each trading day with an LLM, and returns
-    a daily sentiment DataFrame indexed by Date.
+    Reads bronze news, scores each trading day with a sentiment backend, and
+    returns a daily sentiment DataFrame indexed by Date.
+
+    Every score is stored in a content-addressed cache next to the bronze news,
+    keyed by (ticker, date, hash of the sorted headline set, scorer version).
+    Only days whose headlines (or backend/prompt/model) changed are re-scored,
+    so backfills and reruns are nearly free, and an interrupted run resumes
+    where it stopped.
 
     Args:
         since_date: If provided, only scores news on dates AFTER this value.
                     Pass last_feature_date from silver pipeline for delta updates.
+        backend:    Name of a scorer in SENTIMENT_BACKENDS:
+                    'llm'     - gpt-4o-mini, concurrent + rate limited (see score_with_llm)
+                    'lexicon' - offline vectorized word-list scorer, no network
+        **backend_options: Forwarded to the backend, e.g. llm=, batch_days=,
+                    max_workers=, requests_per_second= for 'llm'.
 
     Returns:
         DataFrame with index='Date' and column='Sentiment'.
         Returns an empty DataFrame (with correct shape) if no news is found.
     """
+    score_fn, version_fn = get_sentiment_backend(backend)
+
     bronze_news_path = f"../../../data/bronze/{ticker}/{interval}/news.parquet"
+    cache_path = f"../../../data/bronze/{ticker}/{interval}/sentiment_cache.parquet"
     empty_result = pd.DataFrame(columns=['Date', 'Sentiment']).set_index('Date')
 
     if not os.path.exists(bronze_news_path):
         print(f"[{ticker}] No raw news found. Sentiment will default to 0.0")
         return empty_result
 
-    df_news = pd.read_parquet(bronze_news_path)
+    df_news = read_partitioned(bronze_news_path, columns=['Date', 'headline'])
 
     if df_news.empty:
         return empty_result
@@ -51,21 +126,240 @@ def compute_sentiment_feature(ticker: str, interval: str = "daily", since_date=N
         return empty_result
 
     grouped_news = df_news.groupby('Date')
-    print(f"[{ticker}] Scoring sentiment across {len(grouped_news)} trading days...")
-
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0, api_key=config.OPENAI_KEY)
-    daily_scores = []
+    print(f"[{ticker}] Scoring sentiment ({backend}) across {len(grouped_news)} trading days...")
 
+    # Content-address every day: same headlines + same scorer => same score
+    version = f"{backend}:{version_fn(**backend_options)}"
+    days = {}
     for date, group in grouped_news:
-        headlines = "\n- ".join(group['headline'].dropna().tolist())
-        # Add counter log
+        headlines = group['headline'].dropna().tolist()
+        days[date] = (headline_hash(headlines), headlines)
+
+    cache = _load_cache(cache_path, ticker, version)
+    daily_scores = {date: cache[(date, h)] for date, (h, _) in days.items() if (date, h) in cache}
+    pending = {date: day for date, day in days.items() if date not in daily_scores}
+    print(f"[{ticker}] Sentiment cache: {len(daily_scores)} hits, {len(pending)} days to score.")
+
+    if pending:
+        new_entries = []
+        scored = 0
+        # Backends yield partial results; flushing as we go doubles as checkpointing
+        for scores in score_fn(ticker, {date: headlines for date, (_, headlines) in pending.items()}, **backend_options):
+            for date, score in scores.items():
+                if score is None:
+                    continue  # Failed: not cached, so the next run retries it (0.0 below)
+                daily_scores[date] = score
+                new_entries.append((date, pending[date][0], score))
+            scored += len(scores)
+
+            if len(new_entries) >= CACHE_FLUSH_EVERY:
+                _append_cache(cache_path, ticker, version, new_entries)
+                new_entries = []
+                print(f"[{ticker}] Scored {scored}/{len(pending)} days...")
+
+        if new_entries:
+            _append_cache(cache_path, ticker, version, new_entries)
+            print(f"[{ticker}] Scored {scored}/{len(pending)} days...")
+
+    failed = len(days) - len(daily_scores)
+    if failed:
+        print(f"[{ticker}] {failed} days could not be scored. They default to 0.0 and will be retried next run.")
+
+    sentiment_df = pd.DataFrame(
+        [{'Date': date, 'Sentiment': daily_scores.get(date, 0.0)} for date in sorted(days)]
+    ).set_index('Date')
+    return sentiment_df
+
+
+def score_with_llm(ticker: str, day_headlines: dict, llm=None,
+                   max_workers: int = LLM_MAX_WORKERS,
+                   requests_per_second: float = LLM_REQUESTS_PER_SECOND,
+                   batch_days: int = 1):
+    """
+    LLM sentiment backend. Yields {date: score} as each request completes.
+    A day whose request failed (or whose reply isn't a number) scores None.
+
+    Requests run concurrently in a bounded thread pool sharing one token-bucket
+    rate limiter, with exponential-backoff retries.
+
+    Args:
+        llm:        Optional chat model (anything with .invoke(prompt).content).
+                    Defaults to gpt-4o-mini; pass a local fake model for testing.
+        batch_days: Trading days packed into one request (1 = one request per day).
+                    Batched replies are parsed as a per-date score list; days that
+                    fail to parse fall back to single-day requests.
+    """
+    llm = llm or ChatOpenAI(model=SENTIMENT_MODEL, temperature=0, api_key=config.OPENAI_KEY)
+    bucket = TokenBucket(requests_per_second)
+
+    # One task per request: batch_days consecutive days share a prompt
+    dates = sorted(day_headlines)
+    batch_days = max(batch_days, 1)
+    chunks = [dates[i:i + batch_days] for i in range(0, len(dates), batch_days)]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_score_days, llm, bucket, ticker, {date: "\n- ".join(day_headlines[date]) for date in chunk})
+            for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def llm_version(llm=None, **_) -> str:
+    """Cache version of the LLM backend: the model name plus both prompt templates."""
+    return scorer_version(getattr(llm, 'model_name', None) or (type(llm).__name__ if llm else SENTIMENT_MODEL))
+
+
+# Pluggable scorers: name -> (score_fn, version_fn).
+#   score_fn(ticker, {date: [headlines]}, **options) yields {date: score} dicts
+#   version_fn(**options) identifies the scorer for the sentiment cache
+SENTIMENT_BACKENDS = {
+    "llm":     (score_with_llm, llm_version),
+    "lexicon": (score_with_lexicon, lexicon_version),
+}
+
+
+def get_sentiment_backend(name: str):
+    if name not in SENTIMENT_BACKENDS:
+        raise ValueError(f"Unknown sentiment backend '{name}'. Available: {list(SENTIMENT_BACKENDS.keys())}")
+    return SENTIMENT_BACKENDS[name]
+
+
+def headline_hash(headlines: list[str]) -> str:
+    """Order-independent content hash of a day's headline set."""
+    payload = "\n".join(sorted(set(headlines)))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def scorer_version(model_name: str) -> str:
+    """Identifies the prompts + model; changing any of them invalidates cached scores."""
+    payload = f"{model_name}\n{SENTIMENT_PROMPT.template}\n{SENTIMENT_BATCH_PROMPT.template}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+# ==========================================
+# PRIVATE: Scoring + cache helpers
+# ==========================================
+
+def _score_days(llm, bucket: TokenBucket, ticker: str, day_texts: dict) -> dict:
+    """
+    Scores {date: headlines_text} in a single request and returns {date: score}.
+    Any day missing or unparseable in the batched reply is re-scored on its own;
+    None if that fails too.
+    """
+    if len(day_texts) == 1:
+        (date, text), = day_texts.items()
+        return {date: _score_day(llm, bucket, ticker, text)}
+
+    days_block = "\n".join(
+        f"Date: {date.strftime('%Y-%m-%d')}\nHeadlines:\n- {text}\n"
+        for date, text in day_texts.items()
+    )
+    content = _invoke_with_retries(llm, bucket, SENTIMENT_BATCH_PROMPT.format(ticker=ticker, days=days_block))
+    parsed = _parse_batch_scores(content)
+
+    scores = {}
+    for date, text in day_texts.items():
+        score = parsed.get(date.strftime('%Y-%m-%d'))
+        scores[date] = score if score is not None else _score_day(llm, bucket, ticker, text)
+    return scores
+
+
+def _score_day(llm, bucket: TokenBucket, ticker: str, headlines: str) -> float | None:
+    """Scores one day's headlines. None on any LLM failure, so the day is never cached."""
+    content = _invoke_with_retries(llm, bucket, SENTIMENT_PROMPT.format(ticker=ticker, news=headlines))
+    try:
+        return float(content.strip())
+    except (ValueError, AttributeError):
+        return None
+
+
+def _invoke_with_retries(llm, bucket: TokenBucket, prompt: str) -> str | None:
+    """Rate-limited llm.invoke, retrying request errors with exponential backoff + jitter."""
+    for attempt in range(LLM_MAX_RETRIES + 1):
+        bucket.acquire()
         try:
-            response = llm.invoke(SENTIMENT_PROMPT.format(ticker=ticker, news=headlines))
-            score = float(response.content.strip())
+            return llm.invoke(prompt).content
         except Exception:
-            score = 0.0  # Fallback to neutral on any LLM failure
+            if attempt < LLM_MAX_RETRIES:
+                time.sleep(LLM_BACKOFF_SECONDS * (2 ** attempt) * (1 + random.random()))
+    return None
+
+
+def _parse_batch_scores(content: str | None) -> dict:
+    """Parses a batched reply into {'YYYY-MM-DD': score}, skipping entries that aren't numbers."""
+    if not content or '{' not in content:
+        return {}
+    try:
+        # Tolerate code fences or stray prose around the JSON object
+        raw = json.loads(content[content.index('{'):content.rindex('}') + 1])
+    except ValueError:
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+
+    scores = {}
+    for date_str, value in raw.items():
+        try:
+            scores[str(date_str).strip()] = float(value)
+        except (TypeError, ValueError):
+            continue
+    return scores
+
+
+# The sentiment cache is append-only: sentiment_cache.parquet is a directory of
+# part files named by write time, one per flush, so a flush costs O(new entries)
+# instead of rewriting the whole cache. Later parts win on duplicate keys. Once
+# a load finds more than CACHE_MAX_PARTS parts, it rewrites them as one.
+
+CACHE_KEY_COLUMNS = ['Ticker', 'Date', 'Headline_Hash', 'Scorer_Version']
+
+
+def _load_cache(cache_path: str, ticker: str, version: str) -> dict:
+    """Returns {(date, headline_hash): score} for this ticker and scorer version."""
+    parts = partition_files(cache_path)
+    if not parts:
+        return {}
+
+    cache_df = pd.concat([pd.read_parquet(part, engine='pyarrow') for part in parts], ignore_index=True)
+    cache_df = cache_df.drop_duplicates(subset=CACHE_KEY_COLUMNS, keep='last')
+    if len(parts) > CACHE_MAX_PARTS:
+        _compact_cache(cache_df, parts)
+
+    cache_df = cache_df[(cache_df['Ticker'] == ticker) & (cache_df['Scorer_Version'] == version)]
+    return dict(zip(zip(cache_df['Date'], cache_df['Headline_Hash']), cache_df['Sentiment']))
+
+
+def _append_cache(cache_path: str, ticker: str, version: str, entries: list[tuple]) -> None:
+    """Writes (date, headline_hash, score) entries as a new cache part file."""
+    new_df = pd.DataFrame(entries, columns=['Date', 'Headline_Hash', 'Sentiment'])
+    new_df.insert(0, 'Ticker', ticker)
+    new_df.insert(3, 'Scorer_Version', version)
+
+    if os.path.isfile(cache_path):
+        # Legacy single-file cache: it becomes the oldest part
+        tmp_path = f"{cache_path}.tmp"
+        os.replace(cache_path, tmp_path)
+        os.makedirs(cache_path)
+        os.replace(tmp_path, os.path.join(cache_path, f"{0:020d}.parquet"))
+    os.makedirs(cache_path, exist_ok=True)
+
+    part_path = os.path.join(cache_path, f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.parquet")
+    _write_cache_part(new_df, part_path)
+
+
+def _compact_cache(cache_df: pd.DataFrame, parts: list[str]) -> None:
+    """
+    Rewrites the parts that were read as one file. It takes the newest part's
+    name, so parts written concurrently since the read still sort after it.
+    """
+    _write_cache_part(cache_df.sort_values(by='Date'), parts[-1])
+    for part in parts[:-1]:
+        os.remove(part)
 
-        daily_scores.append({'Date': date, 'Sentiment': score})
 
-    sentiment_df = pd.DataFrame(daily_scores).set_index('Date')
-    return sentiment_df
\ No newline at end of file
+def _write_cache_part(df: pd.DataFrame, part_path: str) -> None:
+    tmp_path = f"{part_path}.tmp"
+    df.to_parquet(tmp_path, index=False, engine='pyarrow')
+    os.replace(tmp_path, part_path)
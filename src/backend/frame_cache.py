@@ -0,0 +1,117 @@
+import os
+import threading
+import pandas as pd
+from collections import OrderedDict
+from backend.data_processor.fetcher_utils import partition_files
+from backend.pipeline.coordination import single_flight
+from backend.utils import lake_read_parquet
+
+# ==========================================
+# DECODED FRAME CACHE
+# ==========================================
+# The API process keeps recently used lake tables (silver features, gold
+# datasets) decoded in memory, so repeat queries for hot tickers skip the parquet
+# decode.
+#
+#   - Key: the table path. The whole table is cached once; date ranges and
+#     column lists are cut from it in memory, so every query on a ticker
+#     shares one entry.
+#   - Validity: (file name, mtime, size) of every partition file. A pipeline
+#     run that rewrites a partition (or adds one) changes the signature and the
+#     next read decodes again. invalidate() drops entries explicitly.
+#   - Bound: least recently used entries are evicted once the decoded frames
+#     exceed FRAME_CACHE_MAX_BYTES. A table bigger than the whole budget is
+#     served without being cached.
+#
+# read_frame() has the same signature and result as utils.lake_read_parquet(),
+# so it can be passed wherever a reader is accepted (e.g. load_features(reader=...)).
+
+FRAME_CACHE_MAX_BYTES = 512 * 1024 ** 2
+
+_entries = OrderedDict()    # path -> (signature, frame, n_bytes), least recently used first
+_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0, 'bytes': 0}
+
+
+def read_frame(data_path, start_date=None, end_date=None, columns=None) -> pd.DataFrame:
+    """
+    Cached lake_read_parquet(): a DatetimeIndex-ed slice of a lake table.
+    The returned frame is a copy and may be modified freely.
+    """
+    frame = _cached_table(data_path)
+    if frame.empty:
+        return frame.copy()
+
+    mask = pd.Series(True, index=frame.index)
+    if start_date:
+        mask &= frame.index >= pd.to_datetime(start_date)
+    if end_date:
+        mask &= frame.index <= pd.to_datetime(end_date)
+    sliced = frame[mask.to_numpy()]
+
+    if columns is not None:
+        sliced = sliced[[col for col in columns if col != 'Date']]
+    return sliced.copy()
+
+
+def invalidate(data_path=None) -> None:
+    """Drops one table from the cache, or every table when data_path is None."""
+    with _lock:
+        paths = list(_entries) if data_path is None else [data_path]
+        for path in paths:
+            if path in _entries:
+                _drop(path)
+                _stats['invalidations'] += 1
+
+
+def cache_stats() -> dict:
+    """Counters for sizing the cache: hits, misses, evictions, invalidations, entries, bytes, max_bytes."""
+    with _lock:
+        return {**_stats, 'entries': len(_entries), 'max_bytes': FRAME_CACHE_MAX_BYTES}
+
+
+# ==========================================
+# PRIVATE: Entries
+# ==========================================
+
+def _cached_table(data_path):
+    signature = _signature(data_path)
+    with _lock:
+        entry = _entries.get(data_path)
+        if entry is not None and entry[0] == signature:
+            _entries.move_to_end(data_path)
+            _stats['hits'] += 1
+            return entry[1]
+        if entry is not None:
+            _drop(data_path)                # Files changed on disk since it was decoded
+            _stats['invalidations'] += 1
+        _stats['misses'] += 1
+
+    # Concurrent misses on the same table version share one decode
+    frame = single_flight(('frame', data_path, signature), lambda: lake_read_parquet(data_path))
+    n_bytes = int(frame.memory_usage(index=True, deep=True).sum())
+    if n_bytes > FRAME_CACHE_MAX_BYTES:
+        return frame
+
+    with _lock:
+        if data_path in _entries:
+            _drop(data_path)
+        _entries[data_path] = (signature, frame, n_bytes)
+        _stats['bytes'] += n_bytes
+        while _stats['bytes'] > FRAME_CACHE_MAX_BYTES:
+            _drop(next(iter(_entries)))
+            _stats['evictions'] += 1
+    return frame
+
+
+def _drop(data_path):
+    _, _, n_bytes = _entries.pop(data_path)
+    _stats['bytes'] -= n_bytes
+
+
+def _signature(data_path):
+    signature = []
+    for file_path in partition_files(data_path):
+        stat = os.stat(file_path)
+        signature.append((os.path.basename(file_path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
@@ -0,0 +1,113 @@
+import uuid
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# ==========================================
+# BACKGROUND JOBS
+# ==========================================
+# Pipeline runs (price/news fetches, LLM scoring, backtests) take minutes, so
+# the API hands them to a bounded worker pool and answers with a job id right
+# away. A job moves queued -> running -> succeeded / failed; clients poll it
+# by id and fetch the result once it has finished.
+#
+# At most JOB_MAX_WORKERS jobs run at once; up to JOB_MAX_PENDING more wait in
+# the queue. The JOB_HISTORY most recently submitted finished jobs are kept
+# for polling; older ones are forgotten.
+
+JOB_MAX_WORKERS = 4
+JOB_MAX_PENDING = 100
+JOB_HISTORY = 500
+
+_jobs = {}                 # job_id -> job record, in submission order
+_lock = threading.Lock()
+_pool = ThreadPoolExecutor(max_workers=JOB_MAX_WORKERS, thread_name_prefix="job")
+
+
+class JobQueueFull(RuntimeError):
+    """Raised by submit_job() when JOB_MAX_PENDING jobs are already waiting."""
+
+
+def submit_job(kind, fn, params=None) -> str:
+    """
+    Queues fn() on the worker pool.
+
+    Args:
+        kind:   Label for the job (e.g. 'backtest', 'compare').
+        fn:     Zero-argument callable; its return value becomes the job result.
+        params: JSON-serializable request parameters, echoed back on status.
+
+    Returns:
+        The job id.
+    """
+    job_id = uuid.uuid4().hex
+    with _lock:
+        pending = sum(1 for job in _jobs.values() if job['status'] == 'queued')
+        if pending >= JOB_MAX_PENDING:
+            raise JobQueueFull(f"{pending} jobs are already queued. Try again later.")
+
+        _jobs[job_id] = {
+            'job_id': job_id,
+            'kind': kind,
+            'status': 'queued',
+            'params': params or {},
+            'submitted_at': _now(),
+            'started_at': None,
+            'finished_at': None,
+            'error': None,
+            'result': None,
+        }
+
+    _pool.submit(_run_job, job_id, fn)
+    return job_id
+
+
+def get_job(job_id):
+    """Status view of a job (everything but the result), or None if unknown."""
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is None:
+            return None
+        return {key: value for key, value in job.items() if key != 'result'}
+
+
+def get_job_result(job_id):
+    """(status view, result) of a job; result is None until the job has succeeded."""
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is None:
+            return None, None
+        return {key: value for key, value in job.items() if key != 'result'}, job['result']
+
+
+# ==========================================
+# PRIVATE: Worker
+# ==========================================
+
+def _run_job(job_id, fn):
+    _update(job_id, status='running', started_at=_now())
+    try:
+        result = fn()
+    except Exception as e:
+        print(f"[jobs] Job {job_id} failed: {type(e).__name__}: {e}")
+        _update(job_id, status='failed', finished_at=_now(), error=str(e) or type(e).__name__)
+    else:
+        _update(job_id, status='succeeded', finished_at=_now(), result=result)
+    _prune()
+
+
+def _update(job_id, **fields):
+    with _lock:
+        _jobs[job_id].update(fields)
+
+
+def _prune():
+    """Forgets the oldest finished jobs beyond JOB_HISTORY."""
+    with _lock:
+        finished = [job_id for job_id, job in _jobs.items() if job['finished_at'] is not None]
+        for job_id in finished[:max(0, len(finished) - JOB_HISTORY)]:
+            del _jobs[job_id]
+
+
+def _now():
+    return datetime.now().isoformat(timespec='seconds')
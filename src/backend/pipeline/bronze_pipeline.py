@@ -1,8 +1,11 @@
 import os
 import pandas as pd
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from backend import config
 from backend.data_processor.fetcher_utils import get_fetch_range
-from backend.data_processor.prices_fetcher import fetch_data, store_prices
-from backend.data_processor.news_fetcher import fetch_news, store_news
+from backend.data_processor.prices_fetcher import fetch_data, fetch_data_batch, store_prices
+from backend.data_processor.news_fetcher import ingest_news, NewsIngestError
 
 
 DEFAULT_START = "2019-01-01"
@@ -24,13 +27,88 @@ def update_bronze_pipeline(ticker: str, interval: str = "daily", default_start:
     _update_news(ticker, interval, default_start)
 
 
+def update_bronze_prices_bulk(tickers: list[str] | None = None, interval: str = "daily",
+                              default_start: str = DEFAULT_START, batch_size: int = 20,
+                              max_workers: int = 8, fetch_fn=fetch_data_batch) -> list[str]:
+    """
+    Brings bronze prices up to date for a whole universe of tickers at once.
+
+    Tickers are grouped by the fetch start returned from get_fetch_range(), so
+    every batch shares one date range. Batches are downloaded through a bounded
+    thread pool and each result is fanned out to store_prices() as it arrives.
+
+    Args:
+        tickers:    Symbols to refresh. Defaults to config.TICKERS
+                    (see load_universe() for reading a universe file).
+        batch_size: Max tickers per download request.
+        max_workers: Max concurrent download requests.
+        fetch_fn:   fetch_fn(tickers, start_date) -> dict[ticker -> DataFrame].
+                    Defaults to Yahoo Finance; pass a local stand-in for testing.
+
+    Returns:
+        The tickers that received new rows.
+    """
+    tickers = tickers or config.TICKERS
+    print(f"\n--- BRONZE BULK PRICES: {len(tickers)} tickers ---")
+
+    # Group by delta start so one request can serve many tickers
+    groups = defaultdict(list)
+    for ticker in tickers:
+        fetch_start, is_current = get_fetch_range(_prices_path(ticker, interval), date_col='Date', default_start=default_start)
+        if is_current:
+            print(f"[{ticker}] Prices are already up to date.")
+            continue
+        groups[fetch_start].append(ticker)
+
+    batches = [
+        (fetch_start, group[i:i + batch_size])
+        for fetch_start, group in groups.items()
+        for i in range(0, len(group), batch_size)
+    ]
+
+    updated = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(fetch_fn, batch, fetch_start): batch for fetch_start, batch in batches}
+
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                frames = future.result()
+            except Exception as e:
+                print(f"[ERROR] Price batch {batch} failed: {e}")
+                continue
+
+            # Each ticker writes its own lake path, so fan-out is independent per ticker
+            for ticker in batch:
+                new_data = frames.get(ticker)
+                if new_data is None or new_data.empty:
+                    print(f"[{ticker}] No new price data available.")
+                    continue
+                store_prices(new_data, ticker, interval)
+                updated.append(ticker)
+
+    print(f"Bulk price refresh complete. {len(updated)}/{len(tickers)} tickers updated.")
+    return updated
+
+
+def load_universe(universe_path: str) -> list[str]:
+    """Reads a universe file: one ticker per line, blank lines and '#' comments ignored."""
+    with open(universe_path) as f:
+        lines = [line.split('#', 1)[0].strip() for line in f]
+    return [line.upper() for line in lines if line]
+
+
 # ==========================================
 # PRIVATE: Per-source update functions
 # ==========================================
 
+def _prices_path(ticker: str, interval: str) -> str:
+    return f"../../../data/bronze/{ticker}/{interval}/data.parquet"
+
+
 def _update_prices(ticker: str, interval: str, default_start: str) -> None:
     """Fetches and stores the OHLCV delta for a ticker."""
-    data_path = f"../../../data/bronze/{ticker}/{interval}/data.parquet"
+    data_path = _prices_path(ticker, interval)
     fetch_start, is_current = get_fetch_range(data_path, date_col='Date', default_start=default_start)
 
     if is_current:
@@ -59,10 +137,14 @@ def _update_news(ticker: str, interval: str, default_start: str) -> None:
         print(f"[{ticker}] News is already up to date.")
         return
 
-    new_news = fetch_news(ticker, start_date=fetch_start)
-
-    if new_news.empty:
-        print(f"[{ticker}] No new news available.")
+    # Windowed + paginated: a first-time backfill from default_start isn't truncated,
+    # and pages are stored as they arrive instead of held in memory
+    try:
+        fetched = ingest_news(ticker, interval, start_date=fetch_start)
+    except NewsIngestError as e:
+        # Rolled back to the failed window: the next run retries from there
+        print(f"[ERROR] {e}")
         return
 
-    store_news(new_news, ticker, interval)
\ No newline at end of file
+    if fetched == 0:
+        print(f"[{ticker}] No new news available.")
\ No newline at end of file
@@ -0,0 +1,70 @@
+import threading
+from contextlib import contextmanager
+from concurrent.futures import Future
+
+# ==========================================
+# PIPELINE COORDINATION
+# ==========================================
+# Concurrent pipeline runs inside one process (e.g. API jobs) share the lake:
+#   - single_flight(): identical in-flight runs execute once; every caller
+#     that arrives while it runs waits for it and gets the same result (or
+#     the same exception). Callers must treat a shared result as read-only.
+#   - ticker_lock(): one writer at a time per (ticker, interval), so two
+#     different runs on the same ticker never write its bronze / silver /
+#     gold files at the same moment. The second run then finds the lake up
+#     to date and only fetches what is still missing.
+# Both are in-process: separate processes (universe workers, a second API
+# server) are not coordinated.
+
+_flights = {}                     # key -> Future of the running computation
+_flights_guard = threading.Lock()
+
+_locks = {}                       # (ticker, interval) -> RLock
+_locks_guard = threading.Lock()
+
+
+def single_flight(key, fn):
+    """
+    Runs fn() once per key at a time. Callers with the same key that arrive
+    while it is running wait for that run and share its outcome.
+
+    Args:
+        key: Hashable identity of the computation, e.g. ('compare', ticker, interval, start, end).
+        fn:  Zero-argument callable.
+    """
+    with _flights_guard:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = Future()
+
+    if not leader:
+        print(f"[coordination] Joining in-flight run {key}")
+        return flight.result()
+
+    try:
+        result = fn()
+    except BaseException as e:
+        flight.set_exception(e)
+        raise
+    else:
+        flight.set_result(result)
+        return result
+    finally:
+        with _flights_guard:
+            del _flights[key]
+
+
+@contextmanager
+def ticker_lock(ticker, interval):
+    """Serializes lake writers for one (ticker, interval). Re-entrant within a thread."""
+    with _locks_guard:
+        lock = _locks.setdefault((ticker.upper(), interval), threading.RLock())
+
+    if not lock.acquire(blocking=False):
+        print(f"[{ticker}] Waiting for another pipeline run on {ticker} ({interval}) to finish...")
+        lock.acquire()
+    try:
+        yield
+    finally:
+        lock.release()
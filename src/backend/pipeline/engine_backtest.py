@@ -3,181 +3,141 @@ import pandas as pd
 import numpy as np
 import json
 import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from backend.trading_strategy.registry import get_strategy, STRATEGIES
 from backend.utils import lake_read_parquet
+from backend.pipeline.metrics import scorecard, equity_curves, trade_ledger
 
 def extract_trade_log(df):
     """
     Scans the vectorized backtest DataFrame, groups the 1s and 0s into 
     discrete trades, and calculates the win rate and average profit.
+
+    Trades come from position transitions and every per-trade figure is an
+    array reduction over all trades at once (see metrics.trade_ledger).
     """
-    pos = df['Position'].fillna(0)
-    changes = pos.diff()
-    
-    # Grab the exact dates from the Index where changes happen
-    entries = df[changes == 1].index
-    exits = df[changes == -1].index
-    
-    # Force-close any open positions at the end of the dataset
-    if len(entries) > len(exits):
-        exits = exits.append(pd.Index([df.index[-1]]))
-        
-    trade_ledger = []
-    for entry_date, exit_date in zip(entries, exits):
-        
-        # Calculate compounded return for this specific holding period
-        trade_returns = df.loc[entry_date:exit_date, 'Strategy_Return']
-        trade_profit = (1 + trade_returns).prod() - 1
-        
-        # Calculate holding period (Calendar Days vs Trading Days)
-        calendar_days = (exit_date - entry_date).days
-        trading_days = df.index.get_loc(exit_date) - df.index.get_loc(entry_date)
-        
-        trade_ledger.append({
-            'Entry_Date': entry_date,
-            'Exit_Date': exit_date,
-            'Trading_Days': trading_days,
-            'Calendar_Days': calendar_days,
-            'Return': trade_profit
-        })
-
-    return pd.DataFrame(trade_ledger)
-
-def compute_insights(df, ticker):
-    """Calculates performance metrics and returns them as a dictionary, along with the trade ledger."""
-
-    # Calculate Returns
-    df['Asset_Return'] = df['Adj Close'].pct_change()
-    df['Strategy_Return'] = df['Asset_Return'] * df['Position']
-    
-    # Calculate Equity Curves
-    df['Asset_Equity'] = (1 + df['Asset_Return']).cumprod().fillna(1.0)
-    df['Strategy_Equity'] = (1 + df['Strategy_Return']).cumprod().fillna(1.0)
-
-    # CALCULATE DRAWDOWN
-    df['Peak'] = df['Strategy_Equity'].cummax()
-    df['Drawdown'] = (df['Strategy_Equity'] - df['Peak']) / df['Peak']
-    max_dd = float(df['Drawdown'].min())
-
-    # CALCULATE SHARPE RATIO
-    daily_rets = df['Strategy_Return'].fillna(0)
-    if daily_rets.std() != 0:
-        sharpe = float((daily_rets.mean() / daily_rets.std()) * (252**0.5))
-    else:
-        sharpe = 0.0
-    
-    now = pd.Timestamp.now().strftime('%Y-%m-%d')
-    start_date = df.index[0]
-    end_date = df.index[-1]
-    total_asset_return = df['Asset_Equity'].iloc[-1] - 1
-    total_strategy_return = df['Strategy_Equity'].iloc[-1] - 1
-
-    # Generate the Trade Log
-    trades_df = extract_trade_log(df)
-
-    # Calculate the Holy Grail Metrics
-    if len(trades_df) > 0:
-
-        winning_trades = trades_df[trades_df['Return'] > 0]
-        losing_trades = trades_df[trades_df['Return'] <= 0]
-
-        metrics = {
-            "Simulation_Date": now,
-            "Ticker": ticker,
-            "Start_Date": start_date.strftime('%Y-%m-%d'),
-            "End_Date": end_date.strftime('%Y-%m-%d'),
-            "Total_Trading_Days": int(len(df)),
-            "Total_Trades_Taken": int(len(trades_df)),
-            "Buy_Hold_Return": float(total_asset_return),
-            "Strategy_Return": float(total_strategy_return),
-            "Performance_Delta": float(total_strategy_return - total_asset_return),
-            "Win_Rate": float(len(winning_trades) / len(trades_df)),
-            "Max_Drawdown": max_dd,
-            "Sharpe_Ratio": sharpe,
-            "Average_Win": float(winning_trades['Return'].mean()) if not winning_trades.empty else 0.0,
-            "Average_Loss": float(losing_trades['Return'].mean()) if not losing_trades.empty else 0.0,
-            "Best_Trade": float(trades_df['Return'].max()),
-            "Worst_Trade": float(trades_df['Return'].min())
-        }
-        
-        print(f"\n=== TRADE LOG SUMMARY ===")
-        print(f"Start Date:         {metrics["Start_Date"]}")
-        print(f"End Date:           {metrics["End_Date"]}")
-        print(f"Total Trading Days: {len(df)}")
-        print(f"Total Trades Taken: {len(trades_df)}")
-        print(f"Win Rate:           {metrics["Win_Rate"]:.2%}")
-        print(f"Max Drawdown:       {metrics['Max_Drawdown']:.2%}")
-        print(f"Sharpe Ratio:       {metrics['Sharpe_Ratio']:.2f}")
-        print(f"Average Win:        {metrics["Average_Win"]:.2%}")
-        print(f"Average Loss:       {metrics["Average_Loss"]:.2%}")
-        print(f"Best Trade:         {trades_df['Return'].max():.2%}")
-        print(f"Worst Trade:        {trades_df['Return'].min():.2%}")
-        print("=========================\n")
-
-        print(f"=== {ticker} BASELINE BACKTEST RESULTS ===")
-        print(f"Total Trading Days: {len(df)}")
-        print(f"Buy & Hold Return:  {total_asset_return:.2%}")
-        print(f"Strategy Return:    {total_strategy_return:.2%}")
-        print(f"Performance Delta:  {(total_strategy_return - total_asset_return):.2%}")
-        print("=========================================\n")    
-
-        return metrics, df
-    
-    else:
-        print("\n[!] No trades executed during this period.")
-        return None, df
+    ledger = trade_ledger(df['Strategy_Return'].to_numpy(dtype=float), df['Position'].to_numpy(dtype=float))
+    if ledger.empty:
+        return pd.DataFrame()
+
+    entries = ledger['Entry'].to_numpy()
+    exits = ledger['Exit'].to_numpy()
+
+    # Calculate holding period (Calendar Days vs Trading Days)
+    entry_dates = df.index[entries]
+    exit_dates = df.index[exits]
+
+    return pd.DataFrame({
+        'Entry_Date': entry_dates,
+        'Exit_Date': exit_dates,
+        'Trading_Days': exits - entries,
+        'Calendar_Days': (exit_dates - entry_dates).days,
+        'Return': ledger['Return'].to_numpy(),
+    })
+
+def compute_insights(df, ticker, materialize=False, verbose=False):
+    """
+    Calculates performance metrics and returns them as a dictionary, along with the DataFrame.
 
-   
+    All metrics come from one pass of the scorecard kernel (metrics.py).
+    Args:
+        materialize: add the Asset/Strategy return, equity, Peak and Drawdown
+                     columns to df (needed for gold datasets and charts)
+        verbose:     print the trade log summary and results report
+    """
+    asset_returns = df['Adj Close'].pct_change().to_numpy()
+    positions = df['Position'].to_numpy(dtype=float)
+    strategy_returns = asset_returns * positions
+
+    card = scorecard(strategy_returns, positions, benchmark_returns=asset_returns).iloc[0]
+
+    if materialize:
+        equity, peak, drawdown = equity_curves(strategy_returns)
+        df['Asset_Return'] = asset_returns
+        df['Strategy_Return'] = strategy_returns
+        df['Asset_Equity'] = equity_curves(asset_returns)[0][:, 0]
+        df['Strategy_Equity'] = equity[:, 0]
+        df['Peak'] = peak[:, 0]
+        df['Drawdown'] = drawdown[:, 0]
+
+    if card['Total_Trades_Taken'] == 0:
+        if verbose:
+            print("\n[!] No trades executed during this period.")
+        return None, df
 
-def run_backtest(ticker, strategy_name="baseline", interval="daily", start_date="2020-01-01", end_date=None):
-    """Executes the backtest and outputs performance metrics."""
+    metrics = {
+        "Simulation_Date": pd.Timestamp.now().strftime('%Y-%m-%d'),
+        "Ticker": ticker,
+        "Start_Date": df.index[0].strftime('%Y-%m-%d'),
+        "End_Date": df.index[-1].strftime('%Y-%m-%d'),
+        "Total_Trading_Days": int(len(df)),
+        "Total_Trades_Taken": int(card['Total_Trades_Taken']),
+        **{key: float(card[key]) for key in [
+            "Buy_Hold_Return", "Strategy_Return", "Performance_Delta", "Win_Rate", "Max_Drawdown",
+            "Sharpe_Ratio", "Average_Win", "Average_Loss", "Best_Trade", "Worst_Trade",
+        ]},
+    }
+
+    if verbose:
+        _print_report(metrics, ticker)
+
+    return metrics, df
+
+def _print_report(metrics, ticker):
+    print(f"\n=== TRADE LOG SUMMARY ===")
+    print(f"Start Date:         {metrics['Start_Date']}")
+    print(f"End Date:           {metrics['End_Date']}")
+    print(f"Total Trading Days: {metrics['Total_Trading_Days']}")
+    print(f"Total Trades Taken: {metrics['Total_Trades_Taken']}")
+    print(f"Win Rate:           {metrics['Win_Rate']:.2%}")
+    print(f"Max Drawdown:       {metrics['Max_Drawdown']:.2%}")
+    print(f"Sharpe Ratio:       {metrics['Sharpe_Ratio']:.2f}")
+    print(f"Average Win:        {metrics['Average_Win']:.2%}")
+    print(f"Average Loss:       {metrics['Average_Loss']:.2%}")
+    print(f"Best Trade:         {metrics['Best_Trade']:.2%}")
+    print(f"Worst Trade:        {metrics['Worst_Trade']:.2%}")
+    print("=========================\n")
+
+    print(f"=== {ticker} BASELINE BACKTEST RESULTS ===")
+    print(f"Total Trading Days: {metrics['Total_Trading_Days']}")
+    print(f"Buy & Hold Return:  {metrics['Buy_Hold_Return']:.2%}")
+    print(f"Strategy Return:    {metrics['Strategy_Return']:.2%}")
+    print(f"Performance Delta:  {metrics['Performance_Delta']:.2%}")
+    print("=========================================\n")
 
-    # Setup the 3 distinct output file paths
-    gold_dir = f"../../data/gold/{ticker}/{interval}/{strategy_name}"
-    os.makedirs(gold_dir, exist_ok=True)
-
-    dataset_path = f"{gold_dir}/{strategy_name}_dataset.parquet"
-    trades_path = f"{gold_dir}/{strategy_name}_trades.parquet"
-    metrics_path = f"{gold_dir}/{strategy_name}_metrics.json"
-    silver_path = f"../../data/silver/{ticker}/{interval}/data.parquet"
+   
 
-    if not os.path.exists(silver_path):
-        print(f"[{ticker}] No silver data found. Run Silver Pipeline first.")
+def run_backtest(ticker, strategy_name="baseline", interval="daily", start_date="2020-01-01", end_date=None, columns=None,
+                 verbose=False, reader=lake_read_parquet):
+    """
+    Executes the backtest and outputs performance metrics.
+    columns optionally restricts which silver features are read (date range and
+    columns are both pushed down to the parquet reader).
+    verbose prints the metrics report.
+    reader reads silver (see load_features()).
+    """
+    df = load_features(ticker, interval, start_date, end_date, columns, reader=reader)
+    if df is None:
         return
-    
-    if not start_date:
-        start_date = "2020-01-01"
-    if not end_date:
-        end_date = pd.Timestamp.now().strftime('%Y-%m-%d')
-
-    # Read features df
-    df = lake_read_parquet(silver_path, start_date=start_date, end_date=end_date)
 
     if len(df) > 0:
-        # Get and apply the strategy function to generate signals and positions
-        strategy_fn = get_strategy(strategy_name)
-        df = strategy_fn(df)
-
-        # Compute metrics
-        metrics_dict, trades_df = compute_insights(df, ticker)
-        
-        # Save outputs
-        df.reset_index().to_parquet(dataset_path, index=False, engine='pyarrow') # Timeseries
-
-        if not trades_df.empty:
-            trades_df.to_parquet(trades_path, index=False, engine='pyarrow') # Trade logs
-            
-        with open(metrics_path, "w") as f:
-            json.dump(metrics_dict, f, indent=4) # Simulation results
-    
+        df, metrics_dict, trades_df = run_strategy(df, strategy_name, ticker, verbose=verbose)
+        write_gold(df, trades_df, metrics_dict, ticker, interval, strategy_name)
     else:
         print("No data found to process.")
-    
+
     return df
 
-def run_all_strategies(ticker, interval="daily", start_date="2020-01-01", end_date=None):
+def run_all_strategies(ticker, interval="daily", start_date="2020-01-01", end_date=None, max_workers=None,
+                       reader=lake_read_parquet):
     """
     Runs every registered strategy against the same silver dataset.
+
+    Silver is read once and every strategy receives the same frame (strategies
+    copy before adding columns, so it is effectively read-only). Strategies run
+    concurrently and return their metrics in memory; gold files are written by
+    a separate pool as each strategy finishes and are all flushed before returning.
+    reader reads silver (see load_features()).
  
     Returns:
         results   : dict[strategy_name -> DataFrame]  (signal + equity columns)
@@ -185,24 +145,99 @@ def run_all_strategies(ticker, interval="daily", start_date="2020-01-01", end_da
     """
     results   = {}
     summaries = {}
- 
-    for strategy_name in STRATEGIES:
-        print(f"\n[{ticker}] Running strategy: {strategy_name}")
-        df = run_backtest(
-            ticker        = ticker,
-            strategy_name = strategy_name,
-            interval      = interval,
-            start_date    = start_date,
-            end_date      = end_date,
-        )
- 
-        if df is not None and not df.empty:
+
+    features_df = load_features(ticker, interval, start_date, end_date, reader=reader)
+    if features_df is None:
+        return results, summaries
+    if features_df.empty:
+        print("No data found to process.")
+        return results, summaries
+
+    max_workers = max_workers or len(STRATEGIES)
+    with ThreadPoolExecutor(max_workers=max_workers) as strategy_pool, \
+         ThreadPoolExecutor(max_workers=max_workers) as writer_pool:
+        futures = {}
+        for strategy_name in STRATEGIES:
+            print(f"[{ticker}] Running strategy: {strategy_name}")
+            futures[strategy_pool.submit(run_strategy, features_df, strategy_name, ticker)] = strategy_name
+
+        writes = []
+        for future in as_completed(futures):
+            strategy_name = futures[future]
+            try:
+                df, metrics_dict, trades_df = future.result()
+            except Exception as e:
+                print(f"[ERROR] Strategy '{strategy_name}' failed for {ticker}: {e}")
+                continue
+
             results[strategy_name] = df
- 
-            # Read the metrics JSON that run_backtest just wrote to disk
-            metrics_path = f"../../data/gold/{ticker}/{interval}/{strategy_name}/{strategy_name}_metrics.json"
-            if os.path.exists(metrics_path):
-                with open(metrics_path) as f:
-                    summaries[strategy_name] = json.load(f)
- 
-    return results, summaries
\ No newline at end of file
+            if metrics_dict is not None:
+                summaries[strategy_name] = metrics_dict
+            writes.append(writer_pool.submit(write_gold, df, trades_df, metrics_dict, ticker, interval, strategy_name))
+
+        # Gold must be on disk before callers hand out its paths
+        for write in writes:
+            write.result()
+
+    # Keep the registry order regardless of completion order
+    results   = {name: results[name] for name in STRATEGIES if name in results}
+    summaries = {name: summaries[name] for name in STRATEGIES if name in summaries}
+    return results, summaries
+
+
+# ==========================================
+# BUILDING BLOCKS: Silver loading, strategy execution, gold writes
+# ==========================================
+
+def load_features(ticker, interval, start_date, end_date, columns=None, reader=lake_read_parquet):
+    """
+    Reads the silver slice for a backtest, or None if silver doesn't exist yet.
+    reader(path, start_date, end_date, columns) does the read: the default decodes
+    from disk, the API passes frame_cache.read_frame to serve hot tickers from memory.
+    """
+    silver_path = f"../../data/silver/{ticker}/{interval}/data.parquet"
+
+    if not os.path.exists(silver_path):
+        print(f"[{ticker}] No silver data found. Run Silver Pipeline first.")
+        return None
+
+    if not start_date:
+        start_date = "2020-01-01"
+    if not end_date:
+        end_date = pd.Timestamp.now().strftime('%Y-%m-%d')
+
+    return reader(silver_path, start_date=start_date, end_date=end_date, columns=columns)
+
+def run_strategy(features_df, strategy_name, ticker, materialize=True, verbose=False):
+    """
+    Applies one strategy to a features frame and scores it. Pure in-memory:
+    returns (df, metrics_dict, trades_df) and never touches the lake.
+
+    materialize=False skips the equity/drawdown columns and the trade ledger
+    (trades_df comes back empty) when only the metrics are needed.
+    """
+    strategy_fn = get_strategy(strategy_name)
+    df = strategy_fn(features_df)
+
+    metrics_dict, df = compute_insights(df, ticker, materialize=materialize, verbose=verbose)
+    trades_df = extract_trade_log(df) if materialize else pd.DataFrame()
+    return df, metrics_dict, trades_df
+
+def write_gold(df, trades_df, metrics_dict, ticker, interval, strategy_name):
+    """Writes the three gold outputs for one strategy run."""
+    gold_dir = f"../../data/gold/{ticker}/{interval}/{strategy_name}"
+    os.makedirs(gold_dir, exist_ok=True)
+
+    dataset_path = f"{gold_dir}/{strategy_name}_dataset.parquet"
+    trades_path = f"{gold_dir}/{strategy_name}_trades.parquet"
+    metrics_path = f"{gold_dir}/{strategy_name}_metrics.json"
+
+    df.reset_index().to_parquet(dataset_path, index=False, engine='pyarrow') # Timeseries
+
+    if not trades_df.empty:
+        trades_df.to_parquet(trades_path, index=False, engine='pyarrow') # Trade logs
+    elif os.path.exists(trades_path):
+        os.remove(trades_path) # No trades this run: don't leave a previous run's ledger behind
+
+    with open(metrics_path, "w") as f:
+        json.dump(metrics_dict, f, indent=4) # Simulation results
@@ -0,0 +1,151 @@
+import os
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from backend.utils import lake_read_parquet
+from backend.pipeline.metrics import scorecard
+
+# ==========================================
+# VECTORIZED PARAMETER SWEEPS
+# ==========================================
+# Evaluates a whole grid of parameters for one strategy on one silver dataset.
+# Positions are built as a (time x parameter set) NumPy matrix and scored
+# column-wise, so there are no per-combination DataFrame copies or gold writes.
+
+SWEEP_CHUNK_SIZE = 500    # Parameter sets scored per block (bounds memory at T x chunk floats)
+SWEEP_MAX_WORKERS = min(8, os.cpu_count() or 1)   # NumPy releases the GIL, so blocks score in parallel
+
+
+def sweep_strategy(ticker, strategy_name="baseline", grid=None, interval="daily",
+                   start_date="2020-01-01", end_date=None, chunk_size=SWEEP_CHUNK_SIZE,
+                   max_workers=SWEEP_MAX_WORKERS):
+    """
+    Sweeps a parameter grid for a registered strategy over one silver dataset.
+
+    Args:
+        grid: {param: values}, expanded to the cartesian product, e.g.
+              {"rsi_lower": range(10, 60), "rsi_upper": range(50, 100)}.
+              Defaults to the strategy's own grid in SWEEPS.
+
+    Returns:
+        DataFrame with one row per parameter set: the parameters plus
+        Strategy_Return, Sharpe_Ratio, Max_Drawdown and Total_Trades,
+        sorted by Sharpe_Ratio (best first).
+    """
+    positions_fn, columns, default_grid = get_sweep(strategy_name)
+    silver_path = f"../../data/silver/{ticker}/{interval}/data.parquet"
+
+    if not os.path.exists(silver_path):
+        print(f"[{ticker}] No silver data found. Run Silver Pipeline first.")
+        return pd.DataFrame()
+
+    if not end_date:
+        end_date = pd.Timestamp.now().strftime('%Y-%m-%d')
+
+    df = lake_read_parquet(silver_path, start_date=start_date or "2020-01-01", end_date=end_date, columns=columns)
+    if df.empty:
+        print("No data found to process.")
+        return pd.DataFrame()
+
+    params = expand_grid(grid or default_grid)
+    print(f"[{ticker}] Sweeping {len(params)} parameter sets for '{strategy_name}' over {len(df)} bars...")
+    return sweep_frame(df, strategy_name, params, chunk_size=chunk_size, max_workers=max_workers)
+
+
+def sweep_frame(df, strategy_name, params, chunk_size=SWEEP_CHUNK_SIZE, max_workers=SWEEP_MAX_WORKERS):
+    """
+    Scores every parameter set in params (DataFrame, one row per set) on an
+    already-loaded features frame. Used by sweep_strategy and walk-forward folds.
+    """
+    positions_fn, _, _ = get_sweep(strategy_name)
+    returns = asset_returns(df)
+
+    def score_chunk(start):
+        chunk = params.iloc[start:start + chunk_size]
+        positions = positions_fn(df, {name: chunk[name].to_numpy() for name in chunk.columns})
+        return score_positions(returns, positions)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        blocks = list(pool.map(score_chunk, range(0, len(params), chunk_size)))
+
+    results = pd.concat([params.reset_index(drop=True), pd.concat(blocks, ignore_index=True)], axis=1)
+    return results.sort_values('Sharpe_Ratio', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def expand_grid(grid):
+    """{param: values} -> DataFrame of every combination, one row per parameter set."""
+    names = list(grid)
+    return pd.DataFrame(list(itertools.product(*(list(grid[name]) for name in names))), columns=names)
+
+
+# ==========================================
+# POSITION BUILDERS (time x parameter set)
+# ==========================================
+
+def positions_baseline(df, params):
+    """
+    Matrix form of generate_signals_baseline: long below rsi_lower, flat above
+    rsi_upper, hold in between, traded on the next bar.
+    """
+    rsi = df['RSI'].to_numpy(dtype=float)[:, None]
+    signal = np.full((len(rsi), len(params['rsi_lower'])), np.nan)
+    signal[rsi < params['rsi_lower'][None, :]] = 1.0
+    signal[rsi > params['rsi_upper'][None, :]] = 0.0   # Exit wins when both fire, as in the baseline
+
+    positions = _ffill_columns(signal, fill_value=0.0)
+    return _shift_down(positions, fill_value=0.0)
+
+
+# strategy name -> (position builder, silver columns it needs, default grid)
+SWEEPS = {
+    "baseline": (
+        positions_baseline,
+        ["Adj Close", "RSI"],
+        {"rsi_lower": range(15, 50, 5), "rsi_upper": range(55, 90, 5)},
+    ),
+}
+
+
+def get_sweep(name: str):
+    if name not in SWEEPS:
+        raise ValueError(f"No sweep defined for strategy '{name}'. Available: {list(SWEEPS.keys())}")
+    return SWEEPS[name]
+
+
+def asset_returns(df):
+    """Close-to-close returns of 'Adj Close' as an array, first bar 0 (as compute_insights fills it)."""
+    close = df['Adj Close'].to_numpy(dtype=float)
+    returns = np.zeros_like(close)
+    returns[1:] = close[1:] / close[:-1] - 1
+    return returns
+
+
+def score_positions(asset_returns, positions):
+    """
+    Scorecard for each column of a (time x N) positions matrix against one
+    asset return series (first return already 0): Strategy_Return,
+    Sharpe_Ratio, Max_Drawdown, Total_Trades (metrics.scorecard definitions).
+    """
+    card = scorecard(asset_returns[:, None] * positions, positions, trade_stats=False)
+    return card[['Strategy_Return', 'Sharpe_Ratio', 'Max_Drawdown', 'Total_Trades_Taken']].rename(
+        columns={'Total_Trades_Taken': 'Total_Trades'})
+
+
+# ==========================================
+# PRIVATE: Matrix helpers
+# ==========================================
+
+def _ffill_columns(matrix, fill_value=0.0):
+    """Forward-fills NaNs down each column; leading NaNs become fill_value."""
+    rows = np.arange(len(matrix), dtype=np.int32)[:, None]
+    last_valid = np.maximum.accumulate(np.where(np.isnan(matrix), -1, rows), axis=0)
+    filled = np.take_along_axis(matrix, np.maximum(last_valid, 0), axis=0)
+    return np.where(last_valid >= 0, filled, fill_value)
+
+
+def _shift_down(matrix, fill_value=0.0):
+    shifted = np.empty_like(matrix)
+    shifted[:1] = fill_value
+    shifted[1:] = matrix[:-1]
+    return shifted
@@ -0,0 +1,197 @@
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# SCORECARD KERNEL
+# ==========================================
+# Every scorecard metric for N strategies (or parameter sets, or bootstrap
+# paths) in one vectorized pass over a (time x N) matrix of per-bar returns.
+# Definitions are the ones compute_insights reports:
+#   - NaN returns count as 0 (flat), equity = cumprod(1 + r)
+#   - Max_Drawdown against the running peak (starting capital 1.0 counts as a peak)
+#   - Sharpe_Ratio = mean / std (ddof=1) * sqrt(periods_per_year), 0 when std is 0
+#   - Trades pair the n-th entry (position 0 -> 1) with the n-th exit (1 -> 0),
+#     force-closing a position still open on the last bar
+# Nothing is added to any DataFrame: callers materialize curves only if they
+# need them (see equity_curves()).
+
+PERIODS_PER_YEAR = 252
+
+
+def scorecard(strategy_returns, positions=None, benchmark_returns=None,
+              periods_per_year=PERIODS_PER_YEAR, trade_stats=True) -> pd.DataFrame:
+    """
+    Scores every column of a returns matrix.
+
+    Args:
+        strategy_returns:  (T x N) per-bar returns (a 1-D array is one strategy)
+        positions:         (T x N) positions; enables trade metrics
+        benchmark_returns: (T,) benchmark (buy & hold) returns; adds
+                           Buy_Hold_Return and Performance_Delta
+        trade_stats:       also compute the per-trade metrics from the ledger
+                           (Win_Rate, Average_Win/Loss, Best/Worst_Trade);
+                           Total_Trades_Taken alone only needs counts
+
+    Returns:
+        DataFrame with one row per column.
+    """
+    returns = np.nan_to_num(_as_matrix(strategy_returns), nan=0.0)
+    n_bars, n_cols = returns.shape
+
+    final_return, max_drawdown = _final_return_and_max_drawdown(returns)
+    card = {
+        'Strategy_Return': final_return,
+        'Max_Drawdown': max_drawdown,
+        'Sharpe_Ratio': _sharpe(returns, periods_per_year),
+    }
+
+    if benchmark_returns is not None:
+        benchmark = np.nan_to_num(np.asarray(benchmark_returns, dtype=float), nan=0.0)
+        card['Buy_Hold_Return'] = np.full(n_cols, np.prod(1 + benchmark) - 1)
+        card['Performance_Delta'] = card['Strategy_Return'] - card['Buy_Hold_Return']
+
+    if positions is not None:
+        if trade_stats:
+            card.update(_trade_stats(trade_ledger(returns, positions), n_cols))
+        else:
+            card['Total_Trades_Taken'] = _trade_counts(_as_matrix(positions))
+
+    return pd.DataFrame(card)
+
+
+def equity_curves(strategy_returns):
+    """(equity, peak, drawdown) matrices for a (T x N) returns matrix, NaN returns as 0."""
+    returns = np.nan_to_num(_as_matrix(strategy_returns), nan=0.0)
+    equity = np.cumprod(1 + returns, axis=0)
+    peak = np.maximum.accumulate(np.maximum(equity, 1.0), axis=0)
+    return equity, peak, (equity - peak) / peak
+
+
+def trade_ledger(strategy_returns, positions) -> pd.DataFrame:
+    """
+    Trades of every column at once.
+
+    Returns:
+        DataFrame ordered by (Column, Entry): Column, Entry and Exit (row
+        positions), and Return (compounded strategy return over Entry..Exit,
+        inclusive; 0 for an exit paired before its entry).
+    """
+    returns = np.nan_to_num(_as_matrix(strategy_returns), nan=0.0)
+    pos = np.nan_to_num(_as_matrix(positions), nan=0.0).T          # (N x T), rows = columns
+    n_cols, n_bars = pos.shape
+    changes = np.diff(pos, axis=1, prepend=np.nan)
+
+    entry_col, entry_row = np.nonzero(changes == 1)
+    exit_col, exit_row = np.nonzero(changes == -1)
+
+    # Force-close columns with more entries than exits at the last bar
+    n_entries = np.bincount(entry_col, minlength=n_cols)
+    n_exits = np.bincount(exit_col, minlength=n_cols)
+    forced = np.flatnonzero(n_entries > n_exits)
+    exit_col = np.concatenate([exit_col, forced])
+    exit_row = np.concatenate([exit_row, np.full(len(forced), n_bars - 1)])
+    order = np.argsort(exit_col, kind='stable')
+    exit_col, exit_row = exit_col[order], exit_row[order]
+    n_exits[forced] += 1
+
+    # Pair by rank within the column; unmatched extras are dropped
+    n_trades = np.minimum(n_entries, n_exits)
+    keep_entry = _rank_in_column(entry_col, n_entries) < n_trades[entry_col]
+    keep_exit = _rank_in_column(exit_col, n_exits) < n_trades[exit_col]
+    columns, entries = entry_col[keep_entry], entry_row[keep_entry]
+    exits = exit_row[keep_exit]
+
+    # Compounded returns: one reduceat over the column-major factors (trailing 1.0 keeps bounds valid)
+    factors = np.append((1 + returns).T.ravel(), 1.0)
+    valid = entries <= exits
+    trade_returns = np.zeros(len(entries))
+    if valid.any():
+        offset = columns[valid] * n_bars
+        bounds = np.column_stack([offset + entries[valid], offset + exits[valid] + 1]).ravel()
+        trade_returns[valid] = np.multiply.reduceat(factors, bounds)[::2] - 1
+
+    return pd.DataFrame({'Column': columns, 'Entry': entries, 'Exit': exits, 'Return': trade_returns})
+
+
+# ==========================================
+# PRIVATE: Reductions
+# ==========================================
+
+def _as_matrix(values):
+    values = np.asarray(values, dtype=float)
+    return values[:, None] if values.ndim == 1 else values
+
+
+def _final_return_and_max_drawdown(returns):
+    """
+    The two equity_curves() reductions the scorecard needs, computed in place
+    in two (T x N) scratch arrays instead of materializing all three curves.
+    """
+    n_bars, n_cols = returns.shape
+    if not n_bars:
+        return np.zeros(n_cols), np.zeros(n_cols)
+
+    equity = np.add(returns, 1.0)
+    np.cumprod(equity, axis=0, out=equity)
+    final_return = equity[-1] - 1
+
+    peak = np.maximum.accumulate(equity, axis=0)
+    np.maximum(peak, 1.0, out=peak)
+    np.subtract(equity, peak, out=equity)
+    np.divide(equity, peak, out=equity)
+    return final_return, equity.min(axis=0)
+
+
+def _sharpe(returns, periods_per_year):
+    if len(returns) < 2:
+        return np.zeros(returns.shape[1])
+    std = returns.std(axis=0, ddof=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(std != 0, returns.mean(axis=0) / std * np.sqrt(periods_per_year), 0.0)
+
+
+def _rank_in_column(cols, counts):
+    """Position of each item within its column, for items sorted by column."""
+    first = np.cumsum(counts) - counts
+    return np.arange(len(cols)) - first[cols]
+
+
+def _trade_counts(positions):
+    """Number of paired trades per column, without building the ledger."""
+    pos = np.nan_to_num(positions, nan=0.0)
+    changes = np.diff(pos, axis=0, prepend=np.nan)
+    n_entries = (changes == 1).sum(axis=0)
+    n_exits = (changes == -1).sum(axis=0)
+    n_exits = n_exits + (n_entries > n_exits)   # force-close at the last bar
+    return np.minimum(n_entries, n_exits).astype(int)
+
+
+def _trade_stats(ledger, n_cols):
+    """Per-column trade metrics from a ledger, via grouped reductions."""
+    cols = ledger['Column'].to_numpy()
+    rets = ledger['Return'].to_numpy()
+    wins = rets > 0
+
+    n_trades = np.bincount(cols, minlength=n_cols)
+    n_wins = np.bincount(cols, weights=wins, minlength=n_cols)
+    n_losses = n_trades - n_wins
+    win_sum = np.bincount(cols, weights=np.where(wins, rets, 0.0), minlength=n_cols)
+    loss_sum = np.bincount(cols, weights=np.where(wins, 0.0, rets), minlength=n_cols)
+
+    best = np.full(n_cols, np.nan)
+    worst = np.full(n_cols, np.nan)
+    traded = np.flatnonzero(n_trades)
+    if len(traded):
+        starts = (np.cumsum(n_trades) - n_trades)[traded]
+        best[traded] = np.maximum.reduceat(rets, starts)
+        worst[traded] = np.minimum.reduceat(rets, starts)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return {
+            'Total_Trades_Taken': n_trades,
+            'Win_Rate': np.where(n_trades > 0, n_wins / n_trades, np.nan),
+            'Average_Win': np.where(n_wins > 0, win_sum / n_wins, 0.0),
+            'Average_Loss': np.where(n_losses > 0, loss_sum / n_losses, 0.0),
+            'Best_Trade': best,
+            'Worst_Trade': worst,
+        }
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+from backend.pipeline.metrics import scorecard
+
+# ==========================================
+# MONTE CARLO ROBUSTNESS
+# ==========================================
+# Resamples a backtest thousands of times as matrix operations and reports
+# confidence intervals instead of point estimates:
+#   - 'block'  : circular block bootstrap of daily strategy returns (keeps
+#                short-range autocorrelation). CIs for return, Sharpe, drawdown.
+#   - 'trades' : shuffles the order of the trade ledger's returns. Total return
+#                is order-independent, so this isolates path risk (drawdown).
+# Paths are processed in chunks so memory stays bounded at MC_CHUNK_PATHS x T.
+#
+# Cost is dominated by scoring the paths (cumprod, running peak, std per path):
+# 10,000 block-bootstrap paths over ~1,300 daily bars take ~0.5-0.6 s on one
+# core. /compare pays that once per strategy.
+
+MC_PATHS = 10000
+MC_BLOCK_SIZE = 20         # ~1 trading month per block
+MC_CONFIDENCE = 0.90       # Two-sided interval, e.g. 5th..95th percentile
+MC_CHUNK_PATHS = 2000
+
+
+def monte_carlo_returns(daily_returns, n_paths=MC_PATHS, block_size=MC_BLOCK_SIZE,
+                        confidence=MC_CONFIDENCE, seed=None) -> dict:
+    """
+    Block-bootstraps daily strategy returns (e.g. the gold 'Strategy_Return' column).
+
+    Returns:
+        {'Method', 'Paths', 'Block_Size', 'Confidence',
+         'Strategy_Return' / 'Sharpe_Ratio' / 'Max_Drawdown': {'Lower', 'Median', 'Upper'}}
+    """
+    returns = pd.Series(daily_returns).fillna(0).to_numpy(dtype=float)
+    if len(returns) < 2:
+        return {}
+
+    rng = np.random.default_rng(seed)
+    block_size = max(1, min(block_size, len(returns)))
+    n_blocks = -(-len(returns) // block_size)
+
+    # Every circular block once (T x block_size); a path is n_blocks random rows of it, cut to T
+    blocks = returns[(np.arange(len(returns))[:, None] + np.arange(block_size)) % len(returns)]
+
+    scores = []
+    for n in _chunks(n_paths):
+        starts = rng.integers(0, len(returns), size=(n, n_blocks))
+        paths = blocks[starts].reshape(n, -1)[:, :len(returns)]
+        scores.append(_score_paths(paths, sharpe=True))
+
+    summary = _intervals(pd.concat(scores, ignore_index=True), confidence)
+    return {'Method': 'block', 'Paths': int(n_paths), 'Block_Size': int(block_size),
+            'Confidence': confidence, **summary}
+
+
+def monte_carlo_trades(trade_returns, n_paths=MC_PATHS, confidence=MC_CONFIDENCE, seed=None) -> dict:
+    """
+    Shuffles the order of per-trade returns (e.g. the gold trade ledger's 'Return').
+
+    Returns:
+        {'Method', 'Paths', 'Confidence',
+         'Strategy_Return' / 'Max_Drawdown': {'Lower', 'Median', 'Upper'}}
+    """
+    returns = pd.Series(trade_returns).dropna().to_numpy(dtype=float)
+    if len(returns) < 2:
+        return {}
+
+    rng = np.random.default_rng(seed)
+    scores = []
+    for n in _chunks(n_paths):
+        # One independent permutation per path: argsort of uniform noise
+        order = np.argsort(rng.random((n, len(returns))), axis=1)
+        scores.append(_score_paths(returns[order], sharpe=False))
+
+    summary = _intervals(pd.concat(scores, ignore_index=True), confidence)
+    return {'Method': 'trades', 'Paths': int(n_paths), 'Confidence': confidence, **summary}
+
+
+# ==========================================
+# PRIVATE: Path scoring
+# ==========================================
+
+def _chunks(n_paths):
+    full, rest = divmod(int(n_paths), MC_CHUNK_PATHS)
+    return [MC_CHUNK_PATHS] * full + ([rest] if rest else [])
+
+
+def _score_paths(paths, sharpe=True):
+    """Scores a (paths x T) returns matrix with the scorecard kernel: one row per path."""
+    card = scorecard(paths.T)
+    return card if sharpe else card.drop(columns='Sharpe_Ratio')
+
+
+def _intervals(scores, confidence):
+    tail = (1 - confidence) / 2
+    quantiles = scores.quantile([tail, 0.5, 1 - tail])
+    return {
+        metric: {label: float(value) for label, value in zip(['Lower', 'Median', 'Upper'], quantiles[metric])}
+        for metric in scores.columns
+    }
@@ -1,41 +1,65 @@
 from .bronze_pipeline import update_bronze_pipeline
 from .silver_pipeline import update_silver_pipeline
 from .engine_backtest import run_backtest, run_all_strategies
+from .coordination import single_flight, ticker_lock
+from backend.utils import lake_read_parquet
 
-def run_full_pipeline(ticker, strategy_name, interval, start_date, end_date):
-    """Single-strategy pipeline. Used internally by run_comparison_pipeline."""
-    print("\n--- STEP 1: BRONZE DATA ---")
-    update_bronze_pipeline(ticker, interval)
- 
-    print("\n--- STEP 2: SILVER FEATURES ---")
-    update_silver_pipeline(ticker, interval)
- 
-    print(f"\n--- STEP 3: BACKTEST ({strategy_name.upper()}) ---")
-    return run_backtest(ticker, strategy_name, interval, start_date, end_date)
- 
- 
-def run_comparison_pipeline(ticker, interval, start_date, end_date):
+# Identical concurrent calls share one run (single_flight), and runs on the
+# same (ticker, interval) take turns writing the lake (ticker_lock).
+# See coordination.py.
+
+def run_full_pipeline(ticker, strategy_name, interval, start_date, end_date, verbose=False, reader=lake_read_parquet):
+    """
+    Single-strategy pipeline. verbose prints the backtest metrics report.
+    reader reads silver for the backtest (see engine_backtest.load_features()).
+    """
+    key = ("backtest", ticker.upper(), strategy_name, interval, start_date, end_date)
+    return single_flight(key, lambda: _run_full_pipeline(ticker, strategy_name, interval, start_date, end_date,
+                                                         verbose, reader))
+
+
+def run_comparison_pipeline(ticker, interval, start_date, end_date, reader=lake_read_parquet):
     """
     Runs bronze + silver once, then executes every registered strategy.
     Returns (results, summaries) — see run_all_strategies() for shape.
+    reader reads silver for the backtests (see engine_backtest.load_features()).
     """
-    print(f"\n{'='*50}")
-    print(f"  COMPARISON PIPELINE — {ticker.upper()}")
-    print(f"{'='*50}")
- 
-    print("\n--- STEP 1: BRONZE DATA ---")
-    update_bronze_pipeline(ticker, interval)
- 
-    print("\n--- STEP 2: SILVER FEATURES ---")
-    update_silver_pipeline(ticker, interval)
- 
-    print("\n--- STEP 3: ALL STRATEGIES ---")
-    results, summaries = run_all_strategies(
-        ticker     = ticker,
-        interval   = interval,
-        start_date = start_date,
-        end_date   = end_date,
-    )
- 
+    key = ("compare", ticker.upper(), interval, start_date, end_date)
+    return single_flight(key, lambda: _run_comparison_pipeline(ticker, interval, start_date, end_date, reader))
+
+
+def _run_full_pipeline(ticker, strategy_name, interval, start_date, end_date, verbose, reader):
+    with ticker_lock(ticker, interval):
+        print("\n--- STEP 1: BRONZE DATA ---")
+        update_bronze_pipeline(ticker, interval)
+
+        print("\n--- STEP 2: SILVER FEATURES ---")
+        update_silver_pipeline(ticker, interval)
+
+        print(f"\n--- STEP 3: BACKTEST ({strategy_name.upper()}) ---")
+        return run_backtest(ticker, strategy_name, interval, start_date, end_date, verbose=verbose, reader=reader)
+
+
+def _run_comparison_pipeline(ticker, interval, start_date, end_date, reader):
+    with ticker_lock(ticker, interval):
+        print(f"\n{'='*50}")
+        print(f"  COMPARISON PIPELINE — {ticker.upper()}")
+        print(f"{'='*50}")
+
+        print("\n--- STEP 1: BRONZE DATA ---")
+        update_bronze_pipeline(ticker, interval)
+
+        print("\n--- STEP 2: SILVER FEATURES ---")
+        update_silver_pipeline(ticker, interval)
+
+        print("\n--- STEP 3: ALL STRATEGIES ---")
+        results, summaries = run_all_strategies(
+            ticker     = ticker,
+            interval   = interval,
+            start_date = start_date,
+            end_date   = end_date,
+            reader     = reader,
+        )
+
     print(f"\n[{ticker}] Comparison complete. Strategies run: {list(results.keys())}")
-    return results, summaries
\ No newline at end of file
+    return results, summaries
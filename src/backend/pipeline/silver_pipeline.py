@@ -1,31 +1,61 @@
 import os
+import json
 import pandas as pd
+import pyarrow.dataset as ds
 pd.set_option('future.no_silent_downcasting', True)
-from backend.utils import calculate_lookback_date
-from backend.data_processor.indicators import apply_indicators
+from backend.data_processor.indicators import (
+    INDICATORS, apply_indicators, indicator_signature, indicator_columns,
+    init_indicator_state, advance_indicators,
+)
 from backend.data_processor.sentiment import compute_sentiment_feature
+from backend.data_processor.fetcher_utils import (
+    read_partitioned, read_schema, last_recorded_date, upsert_parquet, write_partitioned,
+)
 
+SENTIMENT_FEATURE = "Sentiment"
 
-def _merge_sentiment(processing_df: pd.DataFrame, ticker: str, interval: str, since_date=None) -> pd.DataFrame:
+
+def _merge_sentiment(processing_df: pd.DataFrame, ticker: str, interval: str, since_date=None,
+                     backend: str = "llm") -> pd.DataFrame:
     """
     Scores and merges sentiment into processing_df.
-    Extracted as a helper so both the normal path and the schema-backfill
+    Extracted as a helper so both the normal path and the feature-backfill
     path can call it without duplicating logic.
     """
-    sentiment_df = compute_sentiment_feature(ticker, interval, since_date=since_date)
-    processing_df = processing_df.join(sentiment_df, how='left')
+    sentiment_df = compute_sentiment_feature(ticker, interval, since_date=since_date, backend=backend)
+    if sentiment_df.empty:
+        processing_df['Sentiment'] = 0.0
+        return processing_df
+
+    processing_df = processing_df.join(sentiment_df, on='Date', how='left')
     processing_df['Sentiment'] = processing_df['Sentiment'].ffill().fillna(0.0)
     return processing_df
 
 
-def update_silver_pipeline(ticker: str, interval: str = "daily", lookback_days: int = 60) -> None:
+def update_silver_pipeline(ticker: str, interval: str = "daily", sentiment_backend: str = "llm") -> None:
     """
-    Reads bronze data, calculates indicators with lookback-safe priming,
-    scores sentiment (delta only), and upserts into the silver data lake.
+    Reads bronze data, calculates indicators, scores sentiment (delta only),
+    and upserts into the silver data lake.
+
+    Incremental runs are O(new bars): silver persists the streaming state of
+    every indicator (indicator_state.json: trailing windows for SMA/RSI, last
+    values for EMA/MACD), reads only the bronze rows after the last silver
+    date, and advances the state with them. Results match a full recompute.
+
+    sentiment_backend picks the scorer for this run ('llm' or the offline
+    'lexicon'), so bulk backfills can run fast now and be re-scored later.
+
+    Silver keeps a feature manifest (features.json) recording which feature
+    columns have been materialized and with which parameters. When the
+    registry in indicators.py (or the sentiment backend) changes, only the
+    missing or re-parameterized features are computed over the existing date
+    range and merged in. Nothing else is recomputed or re-scored.
     """
-    bronze_path = f"../../../data/bronze/{ticker}/{interval}/data.parquet"
-    silver_dir  = f"../../../data/silver/{ticker}/{interval}"
-    silver_path = f"{silver_dir}/data.parquet"
+    bronze_path   = f"../../../data/bronze/{ticker}/{interval}/data.parquet"
+    silver_dir    = f"../../../data/silver/{ticker}/{interval}"
+    silver_path   = f"{silver_dir}/data.parquet"
+    manifest_path = f"{silver_dir}/features.json"
+    state_path    = f"{silver_dir}/indicator_state.json"
 
     os.makedirs(silver_dir, exist_ok=True)
 
@@ -33,53 +63,193 @@ def update_silver_pipeline(ticker: str, interval: str = "daily", lookback_days:
         print(f"[{ticker}] Bronze data not found at {bronze_path}. Run bronze pipeline first.")
         return
 
-    raw_df = pd.read_parquet(bronze_path, engine='pyarrow')
-    raw_df['Date'] = pd.to_datetime(raw_df['Date'])
+    required = _required_signatures(sentiment_backend)
+
+    # Footer metadata only — the existing silver rows are never loaded here.
+    # No schema means no partition files (e.g. an interrupted first write): rebuild.
+    silver_schema = read_schema(silver_path)
 
     # ── INCREMENTAL PATH ───────────────────────────────────────────────────────
-    if os.path.exists(silver_path):
-        features_df = pd.read_parquet(silver_path, engine='pyarrow')
-        features_df['Date'] = pd.to_datetime(features_df['Date'])
-        last_feature_date = features_df['Date'].iloc[-1]
+    if silver_schema is not None:
+        silver_columns = set(silver_schema.names)
+        last_feature_date = last_recorded_date(silver_path, date_col='Date')
+
+        # ── FEATURE CHANGE DETECTION ───────────────────────────────────────────
+        # Compare the materialized features against the registry, per feature
+        manifest = _load_manifest(manifest_path, silver_columns)
+        stale   = [name for name, signature in required.items() if manifest.get(name, {}).get('signature') != signature]
+        dropped = [name for name in manifest if name not in required]
+
+        history_df = None
+        if stale or dropped:
+            history_df = _read_bronze(bronze_path)
+            manifest = _backfill_features(history_df, silver_path, manifest, stale, dropped,
+                                          ticker, interval, sentiment_backend)
+            _save_manifest(manifest_path, manifest)
+
+        # ── INDICATOR STATE ────────────────────────────────────────────────────
+        # Missing or stale state (first run after an upgrade, or changed features)
+        # is primed once from the bronze history up to the last silver date
+        state = _load_indicator_state(state_path, last_feature_date)
+        if state is None:
+            print(f"[{ticker}] Priming indicator state from bronze history...")
+            if history_df is None:
+                history_df = _read_bronze(bronze_path)
+            state = init_indicator_state(history_df[history_df['Date'] <= last_feature_date])
+
+        # Only the bronze rows after the last silver date are read
+        new_bars = _read_bronze(bronze_path, after=last_feature_date)
+        if new_bars.empty:
+            print(f"[{ticker}] Silver is already up to date.")
+            _save_indicator_state(state_path, state, last_feature_date)
+            return
+
+        print(f"[{ticker}] Updating features for {len(new_bars)} new bars since {last_feature_date.strftime('%Y-%m-%d')}...")
+        new_features, state = advance_indicators(new_bars, state)
+
+        # Normal incremental: only score sentiment for genuinely new dates
+        new_features = _merge_sentiment(new_features, ticker, interval, since_date=last_feature_date, backend=sentiment_backend)
+
+        # Append-only: the upsert rewrites just the partition(s) the new rows land in
+        total_rows = upsert_parquet(new_features, silver_path, date_col='Date')
+        _save_indicator_state(state_path, state, new_features['Date'].max())
+        print(f"[{ticker}] Silver updated. Total rows: {total_rows}")
+        return
 
-        # Calculate the priming start date, accounting for crypto vs equity calendars
-        prime_date, asset_class = calculate_lookback_date(ticker, last_feature_date, lookback_days)
-        print(f"[{ticker}] ({asset_class}) Updating features from {prime_date.strftime('%Y-%m-%d')}...")
+    # ── FIRST RUN PATH ─────────────────────────────────────────────────────────
+    print(f"[{ticker}] No existing silver data. Calculating full history...")
+    raw_df = _read_bronze(bronze_path)
+    processing_df = apply_indicators(raw_df.copy())
+    processing_df = _merge_sentiment(processing_df, ticker, interval, since_date=None, backend=sentiment_backend)
 
-        processing_df = raw_df[raw_df['Date'] >= prime_date].copy()
-        processing_df = apply_indicators(processing_df)
+    # Drop NaN rows produced by the indicator warmup window (e.g. first 22 days for RSI)
+    combined_df = processing_df.dropna(subset=['RSI'])
 
-        # ── SCHEMA CHANGE DETECTION ────────────────────────────────────────────
-        # If indicators added new columns, backfill the entire history and overwrite
-        SENTIMENT_COLS = {'Sentiment'}
-        if set(processing_df.columns) - SENTIMENT_COLS != set(features_df.columns) - SENTIMENT_COLS:
-            print(f"[{ticker}] Schema change detected. Backfilling full history...")
-            processing_df = apply_indicators(raw_df.copy())
+    # ── SAVE (full rebuild) ────────────────────────────────────────────────────
+    combined_df = combined_df.drop_duplicates(subset=['Date'], keep='last')
+    combined_df = combined_df.sort_values(by='Date').reset_index(drop=True)
+    total_rows = write_partitioned(combined_df, silver_path, date_col='Date')
+    _save_manifest(manifest_path, _manifest_entries(required))
+    _save_indicator_state(state_path, init_indicator_state(raw_df), raw_df['Date'].max())
 
-            # Sentiment: score everything since no existing silver scores are valid
-            processing_df = _merge_sentiment(processing_df, ticker, interval, since_date=None)
+    print(f"[{ticker}] Silver updated. Total rows: {total_rows}")
 
-            combined_df = processing_df.dropna(subset=['RSI'])
 
-        else:
-            # Normal incremental: only score sentiment for genuinely new dates
-            processing_df = _merge_sentiment(processing_df, ticker, interval, since_date=last_feature_date)
+# ==========================================
+# PRIVATE: Bronze reads + indicator state
+# ==========================================
 
-            new_features = processing_df[processing_df['Date'] > last_feature_date]
-            combined_df = pd.concat([features_df, new_features])
+def _read_bronze(bronze_path: str, after=None) -> pd.DataFrame:
+    """Reads bronze prices, optionally only rows after a date (pushed down to the parquet reader)."""
+    date_filter = ds.field('Date') > pd.to_datetime(after) if after is not None else None
+    raw_df = read_partitioned(bronze_path, filter=date_filter)
+    if not raw_df.empty:
+        raw_df['Date'] = pd.to_datetime(raw_df['Date'])
+        raw_df = raw_df.sort_values(by='Date').reset_index(drop=True)
+    return raw_df
 
-    # ── FIRST RUN PATH ─────────────────────────────────────────────────────────
-    else:
-        print(f"[{ticker}] No existing silver data. Calculating full history...")
-        processing_df = apply_indicators(raw_df.copy())
-        processing_df = _merge_sentiment(processing_df, ticker, interval, since_date=None)
 
-        # Drop NaN rows produced by the indicator warmup window (e.g. first 22 days for RSI)
-        combined_df = processing_df.dropna(subset=['RSI'])
+def _load_indicator_state(state_path: str, last_feature_date) -> dict | None:
+    """Returns the saved state if it is current (same as-of date, same indicator signatures)."""
+    if not os.path.exists(state_path):
+        return None
+    with open(state_path) as f:
+        saved = json.load(f)
 
-    # ── SAVE ───────────────────────────────────────────────────────────────────
-    combined_df = combined_df.drop_duplicates(subset=['Date'], keep='last')
-    combined_df = combined_df.sort_values(by='Date').reset_index(drop=True)
-    combined_df.to_parquet(silver_path, index=False, engine='pyarrow')
+    if pd.to_datetime(saved.get('as_of')) != pd.to_datetime(last_feature_date):
+        return None
+    state = saved.get('indicators', {})
+    if {name: entry.get('signature') for name, entry in state.items()} != {name: indicator_signature(name) for name in INDICATORS}:
+        return None
+    return state
+
+
+def _save_indicator_state(state_path: str, state: dict, as_of) -> None:
+    tmp_path = f"{state_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({'as_of': pd.to_datetime(as_of).strftime('%Y-%m-%d %H:%M:%S'), 'indicators': state}, f, indent=4)
+    os.replace(tmp_path, state_path)
+
+
+# ==========================================
+# PRIVATE: Feature manifest + per-column backfill
+# ==========================================
+
+def _required_signatures(sentiment_backend: str) -> dict:
+    """{feature name: signature} for every feature silver should contain."""
+    required = {name: indicator_signature(name) for name in INDICATORS}
+    required[SENTIMENT_FEATURE] = f"sentiment(backend={sentiment_backend})"
+    return required
 
-    print(f"[{ticker}] Silver updated. Total rows: {len(combined_df)}")
\ No newline at end of file
+
+def _feature_columns(name: str) -> list[str]:
+    return [SENTIMENT_FEATURE] if name == SENTIMENT_FEATURE else indicator_columns(name)
+
+
+def _manifest_entries(signatures: dict) -> dict:
+    return {name: {'signature': signature, 'columns': _feature_columns(name)} for name, signature in signatures.items()}
+
+
+def _load_manifest(manifest_path: str, silver_columns: set) -> dict:
+    """
+    Loads the feature manifest. Silver written before manifests existed gets
+    one inferred from its columns: indicators whose columns are all present
+    are assumed current. An existing Sentiment column is recorded with an
+    unknown signature, so it is dropped and re-scored once.
+    """
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            return json.load(f)
+
+    inferred = {name: indicator_signature(name) for name in INDICATORS
+                if set(indicator_columns(name)) <= silver_columns}
+    manifest = _manifest_entries(inferred)
+    if SENTIMENT_FEATURE in silver_columns:
+        manifest[SENTIMENT_FEATURE] = {'signature': None, 'columns': [SENTIMENT_FEATURE]}
+    return manifest
+
+
+def _save_manifest(manifest_path: str, manifest: dict) -> None:
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=4)
+    os.replace(tmp_path, manifest_path)
+
+
+def _backfill_features(raw_df: pd.DataFrame, silver_path: str, manifest: dict, stale: list, dropped: list,
+                       ticker: str, interval: str, sentiment_backend: str) -> dict:
+    """
+    Computes only the stale features over the full bronze history, merges them
+    into the existing silver rows (same date range), and drops removed features.
+
+    Returns:
+        The updated manifest.
+    """
+    print(f"[{ticker}] Feature change detected. Computing {stale or 'nothing'}, dropping {dropped or 'nothing'}...")
+    features_df = read_partitioned(silver_path)
+    features_df['Date'] = pd.to_datetime(features_df['Date'])
+
+    # Old columns of re-parameterized or removed features go first. Stale features
+    # also drop their registry columns, in case the manifest didn't record them.
+    manifest = dict(manifest)
+    for name in stale + dropped:
+        old_columns = manifest.pop(name, {}).get('columns', [])
+        if name in stale:
+            old_columns = old_columns + _feature_columns(name)
+        features_df = features_df.drop(columns=old_columns, errors='ignore')
+
+    # Indicators: one pass over bronze for just the stale ones, joined on Date
+    stale_indicators = [name for name in stale if name in INDICATORS]
+    if stale_indicators:
+        computed = apply_indicators(raw_df.copy(), names=stale_indicators)
+        new_columns = [col for name in stale_indicators for col in indicator_columns(name)]
+        features_df = features_df.merge(computed[['Date'] + new_columns], on='Date', how='left')
+
+    if SENTIMENT_FEATURE in stale:
+        features_df = _merge_sentiment(features_df, ticker, interval, since_date=None, backend=sentiment_backend)
+
+    write_partitioned(features_df, silver_path, date_col='Date')
+
+    required = _required_signatures(sentiment_backend)
+    manifest.update(_manifest_entries({name: required[name] for name in stale}))
+    return manifest
@@ -0,0 +1,153 @@
+import os
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from backend import config
+from backend.trading_strategy.registry import STRATEGIES, get_strategy
+from backend.pipeline.engine_backtest import load_features, run_strategy, write_gold
+
+# ==========================================
+# MULTI-TICKER UNIVERSE BACKTESTS
+# ==========================================
+# One task per ticker: a worker process reads that ticker's silver slice once
+# and runs every requested strategy on it. Tasks only carry a ticker name and
+# settings, so nothing large is pickled between processes. Each worker
+# reads its inputs straight from the lake.
+
+PROGRESS_EVERY = 10   # Progress line every N finished tickers
+WORKER_RETRIES = 1    # Pool restarts a ticker rides through before it is retried on its own
+
+# A worker dying (segfault, OOM kill) breaks the whole pool, and every pending
+# future fails with BrokenProcessPool, not just the one that was running the
+# culprit. The unfinished tickers are resubmitted to a fresh pool. Tickers
+# still caught in breaks after WORKER_RETRIES restarts run one at a time in a
+# single-worker pool, so only a ticker that kills its own worker is reported
+# as an error.
+
+
+def run_universe(tickers=None, strategies=None, interval="daily", start_date="2020-01-01", end_date=None,
+                 max_workers=None, save_gold=False, verbose=False) -> pd.DataFrame:
+    """
+    Backtests tickers x strategies across a process pool (all cores by default).
+
+    A failing ticker or strategy becomes an 'error' row instead of stopping the
+    batch; a worker process dying is isolated the same way, and the tickers
+    that were pending in the broken pool are retried.
+
+    Args:
+        tickers:    Defaults to config.TICKERS.
+        strategies: Registry names. Defaults to every registered strategy.
+        save_gold:  Also write the usual gold files per (ticker, strategy).
+        verbose:    Print the per-strategy metrics report from the workers.
+
+    Returns:
+        One row per (Ticker, Strategy): Status ('ok' / 'no_trades' / 'error'),
+        Error, and the compute_insights metrics.
+    """
+    tickers = list(tickers or config.TICKERS)
+    strategies = list(strategies or STRATEGIES)
+    for strategy_name in strategies:
+        get_strategy(strategy_name)  # Fail fast on unknown names, before any process starts
+
+    max_workers = max_workers or os.cpu_count() or 1
+    print(f"\n--- UNIVERSE BACKTEST: {len(tickers)} tickers x {len(strategies)} strategies on {max_workers} workers ---")
+
+    rows = []
+    finished, failed = 0, 0
+
+    def record(ticker_rows):
+        nonlocal finished, failed
+        rows.extend(ticker_rows)
+        finished += 1
+        if any(row['Status'] == 'error' for row in ticker_rows):
+            failed += 1
+        if finished % PROGRESS_EVERY == 0 or finished == len(tickers):
+            print(f"[universe] {finished}/{len(tickers)} tickers done ({failed} with errors)")
+
+    task = (strategies, interval, start_date, end_date, save_gold, verbose)
+    restarts = dict.fromkeys(tickers, 0)
+    pending = tickers
+    while pending:
+        shared = [ticker for ticker in pending if restarts[ticker] <= WORKER_RETRIES]
+        isolated = [ticker for ticker in pending if restarts[ticker] > WORKER_RETRIES]
+
+        pending = _run_pool(shared, task, max_workers, record)
+        if pending:
+            print(f"[universe] A worker process died. Retrying {len(pending)} unfinished tickers in a new pool...")
+        for ticker in pending:
+            restarts[ticker] += 1
+
+        for ticker in isolated:
+            if _run_pool([ticker], task, 1, record):
+                record(_error_rows(ticker, strategies, "Worker process died while running this ticker"))
+
+    results = pd.DataFrame(rows)
+    if results.empty:
+        return results
+    return results.sort_values(['Ticker', 'Strategy']).reset_index(drop=True)
+
+
+# ==========================================
+# PRIVATE: Process pool + worker task
+# ==========================================
+
+def _run_pool(tickers, task, max_workers, record) -> list:
+    """
+    Runs tickers in one process pool, passing each finished ticker's rows to
+    record(). Returns the tickers left unfinished because the pool broke.
+    """
+    if not tickers:
+        return []
+
+    unfinished = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_backtest_ticker, ticker, *task): ticker for ticker in tickers}
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                ticker_rows = future.result()
+            except BrokenProcessPool:
+                unfinished.append(ticker)
+                continue
+            except Exception as e:
+                ticker_rows = _error_rows(ticker, task[0], str(e))
+            record(ticker_rows)
+    return unfinished
+
+
+def _backtest_ticker(ticker, strategies, interval, start_date, end_date, save_gold, verbose):
+    """Runs in a worker process: one silver read, every strategy, one row per strategy."""
+    rows = []
+    try:
+        features_df = load_features(ticker, interval, start_date, end_date)
+    except Exception as e:
+        return _error_rows(ticker, strategies, f"Failed to read silver: {e}")
+
+    if features_df is None:
+        return _error_rows(ticker, strategies, "No silver data found")
+    if features_df.empty:
+        return _error_rows(ticker, strategies, "No silver data in range")
+
+    for strategy_name in strategies:
+        try:
+            # Curves and ledgers are only built when gold is written
+            df, metrics_dict, trades_df = run_strategy(features_df, strategy_name, ticker,
+                                                       materialize=save_gold, verbose=verbose)
+            if save_gold:
+                write_gold(df, trades_df, metrics_dict, ticker, interval, strategy_name)
+        except Exception as e:
+            rows.append(_error_row(ticker, strategy_name, f"{type(e).__name__}: {e}"))
+            continue
+
+        status = 'ok' if metrics_dict is not None else 'no_trades'
+        rows.append({'Ticker': ticker, 'Strategy': strategy_name, 'Status': status, 'Error': None,
+                     **(metrics_dict or {})})
+    return rows
+
+
+def _error_row(ticker, strategy_name, error):
+    return {'Ticker': ticker, 'Strategy': strategy_name, 'Status': 'error', 'Error': error}
+
+
+def _error_rows(ticker, strategies, error):
+    return [_error_row(ticker, strategy_name, error) for strategy_name in strategies]
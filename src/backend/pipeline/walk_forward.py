@@ -0,0 +1,125 @@
+import os
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from backend.pipeline.engine_backtest import load_features
+from backend.pipeline.engine_sweep import get_sweep, sweep_frame, expand_grid, asset_returns, score_positions
+
+# ==========================================
+# WALK-FORWARD OPTIMIZATION
+# ==========================================
+# Features are loaded once. Folds are (start, end) row ranges over that one
+# frame: each fold sweeps the parameter grid on its in-sample rows, then trades
+# the winning parameters on the following out-of-sample rows. The out-of-sample
+# pieces are stitched into one equity curve.
+#
+# Out-of-sample positions are computed over in-sample + out-of-sample rows and
+# then cut to the out-of-sample part, so a position opened near the end of the
+# in-sample window carries over instead of being forced flat.
+
+IN_SAMPLE_BARS = 504       # ~2 trading years
+OUT_OF_SAMPLE_BARS = 63    # ~1 trading quarter
+
+
+def run_walk_forward(ticker, strategy_name="baseline", grid=None, interval="daily",
+                     start_date="2015-01-01", end_date=None, in_sample_bars=IN_SAMPLE_BARS,
+                     out_of_sample_bars=OUT_OF_SAMPLE_BARS, objective="Sharpe_Ratio", max_workers=None):
+    """
+    Rolling walk-forward optimization of a sweepable strategy (see engine_sweep.SWEEPS).
+
+    Args:
+        grid:      {param: values}; defaults to the strategy's grid in SWEEPS.
+        objective: sweep metric to maximize in-sample (e.g. 'Sharpe_Ratio', 'Strategy_Return').
+
+    Returns:
+        (folds_df, equity_df, summary)
+        folds_df  : one row per fold: row/date ranges, chosen parameters,
+                    in-sample objective and out-of-sample scorecard
+        equity_df : stitched out-of-sample Position / Strategy_Return / Strategy_Equity per date, with Fold
+        summary   : scorecard of the stitched out-of-sample curve
+    """
+    _, columns, default_grid = get_sweep(strategy_name)
+    df = load_features(ticker, interval, start_date, end_date, columns=columns)
+    if df is None:
+        return pd.DataFrame(), pd.DataFrame(), {}
+
+    folds = walk_forward_folds(len(df), in_sample_bars, out_of_sample_bars)
+    if not folds:
+        print(f"[{ticker}] Not enough data for one fold ({len(df)} bars < {in_sample_bars + out_of_sample_bars}).")
+        return pd.DataFrame(), pd.DataFrame(), {}
+
+    params = expand_grid(grid or default_grid)
+    print(f"[{ticker}] Walk-forward '{strategy_name}': {len(folds)} folds x {len(params)} parameter sets...")
+
+    # Folds are independent: in-sample sweeps run in parallel (each sweep single-threaded)
+    def optimize(fold):
+        is_start, is_end, _ = fold
+        scores = sweep_frame(df.iloc[is_start:is_end], strategy_name, params, max_workers=1)
+        return scores.sort_values(objective, ascending=False, kind='stable').head(1).to_dict('records')[0]
+
+    max_workers = max_workers or min(len(folds), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        best = list(pool.map(optimize, folds))
+
+    returns = asset_returns(df)
+    fold_rows, pieces = [], []
+    for k, ((is_start, is_end, oos_end), best_row) in enumerate(zip(folds, best)):
+        chosen = {name: best_row[name] for name in params.columns}
+        positions = _fold_positions(df, strategy_name, chosen, is_start, is_end, oos_end)
+        oos_returns = returns[is_end:oos_end]
+        oos_score = score_positions(oos_returns, positions[:, None]).to_dict('records')[0]
+
+        fold_rows.append({
+            'Fold': k,
+            'IS_Start': df.index[is_start], 'IS_End': df.index[is_end - 1],
+            'OOS_Start': df.index[is_end], 'OOS_End': df.index[oos_end - 1],
+            **chosen,
+            f'IS_{objective}': float(best_row[objective]),
+            **{f'OOS_{metric}': value for metric, value in oos_score.items()},
+        })
+        pieces.append(pd.DataFrame({
+            'Fold': k,
+            'Position': positions,
+            'Strategy_Return': oos_returns * positions,
+        }, index=df.index[is_end:oos_end]))
+
+    equity_df = pd.concat(pieces)
+    equity_df['Strategy_Equity'] = (1 + equity_df['Strategy_Return']).cumprod()
+
+    # The stitched curve is scored as one out-of-sample backtest
+    stitched = np.concatenate([returns[is_end:oos_end] for _, is_end, oos_end in folds])
+    summary = score_positions(stitched, equity_df['Position'].to_numpy()[:, None]).to_dict('records')[0]
+    summary = {'Ticker': ticker, 'Strategy': strategy_name, 'Folds': len(folds),
+               'OOS_Start': equity_df.index[0].strftime('%Y-%m-%d'),
+               'OOS_End': equity_df.index[-1].strftime('%Y-%m-%d'),
+               **summary}
+
+    print(f"[{ticker}] Walk-forward OOS return: {summary['Strategy_Return']:.2%}, Sharpe: {summary['Sharpe_Ratio']:.2f}")
+    return pd.DataFrame(fold_rows), equity_df, summary
+
+
+def walk_forward_folds(n_bars, in_sample_bars=IN_SAMPLE_BARS, out_of_sample_bars=OUT_OF_SAMPLE_BARS):
+    """
+    Rolling fold boundaries as row ranges: [(is_start, is_end, oos_end), ...].
+    In-sample is rows is_start..is_end-1, out-of-sample is is_end..oos_end-1.
+    The last fold's out-of-sample window may be shorter.
+    """
+    folds = []
+    is_start = 0
+    while is_start + in_sample_bars < n_bars:
+        is_end = is_start + in_sample_bars
+        folds.append((is_start, is_end, min(is_end + out_of_sample_bars, n_bars)))
+        is_start += out_of_sample_bars
+    return folds
+
+
+# ==========================================
+# PRIVATE: Out-of-sample positions
+# ==========================================
+
+def _fold_positions(df, strategy_name, chosen, is_start, is_end, oos_end):
+    """Positions for one parameter set over in-sample + out-of-sample rows, cut to out-of-sample."""
+    positions_fn, _, _ = get_sweep(strategy_name)
+    window = df.iloc[is_start:oos_end]
+    positions = positions_fn(window, {name: np.array([value]) for name, value in chosen.items()})
+    return positions[is_end - is_start:, 0]
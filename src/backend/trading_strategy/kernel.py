@@ -0,0 +1,221 @@
+import numpy as np
+
+# numba is in requirements.txt; without it the (much slower) NumPy backend is used
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# ==========================================
+# PATH-DEPENDENT EXECUTION KERNEL
+# ==========================================
+# Long-only bracket execution for strategies whose exits depend on the entry
+# price (take-profit, stop-loss, trailing stop). Strategies declare their
+# rules as arrays and parameters; the kernel runs the state machine:
+#
+#   - Entry on bar i when active[i] and entry_signal[i]: fills at close[i]
+#   - While holding, on every active bar (checked in this order):
+#       take_profit    (close - entry) / entry >= take_profit, fills at entry * (1 + take_profit)
+#       stop_loss      (close - entry) / entry <= -stop_loss,  fills at entry * (1 - stop_loss)
+#       trailing_stop  close <= peak * (1 - trailing_stop),    fills at that level
+#                      (peak = highest active close since entry, entry included)
+#       exit_signal    fills at close[i]
+#   - Inactive bars (e.g. indicators not ready) are skipped: no position, no
+#     return, no state change.
+#
+# Returns per-bar Position (1 while held, 0 on the exit bar) and
+# Strategy_Return (close-to-close while held, fill-to-previous-close on exit).
+
+KERNEL_BACKEND = "numba" if njit is not None else "numpy"
+
+
+def run_bracket_kernel(close, entry_signal, active=None, exit_signal=None,
+                       take_profit=None, stop_loss=None, trailing_stop=None, backend=None):
+    """
+    Runs the bracket state machine over one price series.
+
+    Args:
+        close:         prices (array-like)
+        entry_signal:  bool per bar, enter when flat
+        active:        bool per bar, bars the state machine evaluates (default: all but the first)
+        exit_signal:   optional bool per bar, discretionary exit at the close
+        take_profit / stop_loss / trailing_stop: fractions (0.02 = 2%), None disables
+        backend:       'numba' (compiled) or 'numpy'; defaults to KERNEL_BACKEND
+
+    Returns:
+        (positions, strategy_returns) as float arrays.
+    """
+    close = np.asarray(close, dtype=float)
+    n = len(close)
+    entry_signal = np.asarray(entry_signal, dtype=bool)
+    exit_signal = np.zeros(n, dtype=bool) if exit_signal is None else np.asarray(exit_signal, dtype=bool)
+    if active is None:
+        active = np.ones(n, dtype=bool)
+        active[:1] = False
+    active = np.asarray(active, dtype=bool)
+
+    # NaN disables a rule (numba-friendly stand-in for None)
+    params = tuple(np.nan if value is None else float(value) for value in (take_profit, stop_loss, trailing_stop))
+
+    backend = backend or KERNEL_BACKEND
+    if backend == "numba":
+        if njit is None:
+            raise ValueError("Kernel backend 'numba' requested but numba is not installed.")
+        return _bracket_loop_compiled(close, entry_signal, exit_signal, active, *params)
+    if backend == "numpy":
+        return _bracket_numpy(close, entry_signal, exit_signal, active, *params)
+    raise ValueError(f"Unknown kernel backend '{backend}'. Available: ['numba', 'numpy']")
+
+
+# ==========================================
+# PRIVATE: Backends
+# ==========================================
+
+def _bracket_loop(close, entry_signal, exit_signal, active, take_profit, stop_loss, trailing_stop):
+    """Reference bar-by-bar state machine (compiled with numba when available)."""
+    n = len(close)
+    positions = np.zeros(n)
+    strategy_returns = np.zeros(n)
+    in_position = False
+    entry_price = 0.0
+    peak = 0.0
+
+    for i in range(1, n):
+        if not active[i]:
+            continue
+
+        current_price = close[i]
+        prev_price = close[i - 1]
+
+        if not in_position:
+            if entry_signal[i]:
+                in_position = True
+                entry_price = current_price
+                peak = current_price
+                positions[i] = 1
+            continue
+
+        unrealized_return = (current_price - entry_price) / entry_price
+        trail_level = peak * (1 - trailing_stop)
+
+        exit_price = np.nan
+        if take_profit == take_profit and unrealized_return >= take_profit:
+            exit_price = entry_price * (1 + take_profit)
+        elif stop_loss == stop_loss and unrealized_return <= -stop_loss:
+            exit_price = entry_price * (1 - stop_loss)
+        elif trailing_stop == trailing_stop and current_price <= trail_level:
+            exit_price = trail_level
+        elif exit_signal[i]:
+            exit_price = current_price
+
+        if exit_price == exit_price:
+            in_position = False
+            strategy_returns[i] = (exit_price / prev_price) - 1
+        else:
+            positions[i] = 1
+            strategy_returns[i] = (current_price / prev_price) - 1
+            peak = max(peak, current_price)
+
+    return positions, strategy_returns
+
+
+_bracket_loop_compiled = njit(cache=True)(_bracket_loop) if njit is not None else None
+
+
+def _bracket_numpy(close, entry_signal, exit_signal, active, take_profit, stop_loss, trailing_stop):
+    """
+    NumPy backend: iterates per trade, not per bar. The next entry comes from a
+    searchsorted over candidate bars; each trade's exit is found by evaluating
+    all exit rules over a window of bars at once (the window doubles until an
+    exit is found). Holding bars are filled for all trades in one pass at the end.
+
+    It is a fallback, not a fast path. Each trade costs ~25 us of array setup,
+    so it only beats the plain Python loop (~1.6 us per bar) when trades are
+    sparse, roughly fewer than one per 20 bars. Over 5,000 bars it takes ~3 ms
+    for 28 trades but ~26 ms for 1,000 trades, where the loop takes ~8 ms. The
+    numba backend runs the same series in ~0.03 ms.
+    """
+    n = len(close)
+    positions = np.zeros(n)
+    strategy_returns = np.zeros(n)
+    candidates = np.flatnonzero(active & entry_signal)
+    candidates = candidates[candidates >= 1]
+
+    entries, exits, exit_prices = [], [], []
+    start = 1
+    while True:
+        k = np.searchsorted(candidates, start)
+        if k == len(candidates):
+            break
+        entry = candidates[k]
+        exit_bar, exit_price = _find_exit(close, exit_signal, active, entry, close[entry],
+                                          take_profit, stop_loss, trailing_stop)
+        entries.append(entry)
+        exits.append(exit_bar if exit_bar >= 0 else n)
+        exit_prices.append(exit_price)
+        if exit_bar < 0:
+            break
+        start = exit_bar + 1
+
+    if not entries:
+        return positions, strategy_returns
+    entries, exits, exit_prices = np.array(entries), np.array(exits), np.array(exit_prices)
+
+    # Holding bars: active bars strictly between each entry and its exit (or the end)
+    holding = np.zeros(n + 1, dtype=np.int64)
+    np.add.at(holding, entries + 1, 1)
+    np.add.at(holding, exits, -1)
+    held = (np.cumsum(holding[:n]) > 0) & active
+    held[0] = False
+
+    positions[entries] = 1
+    positions[held] = 1
+    held_bars = np.flatnonzero(held)
+    strategy_returns[held_bars] = (close[held_bars] / close[held_bars - 1]) - 1
+
+    closed = exits < n
+    exit_bars = exits[closed]
+    strategy_returns[exit_bars] = (exit_prices[closed] / close[exit_bars - 1]) - 1
+    return positions, strategy_returns
+
+
+def _find_exit(close, exit_signal, active, entry, entry_price, take_profit, stop_loss, trailing_stop):
+    """First active bar after entry where an exit rule fires -> (bar, fill price), or (-1, nan)."""
+    n = len(close)
+    peak = entry_price
+    lo, width = entry + 1, 16
+    while lo < n:
+        hi = min(n, lo + width)
+        prices = close[lo:hi]
+        is_active = active[lo:hi]
+        hits = exit_signal[lo:hi].copy()
+
+        unrealized = (prices - entry_price) / entry_price
+        if take_profit == take_profit:
+            hit_tp = unrealized >= take_profit
+            hits |= hit_tp
+        if stop_loss == stop_loss:
+            hit_sl = unrealized <= -stop_loss
+            hits |= hit_sl
+        if trailing_stop == trailing_stop:
+            # Peak before each bar: running max of active closes since entry
+            running = np.maximum.accumulate(np.where(is_active, prices, -np.inf))
+            trail_level = np.maximum(peak, np.concatenate(([-np.inf], running[:-1]))) * (1 - trailing_stop)
+            hit_trail = prices <= trail_level
+            hits |= hit_trail
+            peak = max(peak, running[-1])
+        hits &= is_active
+
+        if hits.any():
+            j = int(np.argmax(hits))
+            if take_profit == take_profit and hit_tp[j]:
+                return lo + j, entry_price * (1 + take_profit)
+            if stop_loss == stop_loss and hit_sl[j]:
+                return lo + j, entry_price * (1 - stop_loss)
+            if trailing_stop == trailing_stop and hit_trail[j]:
+                return lo + j, trail_level[j]
+            return lo + j, prices[j]
+
+        lo, width = hi, width * 2
+
+    return -1, np.nan
@@ -1,8 +1,10 @@
 import pandas as pd
+import pyarrow.dataset as ds
 from pandas.tseries.offsets import CustomBusinessDay
 from pandas.tseries.holiday import USFederalHolidayCalendar
 from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
+from backend.data_processor.fetcher_utils import read_partitioned
 
 def calculate_lookback_date(ticker, target_date_str, lookback_days=22):
     """
@@ -24,20 +26,30 @@ def calculate_lookback_date(ticker, target_date_str, lookback_days=22):
         
     return start_date_init, asset_class
 
-def lake_read_parquet(data_path, start_date=None, end_date=None):
-    insights_df = pd.read_parquet(data_path, engine='pyarrow')
-    insights_df['Date'] = pd.to_datetime(insights_df['Date'])
-    insights_df.set_index('Date', inplace=True)
+def lake_read_parquet(data_path, start_date=None, end_date=None, columns=None):
+    """
+    Reads a lake table as a DatetimeIndex-ed DataFrame.
 
-    if not start_date and not end_date:
+    The date range and the column list are pushed down to pyarrow, so only the
+    row groups overlapping [start_date, end_date] and only the requested
+    columns are decoded. 'Date' is always read (it becomes the index).
+    """
+    date_filter = None
+    if start_date:
+        date_filter = ds.field('Date') >= pd.to_datetime(start_date)
+    if end_date:
+        end_filter = ds.field('Date') <= pd.to_datetime(end_date)
+        date_filter = end_filter if date_filter is None else date_filter & end_filter
+
+    if columns is not None:
+        columns = ['Date'] + [col for col in columns if col != 'Date']
+
+    insights_df = read_partitioned(data_path, columns=columns, filter=date_filter)
+    if insights_df.empty:
         return insights_df
-    elif not end_date:
-        start_dt = pd.to_datetime(start_date)
-        return insights_df[insights_df.index >= start_dt]
-    else:
-        start_dt = pd.to_datetime(start_date)
-        end_dt = pd.to_datetime(end_date)
-        return insights_df[(insights_df.index >= start_dt) & (insights_df.index <= end_dt)].copy()
+
+    insights_df['Date'] = pd.to_datetime(insights_df['Date'])
+    return insights_df.set_index('Date')
 
 def plot_equity_curve(df, ticker):
     """Visualizes the backtest using the DatetimeIndex."""
@@ -1,4 +1,6 @@
+import time
 import pandas as pd
+import pyarrow as pa
 import requests
 import streamlit as st
 
@@ -7,7 +9,13 @@ from charts import build_equity_curves_chart, build_signals_chart
 # ─────────────────────────────────────────────
 # CONFIG
 # ─────────────────────────────────────────────
-API_URL = "http://localhost:8000/api/v1/compare"
+API_BASE = "http://localhost:8000"
+API_URL  = f"{API_BASE}/api/v1/compare"
+POLL_SECONDS = 2        # Job status polling interval
+JOB_MAX_WAIT_SECONDS = 600   # Give up polling a job after this long
+
+# Only the columns the charts draw are requested from each gold dataset
+CHART_COLUMNS = ["Date", "Adj Close", "Close", "Position", "SMA_20", "SMA_50", "Asset_Equity", "Strategy_Equity"]
 
 st.set_page_config(
     page_title="Quant Backtest Engine",
@@ -56,7 +64,28 @@ with st.spinner(f"Running all strategies on `{ticker.upper()}`…"):
         "end_date":   end_date.strftime("%Y-%m-%d"),
     }
     try:
-        response = requests.post(API_URL, json=payload, timeout=300)
+        # The API queues the run and answers with a job id; poll it until it finishes
+        response = requests.post(API_URL, json=payload, timeout=30)
+        if response.status_code != 202:
+            st.error(f"API Error ({response.status_code}): {response.json().get('detail', 'Unknown error.')}")
+            st.stop()
+
+        submitted = response.json()
+        status = submitted["status"]
+        deadline = time.monotonic() + JOB_MAX_WAIT_SECONDS
+        while status in ("queued", "running"):
+            if time.monotonic() >= deadline:
+                st.error(f"Job `{submitted['job_id']}` did not finish within {JOB_MAX_WAIT_SECONDS}s. Try again later.")
+                st.stop()
+            time.sleep(POLL_SECONDS)
+            response = requests.get(f"{API_BASE}{submitted['status_url']}", timeout=30)
+            if response.status_code != 200:
+                # 404: the API restarted or the job was pruned, so it will never finish
+                st.error(f"API Error ({response.status_code}): {response.json().get('detail', 'Unknown error.')}")
+                st.stop()
+            status = response.json()["status"]
+
+        response = requests.get(f"{API_BASE}{submitted['result_url']}", timeout=30)
     except requests.exceptions.ConnectionError:
         st.error(f"Could not connect to `{API_URL}`. Is the FastAPI server running?")
         st.stop()
@@ -70,14 +99,16 @@ with st.spinner(f"Running all strategies on `{ticker.upper()}`…"):
     strategy_names = list(strategies.keys())
 
 # ─────────────────────────────────────────────
-# LOAD PARQUET DATASETS
+# LOAD GOLD DATASETS  (Arrow IPC from the API)
 # ─────────────────────────────────────────────
 strategy_dfs = {}
 for name, data in strategies.items():
-    path = data.get("data_files", {}).get("dataset")
-    if path:
+    url = data.get("data_files", {}).get("dataset")
+    if url:
         try:
-            df = pd.read_parquet(path)
+            response = requests.get(f"{API_BASE}{url}", params={"columns": ",".join(CHART_COLUMNS)}, timeout=60)
+            response.raise_for_status()
+            df = pa.ipc.open_stream(response.content).read_pandas()
             if "Date" in df.columns:
                 df = df.set_index("Date")
             df.index = pd.to_datetime(df.index)
@@ -0,0 +1,46 @@
+import os
+import pytest
+
+# Lake paths are relative to the working directory: the data processors and
+# bronze/silver pipelines use ../../../data (run from src/backend/<package>),
+# the engine and API use ../../data (run from src/backend). These fixtures run
+# a test from a directory that points both at one temporary data/ tree.
+
+
+@pytest.fixture
+def lake(tmp_path, monkeypatch):
+    """cwd for the data processors and bronze/silver pipelines; returns the data/ root."""
+    cwd = tmp_path / "src" / "backend" / "pipeline"
+    cwd.mkdir(parents=True)
+    monkeypatch.chdir(cwd)
+    return tmp_path / "data"
+
+
+@pytest.fixture
+def engine_lake(tmp_path, monkeypatch):
+    """cwd for the engine and API; returns the same data/ root as `lake` would."""
+    cwd = tmp_path / "src" / "backend"
+    cwd.mkdir(parents=True)
+    monkeypatch.chdir(cwd)
+    return tmp_path / "data"
+
+
+@pytest.fixture
+def silver(engine_lake):
+    """Synthetic silver features (prices, indicators, sentiment) for ticker 'SYN'; returns the features frame."""
+    import numpy as np
+    import pandas as pd
+    from backend.data_processor.fetcher_utils import write_partitioned
+    from backend.data_processor.indicators import apply_indicators
+
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range("2020-01-01", periods=900)
+    close = 100 * np.cumprod(1 + rng.normal(0.0003, 0.015, len(dates)))
+    df = pd.DataFrame({'Date': dates, 'Ticker': "SYN", 'Open': close, 'High': close, 'Low': close,
+                       'Close': close, 'Adj Close': close, 'Volume': 1000})
+    df = apply_indicators(df)
+    df['Sentiment'] = rng.uniform(-1, 1, len(df)).round(2)
+    df = df.dropna(subset=['RSI']).reset_index(drop=True)
+
+    write_partitioned(df, "../../data/silver/SYN/daily/data.parquet", date_col='Date')
+    return df.set_index('Date')
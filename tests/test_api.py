@@ -0,0 +1,47 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("uvicorn")
+from fastapi.testclient import TestClient
+
+from backend.api import app
+from backend.data_processor.fetcher_utils import write_partitioned
+
+GOLD = "../../data/gold/ABC/daily/baseline"
+
+
+@pytest.fixture
+def client(engine_lake):
+    dates = pd.bdate_range("2024-01-01", periods=30)
+    dataset = pd.DataFrame({'Date': dates, 'Position': 1, 'Strategy_Return': 0.001, 'Asset_Equity': 1.0,
+                            'Strategy_Equity': 1.0, 'Drawdown': 0.0})
+    trades = pd.DataFrame({'Entry_Date': dates[::10], 'Exit_Date': dates[5::10], 'Trading_Days': 5,
+                           'Calendar_Days': 7, 'Return': 0.01})
+    write_partitioned(dataset, f"{GOLD}/baseline_dataset.parquet", date_col='Date')
+    write_partitioned(trades, f"{GOLD}/baseline_trades.parquet", date_col='Entry_Date')
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/api/v1/gold/dataset", "/api/v1/gold/trades",
+                                  "/api/v1/results/equity", "/api/v1/results/trades"])
+def test_bad_dates_are_rejected(client, path):
+    params = {"ticker": "ABC", "strategy": "baseline"}
+    assert client.get(path, params={**params, "start": "garbage"}).status_code == 400
+    assert client.get(path, params={**params, "end": "2024-13-40"}).status_code == 400
+    assert client.get(path, params={**params, "start": "2024-02-01", "end": "2024-01-01"}).status_code == 400
+    assert client.get(path, params={**params, "start": "2024-01-10", "end": "2024-01-20"}).status_code == 200
+
+
+def test_date_range_slices_stored_results(client):
+    params = {"ticker": "ABC", "strategy": "baseline", "start": "2024-01-10", "end": "2024-01-20"}
+    equity = client.get("/api/v1/results/equity", params=params).json()
+    assert [row["Date"][:10] for row in (equity[0], equity[-1])] == ["2024-01-10", "2024-01-19"]
+
+    trades = client.get("/api/v1/results/trades", params=params).json()
+    assert trades["total"] == 1 and trades["trades"][0]["Entry_Date"][:10] == "2024-01-15"
+
+
+
+@pytest.mark.parametrize("path", ["/api/v1/jobs/does-not-exist", "/api/v1/jobs/does-not-exist/result"])
+def test_unknown_job_is_404(client, path):
+    assert client.get(path).status_code == 404
@@ -0,0 +1,94 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.pipeline.coordination import single_flight, ticker_lock
+
+
+def _run_followers(key, fn, n_followers):
+    """Starts a leader on key, lets n_followers join while it runs, then releases it."""
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def leader_fn():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=n_followers + 1) as pool:
+        leader = pool.submit(single_flight, key, leader_fn)
+        assert started.wait(5)
+        followers = [pool.submit(single_flight, key, leader_fn) for _ in range(n_followers)]
+        time.sleep(0.1)                     # Followers reach the in-flight wait
+        release.set()
+        futures = [leader] + followers
+        outcomes = [f.exception() or f.result() for f in futures]
+    return calls, outcomes
+
+
+def test_single_flight_collapses_concurrent_callers():
+    result = {"rows": 123}
+    calls, outcomes = _run_followers(("compare", "SYN"), lambda: result, n_followers=5)
+    assert len(calls) == 1
+    assert all(outcome is result for outcome in outcomes)
+
+
+def test_single_flight_shares_the_exception():
+    def boom():
+        raise ValueError("no silver data")
+
+    calls, outcomes = _run_followers(("compare", "SYN"), boom, n_followers=3)
+    assert len(calls) == 1
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+
+
+def test_single_flight_runs_again_once_finished():
+    calls = []
+    for _ in range(3):
+        assert single_flight(("compare", "SYN"), lambda: calls.append(1) or len(calls)) == len(calls)
+    assert len(calls) == 3
+
+    with pytest.raises(ValueError):
+        single_flight(("compare", "SYN"), lambda: int("x"))
+    assert single_flight(("compare", "SYN"), lambda: "recovered") == "recovered"
+
+
+def test_ticker_lock_serializes_writers():
+    active, overlaps, order = [0], [], []
+    guard = threading.Lock()
+
+    def writer(i):
+        with ticker_lock("syn", "daily"):           # Same ticker regardless of case
+            with guard:
+                active[0] += 1
+                overlaps.append(active[0])
+            order.append(("enter", i))
+            time.sleep(0.02)
+            order.append(("exit", i))
+            with guard:
+                active[0] -= 1
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(writer, range(8)))
+
+    assert max(overlaps) == 1
+    for enter, exit_ in zip(order[::2], order[1::2]):
+        assert enter[0] == "enter" and exit_ == ("exit", enter[1])
+
+
+def test_ticker_lock_is_per_ticker_and_reentrant():
+    acquired = threading.Event()
+
+    def other_ticker():
+        with ticker_lock("ABC", "daily"):
+            acquired.set()
+
+    with ticker_lock("SYN", "daily"):
+        with ticker_lock("SYN", "daily"):           # Re-entrant within the same thread
+            thread = threading.Thread(target=other_ticker)
+            thread.start()
+            assert acquired.wait(5)
+            thread.join()
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.pipeline.engine_backtest import extract_trade_log, run_all_strategies, run_strategy, write_gold
+from backend.trading_strategy.registry import STRATEGIES
+from backend.utils import lake_read_parquet
+
+
+def _loop_trade_log(df):
+    """The original per-trade loop extract_trade_log replaced."""
+    pos = df['Position'].fillna(0)
+    changes = pos.diff()
+    entries = df[changes == 1].index
+    exits = df[changes == -1].index
+    if len(entries) > len(exits):
+        exits = exits.append(pd.Index([df.index[-1]]))
+
+    ledger = []
+    for entry_date, exit_date in zip(entries, exits):
+        trade_returns = df.loc[entry_date:exit_date, 'Strategy_Return']
+        ledger.append({
+            'Entry_Date': entry_date,
+            'Exit_Date': exit_date,
+            'Trading_Days': df.index.get_loc(exit_date) - df.index.get_loc(entry_date),
+            'Calendar_Days': (exit_date - entry_date).days,
+            'Return': (1 + trade_returns).prod() - 1,
+        })
+    return pd.DataFrame(ledger)
+
+
+def _backtest_frame(positions, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2021-01-01", periods=len(positions))
+    returns = rng.normal(0, 0.01, len(positions))
+    return pd.DataFrame({'Position': positions, 'Strategy_Return': returns * np.nan_to_num(positions)}, index=index)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_trade_log_matches_the_loop(seed):
+    rng = np.random.default_rng(seed)
+    positions = (rng.random(500) < 0.4).astype(float)
+    positions[rng.random(500) < 0.02] = np.nan
+    positions[-3:] = 1.0                 # Open on the last bar: force-closed
+    df = _backtest_frame(positions, seed)
+
+    result = extract_trade_log(df)
+    expected = _loop_trade_log(df)
+    assert len(result) > 10
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False, check_exact=False, rtol=1e-12)
+
+
+def test_open_on_the_first_bar_and_no_trades():
+    # An initial long position is not an entry transition, as in the loop
+    df = _backtest_frame(np.array([1, 1, 0, 0, 1, 1, 0], dtype=float))
+    pd.testing.assert_frame_equal(extract_trade_log(df), _loop_trade_log(df), check_dtype=False)
+
+    assert extract_trade_log(_backtest_frame(np.zeros(20))).empty
+
+
+# ── All strategies on one silver read ─────────────────────────────────────────
+
+def test_run_all_strategies_reads_silver_once(silver, engine_lake):
+    reads = []
+
+    def counting_reader(path, start_date=None, end_date=None, columns=None):
+        reads.append(path)
+        return lake_read_parquet(path, start_date=start_date, end_date=end_date, columns=columns)
+
+    results, summaries = run_all_strategies("SYN", max_workers=3, reader=counting_reader)
+    assert len(reads) == 1
+    assert list(results) == list(STRATEGIES)
+
+    # Same metrics as running each strategy on its own read
+    features_df = lake_read_parquet("../../data/silver/SYN/daily/data.parquet", start_date="2020-01-01")
+    for name, metrics in summaries.items():
+        _, expected, _ = run_strategy(features_df, name, "SYN")
+        assert {k: v for k, v in metrics.items() if k != "Simulation_Date"} == \
+               pytest.approx({k: v for k, v in expected.items() if k != "Simulation_Date"})
+        assert (engine_lake / f"gold/SYN/daily/{name}/{name}_dataset.parquet").exists()
+
+
+def test_write_gold_removes_a_stale_trade_ledger(silver, engine_lake):
+    df, metrics, trades_df = run_strategy(silver, "baseline", "SYN")
+    assert not trades_df.empty
+    write_gold(df, trades_df, metrics, "SYN", "daily", "baseline")
+    trades_path = engine_lake / "gold/SYN/daily/baseline/baseline_trades.parquet"
+    assert trades_path.exists()
+
+    # A later run without trades must not leave the previous run's ledger behind
+    write_gold(df, pd.DataFrame(), None, "SYN", "daily", "baseline")
+    assert not trades_path.exists()
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.pipeline.engine_backtest import compute_insights
+from backend.pipeline.engine_sweep import expand_grid, sweep_strategy
+from backend.trading_strategy.baseline import generate_signals_baseline
+
+GRID = {"rsi_lower": [20, 30, 35, 40], "rsi_upper": [55, 65, 75]}
+
+
+def _backtest(features_df, rsi_lower, rsi_upper):
+    """The per-parameter path: strategy function + compute_insights."""
+    df = generate_signals_baseline(features_df, rsi_lower=rsi_lower, rsi_upper=rsi_upper)
+    metrics, _ = compute_insights(df, "SYN")
+    return metrics
+
+
+def test_expand_grid_is_the_cartesian_product():
+    params = expand_grid(GRID)
+    assert len(params) == 12 and list(params.columns) == ["rsi_lower", "rsi_upper"]
+    assert not params.duplicated().any()
+
+
+def test_sweep_matches_a_loop_over_backtests(silver):
+    results = sweep_strategy("SYN", grid=GRID, chunk_size=5, max_workers=2)
+    assert len(results) == 12
+    assert results['Sharpe_Ratio'].is_monotonic_decreasing
+
+    features_df = silver[["Adj Close", "RSI"]]
+    for row in results.itertuples():
+        metrics = _backtest(features_df, row.rsi_lower, row.rsi_upper)
+        assert metrics is not None
+        assert row.Total_Trades == metrics['Total_Trades_Taken']
+        for metric in ('Strategy_Return', 'Sharpe_Ratio', 'Max_Drawdown'):
+            assert getattr(row, metric) == pytest.approx(metrics[metric], rel=1e-9, abs=1e-12)
+
+
+def test_unknown_sweep_is_rejected(silver):
+    with pytest.raises(ValueError, match="No sweep defined"):
+        sweep_strategy("SYN", strategy_name="tier_1")
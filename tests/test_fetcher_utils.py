@@ -0,0 +1,51 @@
+import os
+import pandas as pd
+
+from backend.data_processor.fetcher_utils import (
+    count_rows, get_fetch_range, last_recorded_date, partition_files, read_partitioned, upsert_parquet,
+    write_partitioned,
+)
+
+
+def _bars(start, periods, value=1.0):
+    dates = pd.bdate_range(start, periods=periods)
+    return pd.DataFrame({'Date': dates, 'Close': value})
+
+
+def test_write_and_upsert_round_trip(tmp_path):
+    path = str(tmp_path / "data.parquet")
+    write_partitioned(_bars("2022-11-01", 100), path, date_col='Date')
+    assert [os.path.basename(f) for f in partition_files(path)] == ["2022.parquet", "2023.parquet"]
+
+    # Overlapping delta: old dates are replaced, new ones appended, 2022 is not rewritten
+    untouched = os.stat(partition_files(path)[0]).st_mtime_ns
+    total = upsert_parquet(_bars("2023-03-01", 60, value=2.0), path, date_col='Date')
+
+    stored = read_partitioned(path)
+    expected = pd.concat([_bars("2022-11-01", 100), _bars("2023-03-01", 60, value=2.0)])
+    expected = expected.drop_duplicates(subset=['Date'], keep='last').reset_index(drop=True)
+    pd.testing.assert_frame_equal(stored, expected, check_dtype=False)
+    assert total == count_rows(path) == len(expected)
+    assert os.stat(partition_files(path)[0]).st_mtime_ns == untouched
+    assert last_recorded_date(path, 'Date') == expected['Date'].max()
+
+
+def test_legacy_single_file_is_readable_and_migrated(tmp_path):
+    path = str(tmp_path / "data.parquet")
+    _bars("2023-12-01", 30).to_parquet(path, index=False)
+    assert partition_files(path) == [path]
+    assert len(read_partitioned(path)) == 30
+    assert last_recorded_date(path, 'Date') == pd.bdate_range("2023-12-01", periods=30)[-1]
+
+    upsert_parquet(_bars("2024-01-15", 5, value=3.0), path, date_col='Date')
+    assert os.path.isdir(path)
+    assert [os.path.basename(f) for f in partition_files(path)] == ["2023.parquet", "2024.parquet"]
+    assert count_rows(path) == 30 + 5
+
+
+def test_fetch_range_starts_after_the_last_stored_date(tmp_path):
+    path = str(tmp_path / "data.parquet")
+    assert get_fetch_range(path, 'Date', default_start="2020-01-01") == ("2020-01-01", False)
+
+    write_partitioned(_bars("2023-01-02", 10), path, date_col='Date')
+    assert get_fetch_range(path, 'Date') == ("2023-01-14", False)    # Fri 2023-01-13 + 1 day
@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend import frame_cache
+from backend.data_processor.fetcher_utils import upsert_parquet, write_partitioned
+from backend.frame_cache import cache_stats, invalidate, read_frame
+from backend.utils import lake_read_parquet
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    invalidate()
+    for counter in ('hits', 'misses', 'evictions', 'invalidations'):
+        frame_cache._stats[counter] = 0
+    yield
+    invalidate()
+
+
+def _table(tmp_path, name, start="2023-06-01", periods=200, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({'Date': pd.bdate_range(start, periods=periods),
+                       'Adj Close': 100 + rng.normal(0, 1, periods).cumsum(),
+                       'RSI': rng.uniform(0, 100, periods)})
+    path = str(tmp_path / name / "data.parquet")
+    write_partitioned(df, path, date_col='Date')
+    return path
+
+
+def _counts():
+    stats = cache_stats()
+    return stats['hits'], stats['misses']
+
+
+def test_slices_match_the_lake_reader(tmp_path):
+    path = _table(tmp_path, "SYN")
+    for kwargs in ({}, {'start_date': "2023-09-01"}, {'end_date': "2024-01-15"},
+                   {'start_date': "2023-12-20", 'end_date': "2024-01-10", 'columns': ['Date', 'RSI']}):
+        pd.testing.assert_frame_equal(read_frame(path, **kwargs), lake_read_parquet(path, **kwargs))
+    assert _counts() == (3, 1)                      # One decode serves every slice
+
+
+def test_returned_frames_do_not_alias_the_cache(tmp_path):
+    path = _table(tmp_path, "SYN")
+    frame = read_frame(path)
+    frame['RSI'] = -1.0
+    assert (read_frame(path)['RSI'] >= 0).all()
+
+
+def test_rewritten_partition_is_decoded_again(tmp_path):
+    path = _table(tmp_path, "SYN")
+    before = read_frame(path)
+
+    # Pipeline run: rewrite the newest partition with an extra day
+    extra = pd.DataFrame({'Date': [before.index[-1] + pd.offsets.BDay()], 'Adj Close': [123.0], 'RSI': [50.0]})
+    upsert_parquet(extra, path, date_col='Date')
+
+    after = read_frame(path)
+    assert len(after) == len(before) + 1
+    assert after['Adj Close'].iloc[-1] == 123.0
+    assert _counts() == (0, 2)
+    assert cache_stats()['invalidations'] == 1
+
+
+def test_new_partition_is_decoded_again(tmp_path):
+    path = _table(tmp_path, "SYN", start="2023-01-02", periods=100)
+    read_frame(path)
+    upsert_parquet(pd.DataFrame({'Date': [pd.Timestamp("2024-01-02")], 'Adj Close': [1.0], 'RSI': [1.0]}),
+                   path, date_col='Date')
+    assert read_frame(path).index[-1] == pd.Timestamp("2024-01-02")
+    assert _counts() == (0, 2)
+
+
+def test_least_recently_used_table_is_evicted(tmp_path, monkeypatch):
+    paths = {name: _table(tmp_path, name, seed=i) for i, name in enumerate("ABC")}
+    read_frame(paths["A"])
+    one_table = cache_stats()['bytes']
+    monkeypatch.setattr(frame_cache, "FRAME_CACHE_MAX_BYTES", 2 * one_table)
+
+    read_frame(paths["B"])
+    read_frame(paths["A"])                          # A is now the most recently used
+    read_frame(paths["C"])                          # Over budget: B goes
+    assert list(frame_cache._entries) == [paths["A"], paths["C"]]
+    assert cache_stats()['evictions'] == 1
+    assert cache_stats()['bytes'] == 2 * one_table
+
+    read_frame(paths["A"])
+    read_frame(paths["B"])
+    assert _counts() == (2, 4)                      # A still cached, B decoded again
+
+
+def test_table_over_budget_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(frame_cache, "FRAME_CACHE_MAX_BYTES", 1024)
+    path = _table(tmp_path, "SYN")
+    pd.testing.assert_frame_equal(read_frame(path), lake_read_parquet(path))
+    assert cache_stats()['entries'] == 0 and cache_stats()['bytes'] == 0
+
+
+def test_invalidate_one_or_all(tmp_path):
+    paths = [_table(tmp_path, name) for name in "AB"]
+    for path in paths:
+        read_frame(path)
+
+    invalidate(paths[0])
+    invalidate(str(tmp_path / "unknown" / "data.parquet"))      # Not cached: a no-op
+    assert list(frame_cache._entries) == [paths[1]]
+    read_frame(paths[0])
+    assert _counts() == (0, 3)
+
+    invalidate()
+    stats = cache_stats()
+    assert stats['entries'] == 0 and stats['bytes'] == 0 and stats['invalidations'] == 3
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.data_processor.indicators import (
+    INDICATORS, apply_indicators, calculate_ema, calculate_macd, calculate_rsi, calculate_sma,
+    compute_indicator_block, init_indicator_state, advance_indicators,
+)
+
+
+def _closes(n=400, gaps=(), seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.01, n))
+    for start, stop in gaps:
+        close[start:stop] = np.nan
+    return pd.DataFrame({'Adj Close': close}, index=pd.RangeIndex(1000, 1000 + n))
+
+
+def _reference(df):
+    """The per-indicator pandas functions, one registry entry at a time."""
+    df = df.copy()
+    for fn, params in INDICATORS.values():
+        df = fn(df, **params)
+    return df
+
+
+GAPS = {
+    "no gaps":      (),
+    "single bars":  ((60, 61), (200, 201)),
+    "runs":         ((90, 97), (250, 262)),
+    "leading":      ((0, 5), (120, 121)),
+    "trailing":     ((395, 400),),
+}
+
+
+@pytest.mark.parametrize("gaps", GAPS.values(), ids=GAPS.keys())
+def test_apply_indicators_matches_pandas(gaps):
+    df = _closes(gaps=gaps)
+    computed = apply_indicators(df.copy())
+    pd.testing.assert_frame_equal(computed, _reference(df)[computed.columns], check_exact=False, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize("gaps", GAPS.values(), ids=GAPS.keys())
+def test_block_families_match_pandas(gaps):
+    df = _closes(gaps=gaps)
+    block = compute_indicator_block(df['Adj Close'], sma_windows=range(5, 60, 7), ema_spans=(9, 50),
+                                    rsi_periods=(7, 14, 30), macd_params=((8, 21, 5),))
+
+    for window in range(5, 60, 7):
+        expected = calculate_sma(df.copy(), period=window)[f'SMA_{window}']
+        np.testing.assert_allclose(block[f'SMA_{window}'], expected, rtol=1e-9, atol=1e-9)
+    for span in (9, 50):
+        expected = calculate_ema(df.copy(), period=span)[f'EMA_{span}']
+        np.testing.assert_allclose(block[f'EMA_{span}'], expected, rtol=1e-9, atol=1e-9)
+    for period in (7, 14, 30):
+        expected = calculate_rsi(df.copy(), period=period)['RSI']
+        np.testing.assert_allclose(block[f'RSI_{period}'], expected, rtol=1e-9, atol=1e-9)
+
+    expected = calculate_macd(df.copy(), fast=8, slow=21, signal=5)
+    for suffix in ("", "_Signal", "_Hist"):
+        np.testing.assert_allclose(block[f'MACD_8_21_5{suffix}'], expected[f'MACD{suffix}'], rtol=1e-9, atol=1e-9)
+
+
+def test_a_gap_only_blanks_the_windows_it_touches():
+    df = _closes(gaps=((100, 101),))
+    sma = apply_indicators(df.copy(), names=["SMA_20"])['SMA_20'].to_numpy()
+    assert np.isnan(sma[100:120]).all()
+    assert np.isfinite(sma[120:]).all()             # The series recovers after the window passes
+
+
+@pytest.mark.parametrize("split", [150, 250, 255, 262, 300])
+def test_streaming_matches_batch_across_gaps(split):
+    # Splits before, inside, at the end of, and after a run of missing closes
+    df = _closes(gaps=((60, 61), (250, 262))).reset_index(drop=True)
+    state = init_indicator_state(df.iloc[:split])
+    advanced, _ = advance_indicators(df.iloc[split:], state)
+
+    expected = _reference(df).iloc[split:]
+    pd.testing.assert_frame_equal(advanced, expected[advanced.columns], check_exact=False, rtol=1e-9, atol=1e-9)
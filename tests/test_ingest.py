@@ -0,0 +1,177 @@
+import threading
+import time
+import pandas as pd
+import pytest
+
+from backend.data_processor import news_fetcher
+from backend.data_processor.fetcher_utils import get_fetch_range, read_partitioned, upsert_parquet
+from backend.data_processor.news_fetcher import ingest_news, NewsIngestError, NEWS_PAGE_SIZE, _date_windows
+from backend.data_processor.sentiment import TokenBucket
+from backend.pipeline.bronze_pipeline import update_bronze_prices_bulk
+
+
+def _prices(ticker, start, periods):
+    dates = pd.bdate_range(start, periods=periods)
+    return pd.DataFrame({
+        'Date': dates, 'Ticker': ticker,
+        'Open': 1.0, 'High': 1.0, 'Low': 1.0, 'Close': 1.0, 'Adj Close': 1.0, 'Volume': 100,
+    })
+
+
+# ── Bulk prices ───────────────────────────────────────────────────────────────
+
+def test_bulk_prices_groups_by_fetch_start_and_batches(lake):
+    # One ticker already has history, so it needs a later start than the rest
+    upsert_parquet(_prices("OLD", "2024-01-01", 5), "../../../data/bronze/OLD/daily/data.parquet", date_col='Date')
+
+    calls = []
+    lock = threading.Lock()
+
+    def fake_fetch(tickers, start_date):
+        with lock:
+            calls.append((start_date, sorted(tickers)))
+        return {ticker: _prices(ticker, start_date, 3) for ticker in tickers if ticker != "MISSING"}
+
+    tickers = ["A", "B", "C", "OLD", "MISSING"]
+    updated = update_bronze_prices_bulk(tickers, default_start="2024-01-01", batch_size=2,
+                                        max_workers=3, fetch_fn=fake_fetch)
+
+    assert sorted(updated) == ["A", "B", "C", "OLD"]
+    by_start = {}
+    for start_date, batch in calls:
+        assert len(batch) <= 2
+        by_start.setdefault(start_date, []).extend(batch)
+    assert sorted(by_start["2024-01-01"]) == ["A", "B", "C", "MISSING"]
+    assert by_start["2024-01-06"] == ["OLD"]   # Day after its last stored bar (Fri 2024-01-05)
+
+    old = read_partitioned(str(lake / "bronze/OLD/daily/data.parquet"))
+    assert len(old) == 8 and old['Date'].is_monotonic_increasing
+
+
+def test_bulk_prices_survives_a_failing_batch(lake):
+    def fake_fetch(tickers, start_date):
+        if "BAD" in tickers:
+            raise RuntimeError("network down")
+        return {ticker: _prices(ticker, start_date, 2) for ticker in tickers}
+
+    updated = update_bronze_prices_bulk(["GOOD", "BAD"], default_start="2024-01-01", batch_size=1,
+                                        max_workers=2, fetch_fn=fake_fetch)
+    assert updated == ["GOOD"]
+
+
+# ── News ──────────────────────────────────────────────────────────────────────
+
+class FakeNewsClient:
+    """Serves `per_day` articles for every calendar day, NEWS_PAGE_SIZE per page, with page tokens."""
+
+    def __init__(self, per_day):
+        self.per_day = per_day
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def get(self, path, params):
+        with self._lock:
+            self.requests += 1
+        days = pd.date_range(params['start'][:10], params['end'][:10], inclusive='left')
+        articles = [
+            {'id': f"{day:%Y%m%d}-{k}", 'headline': f"headline {day:%Y-%m-%d} {k}", 'summary': '',
+             'created_at': f"{day:%Y-%m-%d}T12:00:{k:02d}Z"}
+            for day in days for k in range(self.per_day)
+        ]
+        offset = int(params.get('page_token') or 0)
+        page = articles[offset:offset + params['limit']]
+        next_token = str(offset + params['limit']) if offset + params['limit'] < len(articles) else None
+        return {'news': page, 'next_page_token': next_token}
+
+
+def test_ingest_news_follows_pages_across_windows(lake):
+    client = FakeNewsClient(per_day=30)
+    fetched = ingest_news("NEWS", "daily", "2024-01-01", "2024-04-01", window_days=20, max_workers=3, client=client)
+
+    expected = 91 * 30    # Windows are half-open [start, end), 2024-01-01 .. 2024-03-31
+    assert fetched == expected > 2000                       # No truncation at the old single-request limit
+    assert client.requests >= expected // NEWS_PAGE_SIZE    # Every page was followed
+
+    stored = read_partitioned(str(lake / "bronze/NEWS/daily/news.parquet"))
+    assert len(stored) == expected
+    assert stored['id'].is_unique
+
+
+class FailingWindowClient(FakeNewsClient):
+    """Raises for every request inside one window."""
+
+    def __init__(self, per_day, fail_start):
+        super().__init__(per_day)
+        self.fail_start = fail_start
+
+    def get(self, path, params):
+        if params['start'][:10] == self.fail_start:
+            raise ConnectionError("news API unavailable")
+        return super().get(path, params)
+
+
+def test_failed_window_is_refetched_on_the_next_run(lake):
+    news_path = str(lake / "bronze/NEWS/daily/news.parquet")
+    failing = FailingWindowClient(per_day=5, fail_start="2024-01-21")
+    with pytest.raises(NewsIngestError):
+        ingest_news("NEWS", "daily", "2024-01-01", "2024-04-01", window_days=20, max_workers=3, client=failing)
+
+    # Later windows were stored, but the table is rolled back to the failed window
+    fetch_start, _ = get_fetch_range(news_path, date_col='created_at')
+    assert fetch_start <= "2024-01-21"
+
+    retried = FakeNewsClient(per_day=5)
+    ingest_news("NEWS", "daily", fetch_start, "2024-04-01", window_days=20, max_workers=3, client=retried)
+    assert len(read_partitioned(news_path)) == 91 * 5
+
+
+def test_failed_store_cancels_producers(lake, monkeypatch):
+    monkeypatch.setattr(news_fetcher, "NEWS_FLUSH_ROWS", 50)
+    monkeypatch.setattr(news_fetcher, "NEWS_QUEUE_POLL_SECONDS", 0.01)
+
+    def broken_store(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(news_fetcher, "store_news", broken_store)
+
+    # Far more pages than the queue holds: producers must not block once the writer gives up
+    client = FakeNewsClient(per_day=30)
+    start = time.monotonic()
+    with pytest.raises(NewsIngestError):
+        ingest_news("NEWS", "daily", "2024-01-01", "2024-04-01", window_days=10, max_workers=2, client=client)
+    assert time.monotonic() - start < 10
+
+
+def test_date_windows_are_contiguous():
+    windows = _date_windows("2024-01-01", "2024-03-15", 30)
+    assert windows[0][0] == "2024-01-01" and windows[-1][1] == "2024-03-15"
+    assert all(a[1] == b[0] for a, b in zip(windows, windows[1:]))
+    assert _date_windows("2024-02-01", "2024-01-01", 30) == []
+
+
+# ── Rate limiter ──────────────────────────────────────────────────────────────
+
+def test_token_bucket_caps_the_long_run_rate():
+    bucket = TokenBucket(rate=50, capacity=1)
+    start = time.monotonic()
+    threads = [threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 20 tokens, 1 available up front, refilled at 50/s => at least 19 / 50 s
+    assert time.monotonic() - start >= 19 / 50 * 0.95
+
+
+def test_token_bucket_allows_an_initial_burst():
+    bucket = TokenBucket(rate=1, capacity=5)
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    assert time.monotonic() - start < 0.5
+
+
+@pytest.mark.parametrize("rate, capacity", [(0, None), (-5, None), (float("nan"), None), (10, 0.5)])
+def test_token_bucket_rejects_invalid_settings(rate, capacity):
+    with pytest.raises(ValueError):
+        TokenBucket(rate=rate, capacity=capacity)
@@ -0,0 +1,74 @@
+import threading
+import time
+
+import pytest
+
+from backend import jobs
+from backend.jobs import JobQueueFull, get_job, get_job_result, submit_job
+
+
+def _wait_until_finished(job_id, timeout=5):
+    for _ in range(int(timeout / 0.01)):
+        job = get_job(job_id)
+        if job['finished_at'] is not None:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish within {timeout}s")
+
+
+def test_job_moves_from_queued_to_running_to_succeeded(monkeypatch):
+    # One worker: the second job waits in the queue while the first is held open
+    monkeypatch.setattr(jobs, "_pool", jobs.ThreadPoolExecutor(max_workers=1))
+    started, release = threading.Event(), threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait(5)
+        return {"answer": 42}
+
+    first = submit_job("backtest", blocking, {"ticker": "SYN"})
+    second = submit_job("backtest", lambda: "done")
+    assert started.wait(5)
+
+    assert get_job(first)['status'] == 'running'
+    assert get_job(second)['status'] == 'queued'
+    assert get_job_result(first) == (get_job(first), None)      # No result while running
+
+    release.set()
+    job = _wait_until_finished(first)
+    assert job['status'] == 'succeeded'
+    assert job['params'] == {"ticker": "SYN"}
+    assert job['started_at'] is not None and job['error'] is None
+    assert 'result' not in job
+    assert get_job_result(first)[1] == {"answer": 42}
+    assert _wait_until_finished(second)['status'] == 'succeeded'
+
+
+def test_failed_job_records_the_error():
+    def boom():
+        raise ValueError("no silver data")
+
+    job = _wait_until_finished(submit_job("backtest", boom))
+    assert job['status'] == 'failed'
+    assert job['error'] == "no silver data"
+    assert get_job_result(job['job_id'])[1] is None
+
+
+def test_unknown_job_is_none():
+    assert get_job("does-not-exist") is None
+    assert get_job_result("does-not-exist") == (None, None)
+
+
+def test_full_queue_rejects_new_jobs(monkeypatch):
+    monkeypatch.setattr(jobs, "_pool", jobs.ThreadPoolExecutor(max_workers=1))
+    monkeypatch.setattr(jobs, "JOB_MAX_PENDING", 1)
+    release = threading.Event()
+
+    running = submit_job("backtest", lambda: release.wait(5))
+    queued = submit_job("backtest", lambda: None)
+    with pytest.raises(JobQueueFull):
+        submit_job("backtest", lambda: None)
+
+    release.set()
+    _wait_until_finished(running)
+    _wait_until_finished(queued)
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.trading_strategy import kernel
+from backend.trading_strategy.kernel import run_bracket_kernel
+from backend.trading_strategy.tier1 import generate_signals_tier1
+
+needs_numba = pytest.mark.skipif(kernel.njit is None, reason="numba is not installed")
+
+SCENARIOS = {
+    "frequent brackets":   dict(p_entry=0.5, take_profit=0.01, stop_loss=0.01),
+    "rare wide brackets":  dict(p_entry=0.02, take_profit=0.2, stop_loss=0.2, trailing_stop=0.1),
+    "trailing only":       dict(p_entry=0.1, trailing_stop=0.03),
+    "exit signals only":   dict(p_entry=0.1, p_exit=0.05),
+    "every rule":          dict(p_entry=0.2, p_exit=0.02, take_profit=0.05, stop_loss=0.03, trailing_stop=0.04),
+}
+
+
+def _inputs(n=3000, p_entry=0.1, p_exit=0.0, seed=0, **rules):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.01, n))
+    active = rng.random(n) > 0.05       # Scattered inactive bars
+    active[:20] = False                 # Warmup
+    return dict(close=close, entry_signal=rng.random(n) < p_entry, exit_signal=rng.random(n) < p_exit,
+                active=active, **rules)
+
+
+def _reference(close, entry_signal, exit_signal, active, take_profit=None, stop_loss=None, trailing_stop=None):
+    """The uncompiled bar-by-bar loop."""
+    params = tuple(np.nan if value is None else value for value in (take_profit, stop_loss, trailing_stop))
+    return kernel._bracket_loop(close, entry_signal, exit_signal, active, *params)
+
+
+@pytest.mark.parametrize("backend", ["numpy", pytest.param("numba", marks=needs_numba)])
+@pytest.mark.parametrize("scenario", SCENARIOS.values(), ids=SCENARIOS.keys())
+def test_backends_match_the_reference_loop(scenario, backend):
+    inputs = _inputs(**scenario)
+    positions, returns = run_bracket_kernel(**inputs, backend=backend)
+    expected_positions, expected_returns = _reference(**inputs)
+
+    assert positions.sum() > 0
+    np.testing.assert_array_equal(positions, expected_positions)
+    np.testing.assert_allclose(returns, expected_returns, rtol=1e-12, atol=1e-15)
+
+
+@needs_numba
+def test_tier1_is_the_same_on_both_backends(monkeypatch):
+    rng = np.random.default_rng(1)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.015, 2000))
+    df = pd.DataFrame({'Adj Close': close}, index=pd.bdate_range("2018-01-01", periods=len(close)))
+    delta = df['Adj Close'].diff()
+    gain = delta.where(delta > 0, 0).rolling(22).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(22).mean()
+    df['RSI'] = 100 - 100 / (1 + gain / loss)
+
+    results = {}
+    for backend in ("numba", "numpy"):
+        monkeypatch.setattr(kernel, "KERNEL_BACKEND", backend)
+        results[backend] = generate_signals_tier1(df)
+
+    assert results["numba"]['Position'].sum() > 0
+    pd.testing.assert_frame_equal(results["numpy"], results["numba"], check_exact=False, rtol=1e-12)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown kernel backend"):
+        run_bracket_kernel([1.0, 2.0], [True, True], backend="gpu")
@@ -0,0 +1,28 @@
+import numpy as np
+
+from backend.pipeline.metrics import equity_curves, scorecard
+from backend.pipeline.monte_carlo import monte_carlo_returns
+
+
+def test_scorecard_matches_the_equity_curves():
+    rng = np.random.default_rng(0)
+    returns = rng.normal(0.0005, 0.01, (500, 40))
+    returns[3, 2] = np.nan
+    returns[:, 5] = -0.001              # Never above the starting capital
+
+    equity, _, drawdown = equity_curves(returns)
+    card = scorecard(returns)
+    np.testing.assert_array_equal(card['Strategy_Return'], equity[-1] - 1)
+    np.testing.assert_array_equal(card['Max_Drawdown'], drawdown.min(axis=0))
+    assert scorecard(np.empty((0, 3)))['Max_Drawdown'].tolist() == [0.0, 0.0, 0.0]
+
+
+def test_monte_carlo_intervals_are_ordered_and_reproducible():
+    returns = np.random.default_rng(1).normal(0.0005, 0.01, 1300)
+    result = monte_carlo_returns(returns, n_paths=3000, seed=0)
+
+    assert result == monte_carlo_returns(returns, n_paths=3000, seed=0)
+    for metric in ('Strategy_Return', 'Sharpe_Ratio', 'Max_Drawdown'):
+        interval = result[metric]
+        assert interval['Lower'] <= interval['Median'] <= interval['Upper']
+    assert result['Max_Drawdown']['Upper'] <= 0
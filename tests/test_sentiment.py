@@ -0,0 +1,161 @@
+import json
+import os
+import re
+import threading
+import pandas as pd
+import pytest
+
+from backend.data_processor import sentiment
+from backend.data_processor.fetcher_utils import partition_files, upsert_parquet
+from backend.data_processor.sentiment import compute_sentiment_feature
+
+
+class FakeLLM:
+    """Local stand-in for the chat model: scores by keyword, optionally failing every request."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def invoke(self, prompt):
+        with self._lock:
+            self.calls += 1
+        if self.fail:
+            raise ConnectionError("LLM unavailable")
+
+        # Batched prompt: answer a JSON object of every date in it
+        dates = re.findall(r"Date: (\d{4}-\d{2}-\d{2})", prompt)
+        if dates:
+            return _Reply(json.dumps({date: 0.5 for date in dates}))
+        return _Reply("0.5")
+
+
+class _Reply:
+    def __init__(self, content):
+        self.content = content
+
+
+@pytest.fixture
+def news(lake, monkeypatch):
+    monkeypatch.setattr(sentiment, "LLM_BACKOFF_SECONDS", 0.0)
+    monkeypatch.setattr(sentiment, "LLM_MAX_RETRIES", 1)
+
+    days = pd.bdate_range("2024-01-01", periods=40)
+    news_df = pd.DataFrame({
+        'id': [str(k) for k in range(len(days))],
+        'Ticker': "SNT",
+        'Date': days,
+        'headline': [f"Headline for day {k}" for k in range(len(days))],
+        'summary': "",
+        'created_at': [f"{day:%Y-%m-%d}T12:00:00Z" for day in days],
+    })
+    upsert_parquet(news_df, "../../../data/bronze/SNT/daily/news.parquet", date_col='created_at')
+    return days
+
+
+CACHE = "../../../data/bronze/SNT/daily/sentiment_cache.parquet"
+
+
+def _score(llm, **options):
+    return compute_sentiment_feature("SNT", backend="llm", llm=llm, requests_per_second=1000, **options)
+
+
+def test_cache_hits_skip_the_llm(news):
+    llm = FakeLLM()
+    first = _score(llm)
+    assert llm.calls == len(news)
+    assert (first['Sentiment'] == 0.5).all()
+
+    rerun = FakeLLM()
+    pd.testing.assert_frame_equal(_score(rerun), first)
+    assert rerun.calls == 0
+
+
+def test_failed_scores_are_not_cached(news):
+    failing = FakeLLM(fail=True)
+    degraded = _score(failing)
+    assert (degraded['Sentiment'] == 0.0).all()      # Neutral default in the output frame only
+    assert len(degraded) == len(news)
+
+    working = FakeLLM()
+    recovered = _score(working)
+    assert working.calls == len(news)                # Every failed day is re-scored
+    assert (recovered['Sentiment'] == 0.5).all()
+
+
+def test_changed_headlines_are_rescored(news):
+    _score(FakeLLM())
+
+    extra = pd.DataFrame({'id': ["extra"], 'Ticker': "SNT", 'Date': [news[3]], 'headline': ["Breaking update"],
+                          'summary': "", 'created_at': [f"{news[3]:%Y-%m-%d}T15:00:00Z"]})
+    upsert_parquet(extra, "../../../data/bronze/SNT/daily/news.parquet", date_col='created_at')
+
+    llm = FakeLLM()
+    _score(llm)
+    assert llm.calls == 1
+
+
+def test_batched_prompts_match_single_day_scores(news):
+    llm = FakeLLM()
+    batched = _score(llm, batch_days=10)
+    assert llm.calls == len(news) // 10
+    assert (batched['Sentiment'] == 0.5).all()
+
+
+def test_unparseable_batch_falls_back_to_single_days(news):
+    class ProseBatchLLM(FakeLLM):
+        def invoke(self, prompt):
+            reply = super().invoke(prompt)
+            return _Reply("I cannot answer in JSON") if "Date:" in prompt else reply
+
+    llm = ProseBatchLLM()
+    scores = _score(llm, batch_days=10)
+    assert llm.calls == len(news) // 10 + len(news)
+    assert (scores['Sentiment'] == 0.5).all()
+
+
+def test_cache_flushes_append_parts(news, monkeypatch):
+    monkeypatch.setattr(sentiment, "CACHE_FLUSH_EVERY", 10)
+    _score(FakeLLM())
+    parts = partition_files(CACHE)
+    assert len(parts) == len(news) // 10        # One new part per flush
+    first_part = (parts[0], os.path.getmtime(parts[0]))
+
+    extra = pd.DataFrame({'id': ["extra"], 'Ticker': "SNT", 'Date': [news[3]], 'headline': ["Breaking update"],
+                          'summary': "", 'created_at': [f"{news[3]:%Y-%m-%d}T15:00:00Z"]})
+    upsert_parquet(extra, "../../../data/bronze/SNT/daily/news.parquet", date_col='created_at')
+    _score(FakeLLM())
+    assert len(partition_files(CACHE)) == len(parts) + 1
+    assert (parts[0], os.path.getmtime(parts[0])) == first_part    # Earlier parts are never rewritten
+
+
+def test_cache_compacts_and_migrates_legacy_file(news, monkeypatch):
+    first = _score(FakeLLM())
+
+    # Legacy single-file cache becomes the oldest part on the next flush
+    legacy = pd.concat([pd.read_parquet(part) for part in partition_files(CACHE)])
+    for part in partition_files(CACHE):
+        os.remove(part)
+    os.rmdir(CACHE)
+    legacy.to_parquet(CACHE, index=False)
+
+    extra = pd.DataFrame({'id': ["extra"], 'Ticker': "SNT", 'Date': [news[3]], 'headline': ["Breaking update"],
+                          'summary': "", 'created_at': [f"{news[3]:%Y-%m-%d}T15:00:00Z"]})
+    upsert_parquet(extra, "../../../data/bronze/SNT/daily/news.parquet", date_col='created_at')
+    llm = FakeLLM()
+    _score(llm)
+    assert llm.calls == 1 and len(partition_files(CACHE)) == 2
+
+    # Too many parts: the next load rewrites them as one, and still hits
+    monkeypatch.setattr(sentiment, "CACHE_MAX_PARTS", 1)
+    rerun = FakeLLM()
+    pd.testing.assert_frame_equal(_score(rerun), first)
+    assert rerun.calls == 0 and len(partition_files(CACHE)) == 1
+
+
+def test_parse_batch_scores_skips_bad_entries():
+    content = 'Sure:\n```json\n{"2024-01-01": 0.3, "2024-01-02": "n/a", "2024-01-03": -1}\n```'
+    assert sentiment._parse_batch_scores(content) == {"2024-01-01": 0.3, "2024-01-03": -1.0}
+    assert sentiment._parse_batch_scores("no json here") == {}
+    assert sentiment._parse_batch_scores(None) == {}
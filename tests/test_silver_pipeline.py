@@ -0,0 +1,70 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+
+from backend.data_processor.fetcher_utils import read_partitioned, upsert_parquet
+from backend.pipeline.silver_pipeline import update_silver_pipeline
+
+SILVER = "../../../data/silver/LEG/daily"
+
+
+def _write_bronze(n_bars=300, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2023-01-02", periods=n_bars)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.01, n_bars))
+    prices = pd.DataFrame({
+        'Date': dates, 'Ticker': "LEG",
+        'Open': close, 'High': close, 'Low': close, 'Close': close, 'Adj Close': close, 'Volume': 1000,
+    })
+    upsert_parquet(prices, "../../../data/bronze/LEG/daily/data.parquet", date_col='Date')
+
+    news_days = dates[::5]
+    news = pd.DataFrame({
+        'id': [str(k) for k in range(len(news_days))],
+        'Ticker': "LEG",
+        'Date': news_days,
+        'headline': ["Shares surge on record profit" if k % 2 else "Stock plunges after lawsuit"
+                     for k in range(len(news_days))],
+        'summary': "",
+        'created_at': [f"{day:%Y-%m-%d}T12:00:00Z" for day in news_days],
+    })
+    upsert_parquet(news, "../../../data/bronze/LEG/daily/news.parquet", date_col='created_at')
+
+
+def test_legacy_silver_without_manifest_upgrades_once(lake):
+    _write_bronze()
+    update_silver_pipeline("LEG", sentiment_backend="lexicon")
+
+    # Silver written before manifests existed: same columns (Sentiment included), no features.json
+    os.remove(f"{SILVER}/features.json")
+    os.remove(f"{SILVER}/indicator_state.json")
+    before = read_partitioned(f"{SILVER}/data.parquet")
+
+    update_silver_pipeline("LEG", sentiment_backend="lexicon")
+
+    with open(f"{SILVER}/features.json") as f:
+        manifest = json.load(f)
+    assert manifest["Sentiment"]["signature"] == "sentiment(backend=lexicon)"
+
+    # Indicators are kept as they were; Sentiment is re-scored into the same single column
+    after = read_partitioned(f"{SILVER}/data.parquet")
+    assert sorted(after.columns) == sorted(before.columns)
+    indicators = [col for col in before.columns if col != "Sentiment"]
+    pd.testing.assert_frame_equal(after[indicators], before[indicators])
+    assert after["Sentiment"].notna().all() and after["Sentiment"].abs().max() > 0
+
+    # The upgrade is persisted: the next run has nothing to backfill
+    update_silver_pipeline("LEG", sentiment_backend="lexicon")
+    pd.testing.assert_frame_equal(read_partitioned(f"{SILVER}/data.parquet")[before.columns], after[before.columns])
+
+
+def test_empty_silver_dir_is_rebuilt(lake):
+    # An interrupted first write can leave the table directory without partition files
+    _write_bronze()
+    os.makedirs(f"{SILVER}/data.parquet")
+
+    update_silver_pipeline("LEG", sentiment_backend="lexicon")
+
+    silver = read_partitioned(f"{SILVER}/data.parquet")
+    assert len(silver) > 0 and os.path.exists(f"{SILVER}/features.json")
@@ -0,0 +1,26 @@
+import os
+import time
+
+from backend.pipeline import universe
+
+
+def _fake_backtest(ticker, strategies, *settings):
+    """Stands in for the worker task: 'DIE' kills its worker process, everything else succeeds."""
+    if ticker == "DIE":
+        os._exit(1)
+    time.sleep(0.2)    # Keep tasks in flight when the pool breaks
+    return [{'Ticker': ticker, 'Strategy': name, 'Status': 'ok', 'Error': None} for name in strategies]
+
+
+def test_dead_worker_only_fails_its_own_ticker(monkeypatch):
+    # Workers are forked, so they inherit the patched task
+    monkeypatch.setattr(universe, "_backtest_ticker", _fake_backtest)
+    strategy = next(iter(universe.STRATEGIES))
+    tickers = ["DIE"] + [f"T{k}" for k in range(12)]
+
+    results = universe.run_universe(tickers, strategies=[strategy], max_workers=3)
+
+    assert sorted(results['Ticker']) == sorted(tickers)
+    errors = results[results['Status'] == 'error']
+    assert errors['Ticker'].tolist() == ["DIE"]
+    assert "Worker process died" in errors['Error'].iloc[0]
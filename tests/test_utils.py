@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.data_processor.fetcher_utils import write_partitioned
+from backend.utils import lake_read_parquet
+
+
+@pytest.fixture
+def table(tmp_path):
+    dates = pd.bdate_range("2022-06-01", "2024-06-30")
+    df = pd.DataFrame({'Date': dates, 'Close': np.arange(len(dates), dtype=float),
+                       'RSI': 50.0, 'SMA_20': 1.0})
+    path = str(tmp_path / "data.parquet")
+    write_partitioned(df, path, date_col='Date')
+    return path, df.set_index('Date')
+
+
+@pytest.mark.parametrize("start, end", [
+    (None, None), ("2023-03-15", None), (None, "2023-03-15"), ("2022-12-30", "2023-01-03"), ("2025-01-01", None),
+])
+def test_date_filter_matches_a_full_read(table, start, end):
+    path, full = table
+    expected = full
+    if start:
+        expected = expected[expected.index >= pd.to_datetime(start)]
+    if end:
+        expected = expected[expected.index <= pd.to_datetime(end)]
+
+    result = lake_read_parquet(path, start_date=start, end_date=end)
+    if expected.empty:
+        assert result.empty
+    else:
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+
+def test_column_projection_keeps_date_as_index(table):
+    path, full = table
+    result = lake_read_parquet(path, start_date="2024-01-01", columns=['RSI', 'Date', 'Close'])
+    assert list(result.columns) == ['RSI', 'Close']
+    assert isinstance(result.index, pd.DatetimeIndex) and result.index.min() >= pd.Timestamp("2024-01-01")
+    pd.testing.assert_frame_equal(result, full.loc["2024-01-01":, ['RSI', 'Close']], check_freq=False)
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from backend.pipeline.engine_backtest import compute_insights
+from backend.pipeline.engine_sweep import expand_grid
+from backend.pipeline.walk_forward import run_walk_forward, walk_forward_folds
+from backend.trading_strategy.baseline import generate_signals_baseline
+
+GRID = {"rsi_lower": [25, 35], "rsi_upper": [60, 70]}
+
+
+def _positions(df, params):
+    return generate_signals_baseline(df, **params)['Position'].to_numpy()
+
+
+def _in_sample_sharpe(df, params):
+    metrics, _ = compute_insights(generate_signals_baseline(df, **params), "SYN")
+    return 0.0 if metrics is None else metrics['Sharpe_Ratio']
+
+
+def test_folds_roll_by_the_out_of_sample_window():
+    folds = walk_forward_folds(300, in_sample_bars=200, out_of_sample_bars=40)
+    assert folds == [(0, 200, 240), (40, 240, 280), (80, 280, 300)]
+    assert walk_forward_folds(200, in_sample_bars=200, out_of_sample_bars=40) == []
+
+
+def test_walk_forward_matches_a_loop_over_backtests(silver):
+    folds_df, equity_df, summary = run_walk_forward("SYN", grid=GRID, start_date="2020-01-01",
+                                                    in_sample_bars=300, out_of_sample_bars=100)
+    df = silver[["Adj Close", "RSI"]]
+    folds = walk_forward_folds(len(df), 300, 100)
+    assert len(folds_df) == len(folds) == summary['Folds']
+
+    returns = df['Adj Close'].pct_change().fillna(0).to_numpy()
+    stitched = []
+    for fold, (is_start, is_end, oos_end) in zip(folds_df.itertuples(), folds):
+        # In-sample: best Sharpe over the grid, ties to the first parameter set
+        candidates = expand_grid(GRID).to_dict('records')
+        sharpes = [_in_sample_sharpe(df.iloc[is_start:is_end], params) for params in candidates]
+        best = candidates[int(np.argmax(sharpes))]
+        assert (fold.rsi_lower, fold.rsi_upper) == (best['rsi_lower'], best['rsi_upper'])
+        assert fold.IS_Sharpe_Ratio == pytest.approx(max(sharpes), rel=1e-9, abs=1e-12)
+
+        # Out-of-sample: positions carried over from the in-sample rows, cut to the fold
+        positions = _positions(df.iloc[is_start:oos_end], best)[is_end - is_start:]
+        stitched.append(returns[is_end:oos_end] * positions)
+
+    stitched = np.concatenate(stitched)
+    np.testing.assert_allclose(equity_df['Strategy_Return'].to_numpy(), stitched, rtol=1e-12, atol=1e-15)
+    assert summary['Strategy_Return'] == pytest.approx(np.prod(1 + stitched) - 1, rel=1e-9)